@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+"""
+Throughput of the compiled serializer (:mod:`bitsharesbase.serializer`)
+compared to the operation classes, throughput of the decoder and the size
+of the wire format compared to json.
+
+    python benchmarks/serializer.py [number]
+"""
+import json
+import sys
+import timeit
+
+from bitsharesbase.serializer import deserialize_transaction, serialize_transaction
+from bitsharesbase.signedtransactions import Signed_Transaction
+
+
+key = "BTS6pbVDAjRFiw6fkiKYCrkz7PFeL7XNAfefrsREwg8MKpJ9VYV9x"
+fee = {"amount": 100, "asset_id": "1.3.0"}
+permission = {"weight_threshold": 1, "account_auths": [], "key_auths": [[key, 1]]}
+
+operations = {
+    "transfer": [
+        0,
+        {
+            "fee": fee,
+            "from": "1.2.100",
+            "to": "1.2.101",
+            "amount": {"amount": 1000000, "asset_id": "1.3.121"},
+            "memo": {"from": key, "to": key, "nonce": 1, "message": "aa" * 32},
+            "extensions": [],
+        },
+    ],
+    "limit_order_create": [
+        1,
+        {
+            "fee": fee,
+            "seller": "1.2.100",
+            "amount_to_sell": {"amount": 100000, "asset_id": "1.3.0"},
+            "min_to_receive": {"amount": 10000, "asset_id": "1.3.121"},
+            "expiration": "2030-01-01T00:00:00",
+            "fill_or_kill": False,
+            "extensions": [],
+        },
+    ],
+    "account_create": [
+        5,
+        {
+            "fee": fee,
+            "registrar": "1.2.100",
+            "referrer": "1.2.100",
+            "referrer_percent": 0,
+            "name": "foobar-f124",
+            "owner": permission,
+            "active": permission,
+            "options": {
+                "memo_key": key,
+                "voting_account": "1.2.5",
+                "num_witness": 0,
+                "num_committee": 0,
+                "votes": ["1:0", "0:11"],
+                "extensions": [],
+            },
+            "extensions": {},
+        },
+    ],
+}
+
+
+def transaction(ops):
+    return {
+        "ref_block_num": 34294,
+        "ref_block_prefix": 3707022213,
+        "expiration": "2016-04-06T08:29:27",
+        "operations": ops,
+        "extensions": [],
+        "signatures": [],
+    }
+
+
+def main(number=2000):
+    for name, op in list(operations.items()) + [
+        ("100 orders", [operations["limit_order_create"]] * 100)
+    ]:
+        tx = transaction(op if name == "100 orders" else [op])
+        assert serialize_transaction(tx) == bytes(Signed_Transaction(**tx))
+        n = number // 100 if name == "100 orders" else number
+        classes = timeit.timeit(lambda: bytes(Signed_Transaction(**tx)), number=n)
+        compiled = timeit.timeit(lambda: serialize_transaction(tx), number=n)
+        data = serialize_transaction(tx)
+        decode = timeit.timeit(lambda: deserialize_transaction(data), number=n)
+        print(
+            "{:20} classes {:9.0f} tx/s  compiled {:9.0f} tx/s  ({:.1f}x)".format(
+                name, n / classes, n / compiled, classes / compiled
+            )
+        )
+        print(
+            "{:20} decode  {:9.0f} tx/s  {} bytes ({:.0%} of json)".format(
+                "",
+                n / decode,
+                len(data),
+                len(data) / len(json.dumps(tx, separators=(",", ":"))),
+            )
+        )
+
+
+if __name__ == "__main__":
+    main(*[int(x) for x in sys.argv[1:]])
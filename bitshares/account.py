@@ -1,5 +1,8 @@
 # -*- coding: utf-8 -*-
+from collections import OrderedDict
+
 from .amount import Amount
+from .blockchainobject import ChainScopedCaching, NegativeCaching
 from .instance import BlockchainInstance
 from graphenecommon.account import (
     Account as GrapheneAccount,
@@ -8,8 +11,149 @@ from graphenecommon.account import (
 from bitsharesbase import operations
 
 
+def _op_id(entry):
+    return int(entry["id"].split(".")[2])
+
+
+class FillHistory:
+    """
+    The ``fill_order`` operations of an account, oldest first.
+
+    The cached operations cover a contiguous range of the account's
+    operation history (``oldest`` to ``newest``). Newer operations are
+    appended by :meth:`add_newer`, older ones prepended by
+    :meth:`add_older`; :meth:`walk` tells which pages of the history
+    are needed for that.
+
+    The histories of the ``cache_size`` accounts used most recently are
+    cached, :meth:`clear` (and :meth:`bitshares.BitShares.clear_cache`)
+    empties the cache.
+    """
+
+    #: Number of accounts whose history is cached
+    cache_size = 1000
+
+    #: History per chain and account, least recently used first
+    cache = OrderedDict()
+
+    def __init__(self):
+        self.fills = []
+        self.newest = None
+        self.oldest = None
+        self.complete = False
+
+    @classmethod
+    def of(cls, account):
+        """Returns the cached history of an account"""
+        key = (ChainScopedCaching.chain_id_of(account.blockchain), account["id"])
+        if key in cls.cache:
+            cls.cache.move_to_end(key)
+        else:
+            cls.cache[key] = cls()
+            while len(cls.cache) > cls.cache_size:
+                cls.cache.popitem(last=False)
+        return cls.cache[key]
+
+    @classmethod
+    def clear(cls, chain_id=False):
+        """
+        Forget the cached histories.
+
+        :param str chain_id: Only forget the histories of this chain
+            (defaults to all chains)
+        """
+        if chain_id is False:
+            cls.cache.clear()
+        else:
+            for key in [key for key in cls.cache if key[0] == chain_id]:
+                del cls.cache[key]
+
+    @staticmethod
+    def _fills(entries):
+        return [
+            e
+            for e in reversed(entries)
+            if operations.getOperationNameForId(e["op"][0]) == "fill_order"
+        ]
+
+    def add_newer(self, entries):
+        """Add operations newer than ``newest`` (newest first)"""
+        if not entries:
+            return
+        self.newest = _op_id(entries[0])
+        self.fills.extend(self._fills(entries))
+
+    def add_older(self, entries, complete=False):
+        """Add operations older than ``oldest`` (newest first)"""
+        if entries:
+            if self.newest is None:
+                self.newest = _op_id(entries[0])
+            self.oldest = _op_id(entries[-1])
+            self.fills[:0] = self._fills(entries)
+        if complete or not entries or self.oldest <= 1:
+            self.complete = True
+
+    def walk(self, market=None, limit=None, page_size=100):
+        """
+        Bring the history up to date and extend it until ``limit`` fills
+        (of ``market``) are known.
+
+        Generator that yields the ``(stop, start)`` operation ids of the
+        pages it needs (see :meth:`Account._history_page`) and expects
+        each page to be sent back:
+
+        .. code-block:: python
+
+            walk, page = history.walk(market, limit), None
+            while True:
+                try:
+                    stop, start = walk.send(page)
+                except StopIteration:
+                    break
+                page = account._history_page(stop=stop, start=start)
+        """
+        # Operations newer than the cached ones, all operations of an
+        # account that had none so far
+        if self.newest is not None or self.complete:
+            stop, start, entries = self.newest or 0, 0, []
+            while True:
+                page = yield stop, start
+                entries.extend(page)
+                if len(page) < page_size:
+                    break
+                start = _op_id(page[-1]) - 1
+            self.add_newer(entries)
+
+        while not self.complete and (
+            limit is None or len(self.matching(market)) < limit
+        ):
+            start = self.oldest - 1 if self.oldest is not None else 0
+            page = yield 0, start
+            self.add_older(page, complete=len(page) < page_size)
+
+    def latest(self, market=None, limit=None):
+        """Returns the latest ``limit`` fills (see :meth:`matching`)"""
+        matches = self.matching(market)
+        if limit is not None:
+            return matches[-limit:] if limit else []
+        return matches
+
+    def matching(self, market=None):
+        """Returns the fills, optionally of a market only (given as pair of
+        asset ids)"""
+        if market is None:
+            return list(self.fills)
+        assets = set(market)
+        return [
+            f
+            for f in self.fills
+            if {f["op"][1]["pays"]["asset_id"], f["op"][1]["receives"]["asset_id"]}
+            == assets
+        ]
+
+
 @BlockchainInstance.inject
-class Account(GrapheneAccount):
+class Account(NegativeCaching, GrapheneAccount):
     """
     This class allows to easily access Account data.
 
@@ -37,7 +181,10 @@ class Account(GrapheneAccount):
 
     .. note:: This class comes with its own caching function to reduce the
               load on the API server. Instances of this class can be
-              refreshed with ``Account.refresh()``.
+              refreshed with ``Account.refresh()``. Lookups of
+              non-existing accounts are remembered for a short period
+              of time (see
+              :func:`bitshares.blockchainobject.NegativeCacheMixin.set_negative_cache_expiration`).
     """
 
     def define_classes(self):
@@ -69,6 +216,50 @@ class Account(GrapheneAccount):
             Order(o, blockchain_instance=self.blockchain) for o in self["limit_orders"]
         ]
 
+    def _history_page(self, stop=0, start=0, limit=100):
+        """Operations with ids ``stop`` (exclusive) to ``start`` (0: latest),
+        newest first"""
+        return [
+            e
+            for e in self.blockchain.rpc.get_account_history(
+                self["id"],
+                "1.11.{}".format(stop),
+                limit,
+                "1.11.{}".format(start),
+                api="history",
+            )
+            if _op_id(e) > stop
+        ]
+
+    def fills(self, market=None, limit=None):
+        """
+        Returns the ``fill_order`` operations of the account in time order
+        (oldest first).
+
+        The operation history of the account is walked page by page and
+        the fills are cached per account. Later calls only fetch the
+        operations that are newer than the cached ones and older ones
+        until ``limit`` fills have been found.
+
+        :param bitshares.market.Market market: Only return fills of this
+            market (optional)
+        :param int limit: Return (at most) the latest ``limit`` fills,
+            defaults to the entire history
+
+        Entries are returned as by ``get_account_history``.
+        """
+        if market is not None:
+            market = (market["base"]["id"], market["quote"]["id"])
+        history = FillHistory.of(self)
+        walk, page = history.walk(market, limit), None
+        while True:
+            try:
+                stop, start = walk.send(page)
+            except StopIteration:
+                break
+            page = self._history_page(stop=stop, start=start)
+        return history.latest(market, limit)
+
 
 @BlockchainInstance.inject
 class AccountUpdate(GrapheneAccountUpdate):
@@ -1,15 +1,17 @@
 # -*- coding: utf-8 -*-
 from .amount import Amount
+from .blockchainobject import NegativeCaching
 from .instance import BlockchainInstance
 from graphenecommon.aio.account import (
     Account as GrapheneAccount,
     AccountUpdate as GrapheneAccountUpdate,
 )
 from bitsharesbase import operations
+from ..account import FillHistory, _op_id
 
 
 @BlockchainInstance.inject
-class Account(GrapheneAccount):
+class Account(NegativeCaching, GrapheneAccount):
     """
     This class allows to easily access Account data.
 
@@ -70,6 +72,45 @@ class Account(GrapheneAccount):
             for o in self["limit_orders"]
         ]
 
+    async def _history_page(self, stop=0, start=0, limit=100):
+        """Operations with ids ``stop`` (exclusive) to ``start`` (0: latest),
+        newest first"""
+        return [
+            e
+            for e in await self.blockchain.rpc.get_account_history(
+                self["id"],
+                "1.11.{}".format(stop),
+                limit,
+                "1.11.{}".format(start),
+                api="history",
+            )
+            if _op_id(e) > stop
+        ]
+
+    async def fills(self, market=None, limit=None):
+        """
+        Returns the ``fill_order`` operations of the account in time order
+        (oldest first).
+
+        See :meth:`bitshares.account.Account.fills`.
+
+        :param bitshares.aio.market.Market market: Only return fills of
+            this market (optional)
+        :param int limit: Return (at most) the latest ``limit`` fills,
+            defaults to the entire history
+        """
+        if market is not None:
+            market = (market["base"]["id"], market["quote"]["id"])
+        history = FillHistory.of(self)
+        walk, page = history.walk(market, limit), None
+        while True:
+            try:
+                stop, start = walk.send(page)
+            except StopIteration:
+                break
+            page = await self._history_page(stop=stop, start=start)
+        return history.latest(market, limit)
+
 
 @BlockchainInstance.inject
 class AccountUpdate(GrapheneAccountUpdate):
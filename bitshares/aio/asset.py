@@ -10,12 +10,13 @@ from bitsharesbase.asset_permissions import (
     todict,
 )
 
+from .blockchainobject import NegativeCaching
 from .instance import BlockchainInstance
 from ..asset import Asset as SyncAsset
 
 
 @BlockchainInstance.inject
-class Asset(GrapheneAsset, SyncAsset):
+class Asset(NegativeCaching, GrapheneAsset, SyncAsset):
     """
     BitShares asset.
 
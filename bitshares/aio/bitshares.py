@@ -1,4 +1,6 @@
 # -*- coding: utf-8 -*-
+import asyncio
+import functools
 import logging
 
 from datetime import datetime, timedelta
@@ -59,6 +61,39 @@ class BitShares(AbstractGrapheneChain, SyncBitShares):
         self.transactionbuilder_class = TransactionBuilder
         self.blockchainobject_class = BlockchainObject
 
+    async def sign_batch(self, txs, wifs=[], max_workers=None):
+        """
+        Sign many transactions in parallel.
+
+        See :meth:`bitshares.bitshares.BitShares.sign_batch`, the process
+        pool runs in the default executor of the loop.
+        """
+        transactions, keys = [], []
+        for tx in txs:
+            tx_keys = []
+            if isinstance(tx, self.transactionbuilder_class):
+                tx_keys = list(tx.wifs)
+                tx = await tx.json()
+            transactions.append(tx)
+            keys.append(tx_keys + self._batch_signing_keys(tx, wifs))
+        return await asyncio.get_event_loop().run_in_executor(
+            None, functools.partial(self._sign_batch, transactions, keys, max_workers)
+        )
+
+    async def verify_batch(self, txs):
+        """
+        Recover the public keys that signed many transactions.
+
+        See :meth:`bitshares.bitshares.BitShares.verify_batch`, the process
+        pool runs in the default executor of the loop.
+        """
+        return await asyncio.get_event_loop().run_in_executor(
+            None,
+            functools.partial(
+                self.verifier.verify_transactions, txs, chain=self.rpc.chain_params
+            ),
+        )
+
     # -------------------------------------------------------------------------
     # Simple Transfer
     # -------------------------------------------------------------------------
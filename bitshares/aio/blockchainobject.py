@@ -1,13 +1,26 @@
 # -*- coding: utf-8 -*-
 from .instance import BlockchainInstance
+from ..blockchainobject import NegativeCacheMixin
 from graphenecommon.aio.blockchainobject import (
     BlockchainObject as GrapheneBlockchainObject,
     Object as GrapheneChainObject,
 )
 
 
+class NegativeCaching(NegativeCacheMixin):
+    """Negative caching for asynchronous :func:`refresh` implementations."""
+
+    async def refresh(self, *args, **kwargs):
+        self._raise_if_known_missing()
+        try:
+            return await super().refresh(*args, **kwargs)
+        except self.missing_exceptions as e:
+            self._remember_missing(e)
+            raise
+
+
 @BlockchainInstance.inject
-class BlockchainObject(GrapheneBlockchainObject):
+class BlockchainObject(NegativeCaching, GrapheneBlockchainObject):
     pass
 
 
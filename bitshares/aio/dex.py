@@ -1,13 +1,17 @@
 # -*- coding: utf-8 -*-
 # from .storage import config
+import asyncio
+
 from bitsharesbase import operations
 
 from .account import Account
 from .amount import Amount
+from ..amount import IntegerAmount
+from ..dex import Dex as SyncDex
 from .asset import Asset
+from .fees import FeeSchedule
 from .instance import BlockchainInstance
 from .price import Price
-from .market import Market
 
 
 class Dex(BlockchainInstance):
@@ -28,6 +32,8 @@ class Dex(BlockchainInstance):
         """
         Returns a dictionary of all fees that apply through the network.
 
+        The fee schedule is cached (see :class:`bitshares.aio.fees.FeeSchedule`).
+
         Example output:
 
         .. code-block:: js
@@ -43,22 +49,8 @@ class Dex(BlockchainInstance):
             10000000.0}, 'assert': {'fee': 20000.0},
             'committee_member_create': {'fee': 100000000.0}}
         """
-        from bitsharesbase.operations import operations
-
-        r = {}
-        obj, base = await self.blockchain.rpc.get_objects(["2.0.0", "1.3.0"])
-        fees = obj["parameters"]["current_fees"]["parameters"]
-        scale = float(obj["parameters"]["current_fees"]["scale"])
-        for f in fees:
-            op_name = "unknown %d" % f[0]
-            for name in operations:
-                if operations[name] == f[0]:
-                    op_name = name
-            fs = f[1]
-            for _type in fs:
-                fs[_type] = float(fs[_type]) * scale / 1e4 / 10 ** base["precision"]
-            r[op_name] = fs
-        return r
+        schedule = await FeeSchedule(blockchain_instance=self.blockchain)
+        return schedule.fees()
 
     async def list_debt_positions(self, account=None):
         """
@@ -82,38 +74,30 @@ class Dex(BlockchainInstance):
             raise ValueError("You need to provide an account")
         account = await Account(account, full=True, blockchain_instance=self.blockchain)
 
+        call_orders = account.get("call_orders") or []
+        assets, bitassets = await self._debt_assets(call_orders)
+        positions = await self._debt_positions(call_orders, assets, bitassets)
+        pairs = SyncDex._ticker_pairs(positions)
+        results = await asyncio.gather(
+            *[self.blockchain.rpc.get_ticker(*pair) for pair in pairs]
+        )
+        tickers = dict(zip(pairs, results))
+
         r = {}
-        for debt in account.get("call_orders"):
-            base = await Asset(
-                debt["call_price"]["base"]["asset_id"],
-                full=True,
-                blockchain_instance=self.blockchain,
-            )
-            quote = await Asset(
-                debt["call_price"]["quote"]["asset_id"],
-                full=True,
+        for debt, base, quote, bitasset, settlement_price in positions:
+            collateral_amount = await Amount(
+                {"amount": debt["collateral"], "asset": base},
                 blockchain_instance=self.blockchain,
             )
-            if not quote.is_bitasset:
-                continue
-            await quote.ensure_full()
-            bitasset = quote["bitasset_data"]
-            settlement_price = await Price(
-                bitasset["current_feed"]["settlement_price"],
+            debt_amount = await Amount(
+                {"amount": debt["debt"], "asset": quote},
                 blockchain_instance=self.blockchain,
             )
-            if not settlement_price:
-                continue
-            collateral_amount = await Amount(
-                {"amount": debt["collateral"], "asset": base}
-            )
-            debt_amount = await Amount({"amount": debt["debt"], "asset": quote})
             call_price = float(collateral_amount) / (
                 float(debt_amount)
                 * (bitasset["current_feed"]["maintenance_collateral_ratio"] / 1000)
             )
-            market = await Market("{}:{}".format(base["symbol"], quote["symbol"]))
-            latest = (await market.ticker())["latest"]
+            latest = tickers[(quote["id"], base["id"])]["latest"] or 0.0
             r[quote["symbol"]] = {
                 "collateral": collateral_amount,
                 "debt": debt_amount,
@@ -123,6 +107,52 @@ class Dex(BlockchainInstance):
             }
         return r
 
+    async def _debt_assets(self, call_orders):
+        """Returns the assets and bitasset data (by id) of call orders
+
+        Each is obtained with a single ``get_objects`` call, the assets
+        are stored in the cache.
+        """
+        ids = sorted(
+            {
+                debt["call_price"][side]["asset_id"]
+                for debt in call_orders
+                for side in ("base", "quote")
+            }
+        )
+        assets = {}
+        if ids:
+            for data in await self.blockchain.rpc.get_objects(ids):
+                asset = await Asset(data, blockchain_instance=self.blockchain)
+                asset.store(data, data["symbol"])
+                assets[data["id"]] = asset
+        bitasset_ids = SyncDex._bitasset_ids(assets, call_orders)
+        bitassets = {}
+        if bitasset_ids:
+            bitassets = dict(
+                zip(bitasset_ids, await self.blockchain.rpc.get_objects(bitasset_ids))
+            )
+        return assets, bitassets
+
+    async def _debt_positions(self, call_orders, assets, bitassets):
+        """Returns ``(debt, base, quote, bitasset, settlement_price)`` of
+        the call orders that are listed"""
+        positions = []
+        for debt in call_orders:
+            base = assets[debt["call_price"]["base"]["asset_id"]]
+            quote = assets[debt["call_price"]["quote"]["asset_id"]]
+            if not quote.is_bitasset:
+                continue
+            bitasset = bitassets[quote["bitasset_data_id"]]
+            settlement_price = await Price(
+                bitasset["current_feed"]["settlement_price"],
+                blockchain_instance=self.blockchain,
+            )
+            if not settlement_price:
+                continue
+            positions.append((debt, base, quote, bitasset, settlement_price))
+        return positions
+
     async def close_debt_position(self, symbol, account=None):
         """
         Close a debt position and reclaim the collateral.
@@ -140,21 +170,15 @@ class Dex(BlockchainInstance):
         if symbol not in debts:
             raise ValueError("No call position open for %s" % symbol)
         debt = debts[symbol]
-        asset = debt["debt"]["asset"]
-        collateral_asset = debt["collateral"]["asset"]
+        debt_amount = IntegerAmount(debt["debt"], blockchain_instance=self.blockchain)
+        collateral_amount = IntegerAmount(
+            debt["collateral"], blockchain_instance=self.blockchain
+        )
         op = operations.Call_order_update(
             **{
                 "fee": {"amount": 0, "asset_id": "1.3.0"},
-                "delta_debt": {
-                    "amount": int(-float(debt["debt"]) * 10 ** asset["precision"]),
-                    "asset_id": asset["id"],
-                },
-                "delta_collateral": {
-                    "amount": int(
-                        -float(debt["collateral"]) * 10 ** collateral_asset["precision"]
-                    ),
-                    "asset_id": collateral_asset["id"],
-                },
+                "delta_debt": (-debt_amount).json(),
+                "delta_collateral": (-collateral_amount).json(),
                 "funding_account": account["id"],
                 "extensions": [],
             }
@@ -246,16 +270,12 @@ class Dex(BlockchainInstance):
 
         payload = {
             "fee": {"amount": 0, "asset_id": "1.3.0"},
-            "delta_debt": {
-                "amount": int(float(delta) * 10 ** asset["precision"]),
-                "asset_id": asset["id"],
-            },
-            "delta_collateral": {
-                "amount": int(
-                    float(amount_of_collateral) * 10 ** collateral_asset["precision"]
-                ),
-                "asset_id": collateral_asset["id"],
-            },
+            "delta_debt": IntegerAmount(
+                delta["amount"], asset, blockchain_instance=self.blockchain
+            ).json(),
+            "delta_collateral": IntegerAmount(
+                amount_of_collateral, collateral_asset, blockchain_instance=self.blockchain
+            ).json(),
             "funding_account": account["id"],
             "extensions": {},
         }
@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+from asyncinit import asyncinit
+
+from .asset import Asset
+from .instance import BlockchainInstance
+from ..fees import FeeSchedule as SyncFeeSchedule
+
+
+@asyncinit
+@BlockchainInstance.inject
+class FeeSchedule(SyncFeeSchedule):
+    """
+    Cached fee schedule of the network.
+
+    :param bitshares.aio.bitshares.BitShares blockchain_instance: BitShares
+        instance
+
+    See :class:`bitshares.fees.FeeSchedule`, the schedule is shared with the
+    synchronous class.
+    """
+
+    async def __init__(self, **kwargs):
+        if not self._cached():
+            await self.refresh()
+
+    async def refresh(self):
+        """Reload the fee schedule from the API node"""
+        self._set(
+            *await self.blockchain.rpc.get_objects(["2.0.0", "2.1.0", "1.3.0"])
+        )
+
+    async def estimate(self, op, asset_id="1.3.0"):
+        """
+        Estimate the fee of an operation without asking the API node.
+
+        :param op: Operation (see :meth:`core_fee`)
+        :param str asset_id: Asset to pay the fee with
+        :returns: fee as ``{"amount": ..., "asset_id": ...}`` (like
+            ``get_required_fees``)
+        """
+        fee = self.core_fee(op)
+        if asset_id != "1.3.0":
+            asset = await Asset(asset_id, blockchain_instance=self.blockchain)
+            fee = self._convert(fee, asset_id, asset["options"]["core_exchange_rate"])
+        return {"amount": fee, "asset_id": asset_id}
@@ -1,4 +1,7 @@
 # -*- coding: utf-8 -*-
+import asyncio
+import sys
+
 from datetime import datetime, timedelta
 from asyncinit import asyncinit
 
@@ -9,8 +12,16 @@ from .amount import Amount
 from .asset import Asset
 from .instance import BlockchainInstance
 from .price import FilledOrder, Order, Price
-from ..utils import assets_from_string, formatTime, formatTimeFromNow
-from ..market import Market as SyncMarket
+from ..utils import (
+    assets_from_string,
+    formatTime,
+    formatTimeFromNow,
+    formatTimeString,
+    read_ahead_async,
+)
+from ..amount import IntegerAmount
+from ..exceptions import AssetDoesNotExistsException
+from ..market import Market as SyncMarket, Markets as SyncMarkets, Trader as SyncTrader
 
 
 @asyncinit
@@ -94,6 +105,18 @@ class Market(SyncMarket):
                 }
             }
         """
+        bitasset_data_id = self._bitasset_data_id()
+        bitasset = None
+        if bitasset_data_id:
+            bitasset = await self.blockchain.rpc.get_object(bitasset_data_id)
+        ticker = await self.blockchain.rpc.get_ticker(
+            self["base"]["id"], self["quote"]["id"]
+        )
+        return await self._ticker(ticker, bitasset)
+
+    async def _ticker(self, ticker, bitasset=None):
+        """Build the result of :meth:`ticker` from the result of
+        ``get_ticker`` and the bitasset data of the market"""
         data = {}
         # Core Exchange rate
         if self["quote"]["id"] == "1.3.0":
@@ -108,9 +131,6 @@ class Market(SyncMarket):
 
         # smartcoin stuff
         if "bitasset_data_id" in self["quote"]:
-            bitasset = await self.blockchain.rpc.get_object(
-                self["quote"]["bitasset_data_id"]
-            )
             backing_asset_id = bitasset["options"]["short_backing_asset"]
             if backing_asset_id == self["base"]["id"]:
                 sp = bitasset["current_feed"]["settlement_price"]
@@ -123,9 +143,6 @@ class Market(SyncMarket):
                     ].invert()
 
         elif "bitasset_data_id" in self["base"]:
-            bitasset = await self.blockchain.rpc.get_object(
-                self["base"]["bitasset_data_id"]
-            )
             backing_asset_id = bitasset["options"]["short_backing_asset"]
             if backing_asset_id == self["quote"]["id"]:
                 data["baseSettlement_price"] = await Price(
@@ -133,9 +150,6 @@ class Market(SyncMarket):
                     blockchain_instance=self.blockchain,
                 )
 
-        ticker = await self.blockchain.rpc.get_ticker(
-            self["base"]["id"], self["quote"]["id"]
-        )
         data["baseVolume"] = await Amount(
             ticker["base_volume"] or 0.0,
             self["base"],
@@ -284,14 +298,54 @@ class Market(SyncMarket):
         )
         return [await Order(x, blockchain_instance=self.blockchain) for x in orders]
 
-    async def trades(self, limit=25, start=None, stop=None):
+    async def trades(
+        self,
+        limit=25,
+        start=None,
+        stop=None,
+        readahead=0,
+        raw=False,
+        batch=False,
+        store=None,
+    ):
         """
         Returns your trade history for a given market.
 
         :param int limit: Limit the amount of orders (default: 25)
         :param datetime start: start time
         :param datetime stop: stop time
+        :param int readahead: Number of pages (of 100 trades) to fetch in a
+            separate task while the current page is being consumed
+            (default: 0, i.e. fetch pages on demand)
+        :param bool raw: Yield the trades as returned by the API instead of
+            instances of :class:`bitshares.aio.price.FilledOrder`
+        :param bool batch: Yield one columnar batch per page, i.e. a dict
+            with lists ``sequence``, ``date``, ``price``, ``amount`` (quote)
+            and ``value`` (base)
+        :param bitshares.tradestore.SqliteTradeStore store: Serve the
+            trades from this store if it covers the time range
         """
+        # The ranges of the store are in UTC
+        store_stop = stop or datetime.utcnow()
+        store_start = start or store_stop - timedelta(hours=24)
+        if store is not None and store.covers(self, store_start, store_stop):
+            pages = _aiter([store.trades(self, store_start, store_stop, limit=limit)])
+        else:
+            pages = self._trade_pages(limit=limit, start=start, stop=stop)
+            if readahead:
+                pages = read_ahead_async(pages, readahead)
+        async for page in pages:
+            if batch:
+                yield self._trade_columns(page)
+            elif raw:
+                for order in page:
+                    yield order
+            else:
+                for order in page:
+                    yield await self._filled_order(order)
+
+    async def _trade_pages(self, limit=25, start=None, stop=None):
+        """Yields the raw trade history page by page"""
         # FIXME, this call should also return whether it was a buy or
         # sell
         if not stop:
@@ -317,7 +371,8 @@ class Market(SyncMarket):
                 )
             else:
                 # obtain subsequent set of orders
-                continuous_limit = min(limit - cnt, 100)
+                # One more as the start sequence (already seen) is included
+                continuous_limit = min(limit - cnt + 1, 100)
                 orders = await self.blockchain.rpc.get_trade_history_by_sequence(
                     self["base"]["symbol"],
                     self["quote"]["symbol"],
@@ -326,27 +381,101 @@ class Market(SyncMarket):
                     continuous_limit,
                 )
 
+            if sequence:
+                # The start sequence is inclusive, skip what we have seen
+                orders = [o for o in orders if o.get("sequence", 0) < sequence]
             if len(orders) == 0:
                 return
-            for order in orders:
-                cnt += 1
-                yield await FilledOrder(
-                    order,
-                    quote=await Amount(
-                        order["amount"],
-                        self["quote"],
-                        blockchain_instance=self.blockchain,
-                    ),
-                    base=await Amount(
-                        float(order["amount"]) * float(order["price"]),
-                        self["base"],
-                        blockchain_instance=self.blockchain,
-                    ),
-                    blockchain_instance=self.blockchain,
-                )
-                if cnt >= limit:
-                    return
-                sequence = order.get("sequence")
+            orders = orders[: limit - cnt]
+            cnt += len(orders)
+            yield orders
+            if cnt >= limit:
+                return
+            sequence = orders[-1].get("sequence")
+
+    async def _filled_order(self, order):
+        return await FilledOrder(
+            order,
+            quote=await Amount(
+                order["amount"],
+                self["quote"],
+                blockchain_instance=self.blockchain,
+            ),
+            base=await Amount(
+                float(order["amount"]) * float(order["price"]),
+                self["base"],
+                blockchain_instance=self.blockchain,
+            ),
+            blockchain_instance=self.blockchain,
+        )
+
+    async def candles(self, bucket=3600, start=None, stop=None):
+        """
+        Returns OHLCV candles of the market.
+
+        The candles are taken from the market history buckets of the node.
+        If ``bucket`` is no native bucket size of the node, the candles are
+        resampled locally from the largest native bucket size that divides
+        it (or aggregated from the trade history if there is none).
+
+        :param int bucket: Bucket size in seconds (default: 3600)
+        :param datetime start: start time (UTC, defaults to 200 buckets
+            before ``stop``)
+        :param datetime stop: stop time (UTC, defaults to now)
+        :returns: list of candles as described in
+            :class:`bitshares.candles.CandleAggregator`
+        """
+        from ..candles import CandleAggregator
+
+        if not stop:
+            stop = datetime.utcnow()
+        if not start:
+            start = stop - timedelta(seconds=bucket * 200)
+
+        native = [
+            size
+            for size in await self.blockchain.rpc.get_market_history_buckets(
+                api="history"
+            )
+            if size <= bucket and bucket % size == 0
+        ]
+        if native:
+            aggregator = CandleAggregator(
+                self, bucket=max(native), blockchain_instance=self.blockchain
+            )
+            async for row in self._market_history(aggregator.bucket, start, stop):
+                aggregator.add_candle(aggregator.from_bucket(row))
+        else:
+            aggregator = CandleAggregator(
+                self, bucket=bucket, blockchain_instance=self.blockchain
+            )
+            async for page in self._trade_pages(
+                limit=sys.maxsize, start=start, stop=stop
+            ):
+                # Trades come newest first
+                for trade in reversed(page):
+                    aggregator.apply(trade)
+        return aggregator.resample(bucket)
+
+    async def _market_history(self, bucket, start, stop):
+        """Yields the market history buckets of the node"""
+        while True:
+            rows = await self.blockchain.rpc.get_market_history(
+                self["base"]["id"],
+                self["quote"]["id"],
+                bucket,
+                formatTime(start),
+                formatTime(stop),
+                api="history",
+            )
+            for row in rows:
+                yield row
+            # The node returns at most 200 buckets per call
+            if len(rows) < 200:
+                return
+            start = formatTimeString(rows[-1]["key"]["open"]) + timedelta(
+                seconds=bucket
+            )
 
     async def accounttrades(self, account=None, limit=25):
         """
@@ -366,7 +495,8 @@ class Market(SyncMarket):
         .. note:: This call goes through the trade history and
                   searches for your account, if there are no orders
                   within ``limit`` trades, this call will return an
-                  empty array.
+                  empty array. See :meth:`accountfills` for a lookup
+                  through the account's history.
         """
         if not account:
             if "default_account" in self.blockchain.config:
@@ -391,6 +521,38 @@ class Market(SyncMarket):
                 )
         return trades
 
+    async def accountfills(self, account=None, limit=25):
+        """
+        Returns the fills of an account's orders in this market in time
+        order (oldest first).
+
+        Unlike :meth:`accounttrades`, this walks the operation history of
+        the account (see :meth:`bitshares.account.Account.fills`), i.e. it
+        finds the latest ``limit`` fills no matter how much has been
+        traded by others in the meantime. Fills are cached per account.
+
+        :param bitshares.account.Account account: Account name or instance
+            of Account
+        :param int limit: Number of fills (``None`` for all)
+        :returns: list of :class:`bitshares.price.FilledOrder` with the
+            additional key ``block_num``
+        """
+        if not account:
+            if "default_account" in self.blockchain.config:
+                account = self.blockchain.config["default_account"]
+        if not account:
+            raise ValueError("You need to provide an account")
+        account = await Account(account, blockchain_instance=self.blockchain)
+
+        trades = []
+        for entry in await account.fills(market=self, limit=limit):
+            trade = await FilledOrder(
+                entry, base_asset=self["base"], blockchain_instance=self.blockchain
+            )
+            trade["block_num"] = entry["block_num"]
+            trades.append(trade)
+        return trades
+
     async def accountopenorders(self, account=None):
         """
         Returns open Orders.
@@ -487,26 +649,16 @@ class Market(SyncMarket):
                 amount, self["quote"]["symbol"], blockchain_instance=self.blockchain
             )
 
+        # Exact integer arithmetic on satoshis
+        quote_amount = IntegerAmount(amount, blockchain_instance=self.blockchain)
+        base_amount = quote_amount.convert(price, self["base"])
+
         order = operations.Limit_order_create(
             **{
                 "fee": {"amount": 0, "asset_id": "1.3.0"},
                 "seller": account["id"],
-                "amount_to_sell": {
-                    "amount": int(
-                        round(
-                            float(amount)
-                            * float(price)
-                            * 10 ** self["base"]["precision"]
-                        )
-                    ),
-                    "asset_id": self["base"]["id"],
-                },
-                "min_to_receive": {
-                    "amount": int(
-                        round(float(amount) * 10 ** self["quote"]["precision"])
-                    ),
-                    "asset_id": self["quote"]["id"],
-                },
+                "amount_to_sell": base_amount.json(),
+                "min_to_receive": quote_amount.json(),
                 "expiration": formatTimeFromNow(expiration),
                 "fill_or_kill": killfill,
             }
@@ -581,26 +733,16 @@ class Market(SyncMarket):
                 amount, self["quote"]["symbol"], blockchain_instance=self.blockchain
             )
 
+        # Exact integer arithmetic on satoshis
+        quote_amount = IntegerAmount(amount, blockchain_instance=self.blockchain)
+        base_amount = quote_amount.convert(price, self["base"])
+
         order = operations.Limit_order_create(
             **{
                 "fee": {"amount": 0, "asset_id": "1.3.0"},
                 "seller": account["id"],
-                "amount_to_sell": {
-                    "amount": int(
-                        round(float(amount) * 10 ** self["quote"]["precision"])
-                    ),
-                    "asset_id": self["quote"]["id"],
-                },
-                "min_to_receive": {
-                    "amount": int(
-                        round(
-                            float(amount)
-                            * float(price)
-                            * 10 ** self["base"]["precision"]
-                        )
-                    ),
-                    "asset_id": self["base"]["id"],
-                },
+                "amount_to_sell": quote_amount.json(),
+                "min_to_receive": base_amount.json(),
                 "expiration": formatTimeFromNow(expiration),
                 "fill_or_kill": killfill,
             }
@@ -620,6 +762,215 @@ class Market(SyncMarket):
 
         return tx
 
+    async def _account(self, account=None):
+        if not account:
+            if "default_account" in self.blockchain.config:
+                account = self.blockchain.config["default_account"]
+        if not account:
+            raise ValueError("You need to provide an account")
+        return await Account(account, blockchain_instance=self.blockchain)
+
+    async def _order_op(self, side, price, amount, account, expiration, killfill=False):
+        """Returns the ``Limit_order_create`` operation of a buy or sell
+        order (see :meth:`buy` and :meth:`sell`)"""
+        if side not in ("buy", "sell"):
+            raise ValueError("side needs to be 'buy' or 'sell'")
+        if isinstance(price, Price):
+            price = await price.as_base(self["base"]["symbol"])
+        if isinstance(amount, Amount):
+            assert (
+                amount["asset"]["symbol"] == self["quote"]["symbol"]
+            ), "Price: {} does not match amount: {}".format(str(price), str(amount))
+            quote_amount = IntegerAmount(amount, blockchain_instance=self.blockchain)
+        else:
+            quote_amount = IntegerAmount(
+                amount, self["quote"], blockchain_instance=self.blockchain
+            )
+        base_amount = quote_amount.convert(price, self["base"])
+        if side == "buy":
+            amount_to_sell, min_to_receive = base_amount, quote_amount
+        else:
+            amount_to_sell, min_to_receive = quote_amount, base_amount
+        return operations.Limit_order_create(
+            **{
+                "fee": {"amount": 0, "asset_id": "1.3.0"},
+                "seller": account["id"],
+                "amount_to_sell": amount_to_sell.json(),
+                "min_to_receive": min_to_receive.json(),
+                "expiration": formatTimeFromNow(expiration),
+                "fill_or_kill": killfill,
+            }
+        )
+
+    async def _finalize_ops(
+        self, ops, account, returnOrderId=False, split=True, **kwargs
+    ):
+        """
+        Broadcast operations in as few transactions as the maximum
+        transaction size allows (or in one transaction if ``split`` is
+        ``False``).
+
+        If the operations are not broadcast right away (``append_to``,
+        bundle, unsigned or proposer mode) they are all added to the
+        same transaction.
+        """
+        if (
+            kwargs.get("append_to")
+            or self.blockchain.bundle
+            or self.blockchain.unsigned
+            or self.blockchain.proposer
+        ):
+            return [
+                await self.blockchain.finalizeOp(
+                    ops, account["name"], "active", **kwargs
+                )
+            ]
+
+        chunks = [ops]
+        if split:
+            properties = await self.blockchain.rpc.get_global_properties()
+            max_size = properties["parameters"]["maximum_transaction_size"]
+            chunks = self._split_ops(ops, max_size)
+        if returnOrderId:
+            # Make blocking broadcasts
+            prevblocking = self.blockchain.blocking
+            self.blockchain.blocking = returnOrderId
+        try:
+            txs = []
+            for chunk in chunks:
+                tx = await self.blockchain.finalizeOp(
+                    chunk, account["name"], "active", **kwargs
+                )
+                if returnOrderId and tx.get("operation_results"):
+                    tx["orderids"] = [
+                        result[1]
+                        for op, result in zip(chunk, tx["operation_results"])
+                        if isinstance(op, operations.Limit_order_create)
+                    ]
+                txs.append(tx)
+        finally:
+            if returnOrderId:
+                self.blockchain.blocking = prevblocking
+        return txs
+
+    async def _open_orders(self, account):
+        """Returns the raw open orders of an account in this market"""
+        account = await Account(
+            account["id"], full=True, blockchain_instance=self.blockchain
+        )
+        await account.refresh()
+        return [o for o in account["limit_orders"] if self._in_market(o)]
+
+    async def place_orders(
+        self,
+        orders,
+        expiration=None,
+        killfill=False,
+        account=None,
+        returnOrderId=False,
+        **kwargs
+    ):
+        """
+        Places several orders (e.g. a ladder) in as few transactions as
+        possible.
+
+        :param list orders: List of ``(side, price, amount)`` with ``side``
+            being ``"buy"`` or ``"sell"`` (see :meth:`buy` and :meth:`sell`)
+        :param number expiration: (optional) expiration time of the orders
+            in seconds
+        :param bool killfill: flag that indicates if the orders shall be
+            killed if they are not filled (defaults to False)
+        :param string account: Account name that executes the orders
+        :param string returnOrderId: If set to "head" or "irreversible" the
+            call will wait for the transactions to appear in the
+            head/irreversible block and add the key "orderids" to each
+            transaction
+        :returns: list of broadcast transactions (usually one)
+        """
+        if not expiration:
+            expiration = self.blockchain.config["order-expiration"]
+        account = await self._account(account)
+        ops = [
+            await self._order_op(side, price, amount, account, expiration, killfill)
+            for side, price, amount in orders
+        ]
+        return await self._finalize_ops(
+            ops, account, returnOrderId=returnOrderId, **kwargs
+        )
+
+    async def replace(
+        self,
+        order_ids=None,
+        orders=None,
+        expiration=None,
+        killfill=False,
+        account=None,
+        returnOrderId=False,
+        only_changed=False,
+        **kwargs
+    ):
+        """
+        Cancels orders and places new ones in a single transaction, e.g. to
+        re-quote a ladder without being exposed in between.
+
+        :param list order_ids: Ids of the orders to cancel (``1.7.x``)
+        :param list orders: New orders as list of ``(side, price, amount)``
+            (see :meth:`place_orders`)
+        :param number expiration: (optional) expiration time of the new
+            orders in seconds
+        :param bool killfill: flag that indicates if the new orders shall be
+            killed if they are not filled (defaults to False)
+        :param string account: Account name that executes the orders
+        :param string returnOrderId: If set to "head" or "irreversible" the
+            call will wait for the transaction to appear in the
+            head/irreversible block and add the key "orderids" with the ids
+            of the new orders
+        :param bool only_changed: Leave open orders that are identical to a
+            new order (same side, price and remaining amount) untouched. If
+            ``order_ids`` is not given, all open orders of the account in
+            this market are considered.
+        :returns: The broadcast transaction (``None`` if there is nothing to
+            do)
+        """
+        if not expiration:
+            expiration = self.blockchain.config["order-expiration"]
+        account = await self._account(account)
+        if isinstance(order_ids, str):
+            order_ids = [order_ids]
+        ops = [
+            await self._order_op(side, price, amount, account, expiration, killfill)
+            for side, price, amount in orders or []
+        ]
+        if only_changed:
+            open_orders = await self._open_orders(account)
+            if order_ids is not None:
+                open_orders = [o for o in open_orders if o["id"] in order_ids]
+            order_ids, ops = self._unchanged(open_orders, ops)
+
+        ops = self._cancel_ops(order_ids or [], account) + ops
+        if not ops:
+            return None
+        txs = await self._finalize_ops(
+            ops, account, returnOrderId=returnOrderId, split=False, **kwargs
+        )
+        return txs[0]
+
+    async def trader(self, account=None, expiration=None, killfill=False):
+        """
+        Returns a :class:`Trader` that places orders in this market on
+        behalf of one account with as little overhead per order as
+        possible.
+
+        :param string account: Account name that executes the orders
+        :param number expiration: (optional) expiration time of the orders
+            in seconds
+        :param bool killfill: flag that indicates if the orders shall be
+            killed if they are not filled (defaults to False)
+        """
+        if not expiration:
+            expiration = self.blockchain.config["order-expiration"]
+        return Trader(self, await self._account(account), expiration, killfill)
+
     async def cancel(self, orderNumber, account=None, **kwargs):
         """
         Cancels an order you have placed in a given market. Requires only the
@@ -664,3 +1015,110 @@ class Market(SyncMarket):
             blockchain_instance=self.blockchain,
         )
         return await Market(quote=self["base"], base=collateral)
+
+
+class Trader(SyncTrader):
+    """
+    Fast path to place orders in a market on behalf of one account.
+
+    See :class:`bitshares.market.Trader`, obtain instances with
+    :meth:`Market.trader`.
+    """
+
+    async def buy(self, price, amount, **kwargs):
+        """Places a buy order (see :meth:`Market.buy`)"""
+        return await self.blockchain.finalizeOp(
+            self.order_op("buy", price, amount),
+            self.account["name"],
+            "active",
+            **kwargs
+        )
+
+    async def sell(self, price, amount, **kwargs):
+        """Places a sell order (see :meth:`Market.sell`)"""
+        return await self.blockchain.finalizeOp(
+            self.order_op("sell", price, amount),
+            self.account["name"],
+            "active",
+            **kwargs
+        )
+
+    async def place(self, orders, **kwargs):
+        """Places several orders (see :meth:`Market.place_orders`)"""
+        ops = [self.order_op(*order) for order in orders]
+        return await self.market._finalize_ops(ops, self.account, **kwargs)
+
+
+@asyncinit
+@BlockchainInstance.inject
+class Markets(SyncMarkets):
+    """
+    A list of markets whose data is obtained in batches.
+
+    :param list markets: Markets as strings (e.g. ``"USD:BTS"``) or
+        instances of :class:`Market`
+    :param bitshares.aio.bitshares.BitShares blockchain_instance: BitShares
+        instance
+
+    Like :class:`bitshares.market.Markets`, but the ``get_ticker`` calls of
+    :meth:`tickers` are sent concurrently.
+    """
+
+    async def __init__(self, markets, **kwargs):
+        markets = list(markets)
+        symbols = self._symbols(markets)
+        assets = {}
+        if symbols:
+            assets = await self._store_assets(
+                symbols, await self.blockchain.rpc.lookup_asset_symbols(symbols)
+            )
+        list.__init__(self, [await self._market(m, assets) for m in markets])
+
+    async def _store_assets(self, symbols, results):
+        """Returns a dict of symbol to asset and feeds the asset cache"""
+        assets = {}
+        for symbol, data in zip(symbols, results):
+            if not data:
+                raise AssetDoesNotExistsException(symbol)
+            asset = assets[symbol] = await Asset(
+                data, blockchain_instance=self.blockchain
+            )
+            asset.store(data, data["symbol"])
+        return assets
+
+    async def _market(self, market, assets):
+        if isinstance(market, SyncMarket):
+            return market
+        quote, base = assets_from_string(market)
+        return await Market(
+            base=assets[base], quote=assets[quote], blockchain_instance=self.blockchain
+        )
+
+    async def tickers(self):
+        """
+        Returns the tickers of all markets.
+
+        :returns: dict of market string (e.g. ``USD:BTS``) to the result of
+            :meth:`Market.ticker`
+        """
+        ids = self._bitasset_ids()
+        bitassets = {}
+        if ids:
+            bitassets = dict(zip(ids, await self.blockchain.rpc.get_objects(ids)))
+        pairs = self._ticker_pairs()
+        results = await asyncio.gather(
+            *[self.blockchain.rpc.get_ticker(*pair) for pair in pairs]
+        )
+        tickers = dict(zip(pairs, results))
+        return {
+            m.get_string(): await m._ticker(
+                tickers[(m["base"]["id"], m["quote"]["id"])],
+                bitassets.get(m._bitasset_data_id()),
+            )
+            for m in self
+        }
+
+
+async def _aiter(iterable):
+    for item in iterable:
+        yield item
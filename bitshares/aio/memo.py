@@ -2,12 +2,13 @@
 from graphenecommon.aio.memo import Memo as GrapheneMemo
 from bitsharesbase.account import PrivateKey, PublicKey
 
+from ..memo import SharedSecretMixin
 from .account import Account
 from .instance import BlockchainInstance
 
 
 @BlockchainInstance.inject
-class Memo(GrapheneMemo):
+class Memo(SharedSecretMixin, GrapheneMemo):
     """
     Deals with Memos that are attached to a transfer.
 
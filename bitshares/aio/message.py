@@ -1,10 +1,14 @@
 # -*- coding: utf-8 -*-
+import asyncio
+import functools
+
 from graphenecommon.aio.message import (
     Message as GrapheneMessage,
     InvalidMessageSignature,
 )
 from bitsharesbase.account import PublicKey
 
+from ..message import _check_memo_key, _check_signer, _missing_account, _parse_signed
 from .account import Account
 from .instance import BlockchainInstance
 from ..exceptions import (
@@ -26,3 +30,53 @@ class Message(GrapheneMessage):
     def define_classes(self):
         self.account_class = Account
         self.publickey_class = PublicKey
+
+    @classmethod
+    async def verify_many(cls, messages, verifier=None, **kwargs):
+        """
+        Verify many signed messages.
+
+        See :meth:`bitshares.message.Message.verify_many`, the process pool
+        runs in the default executor of the loop.
+        """
+        messages = [
+            m if isinstance(m, cls) else await cls(m, **kwargs) for m in messages
+        ]
+        if not messages:
+            return []
+        blockchain = messages[0].blockchain
+        verifier = verifier or blockchain.verifier
+        errors = cls.valid_exceptions + (ValueError,)
+
+        results, pending = [], []
+        for i, message in enumerate(messages):
+            try:
+                signed = _parse_signed(message)
+                _check_memo_key(signed, blockchain.prefix)
+                try:
+                    account = await message.account_class(
+                        signed["account"], blockchain_instance=message.blockchain
+                    )
+                except AccountDoesNotExistsException:
+                    raise _missing_account(signed["account"])
+            except errors as e:
+                results.append(e)
+                continue
+            results.append(None)
+            pending.append((i, signed, account))
+
+        # Recover the signers in one batch
+        keys = await asyncio.get_event_loop().run_in_executor(
+            None,
+            functools.partial(
+                verifier.recover,
+                [(signed["signed"], signed["signature"]) for _, signed, _ in pending],
+                blockchain.prefix,
+            ),
+        )
+        for (i, signed, account), pubkey in zip(pending, keys):
+            try:
+                results[i] = _check_signer(messages[i], signed, account, pubkey)
+            except errors as e:
+                results[i] = e
+        return results
@@ -1,7 +1,13 @@
 # -*- coding: utf-8 -*-
-from .asset import Asset
+import math
+
+from decimal import Decimal
+from fractions import Fraction
+
+from .asset import Asset, AssetInfo
 from .instance import BlockchainInstance
 from graphenecommon.amount import Amount as GrapheneAmount
+from graphenecommon.price import Price as GraphenePrice
 
 
 @BlockchainInstance.inject
@@ -54,10 +60,317 @@ class Amount(GrapheneAmount):
 
         Amount("1 USD") * 2
         Amount("15 GOLD") + Amount("0.5 GOLD")
+
+    Instead of a full :class:`bitshares.asset.Asset`, an amount can also
+    carry a compact :class:`bitshares.asset.AssetInfo` (see
+    :func:`compact`). Such amounts do not copy asset data on arithmetic and
+    only load the full asset when accessing :attr:`asset`:
+
+    .. code-block:: python
+
+        info = Asset("USD").info
+        a = Amount(1, info)
+        b = Amount({"amount": 10000, "asset": info})
+        a + b
     """
 
+    def __init__(self, *args, **kwargs):
+        amount = kwargs.get("amount", None)
+        asset = kwargs.get("asset", None)
+
+        if len(args) == 2 and isinstance(args[1], AssetInfo):
+            amount, asset = args
+        elif (
+            len(args) == 1
+            and isinstance(args[0], GrapheneAmount)
+            and isinstance(args[0]["asset"], AssetInfo)
+        ):
+            amount, asset = args[0]["amount"], args[0]["asset"]
+        elif (
+            len(args) == 1
+            and isinstance(args[0], dict)
+            and isinstance(args[0].get("asset"), AssetInfo)
+        ):
+            asset = args[0]["asset"]
+            amount = int(args[0]["amount"]) / 10 ** asset.precision
+        elif args or not isinstance(asset, AssetInfo):
+            super().__init__(*args, **kwargs)
+            return
+
+        self.define_classes()
+        dict.__init__(self, amount=float(amount), symbol=asset.symbol, asset=asset)
+
     def define_classes(self):
         from .price import Price
 
         self.asset_class = Asset
         self.price_class = Price
+
+    def copy(self):
+        """Copy the instance and make sure not to use a reference"""
+        if isinstance(self["asset"], AssetInfo):
+            return self.__class__(
+                amount=self["amount"],
+                asset=self["asset"],
+                blockchain_instance=self.blockchain,
+            )
+        return super().copy()
+
+    @property
+    def asset(self):
+        """Returns the asset as instance of :class:`bitshares.asset.Asset`"""
+        if isinstance(self["asset"], AssetInfo):
+            return self["asset"].resolve(blockchain_instance=self.blockchain)
+        return super().asset
+
+    def compact(self):
+        """
+        Return a copy of this amount that carries a
+        :class:`bitshares.asset.AssetInfo` instead of the full asset.
+        """
+        return self.__class__(
+            amount=self["amount"],
+            asset=AssetInfo.from_asset(self["asset"]),
+            blockchain_instance=self.blockchain,
+        )
+
+
+def _fraction(value):
+    """Exact rational representation of a number as it is written."""
+    if isinstance(value, float):
+        # repr() yields the shortest decimal that maps to this float, so
+        # 0.1 becomes 1/10 and not 3602879701896397/36028797018963968
+        return Fraction(repr(value))
+    return Fraction(value)
+
+
+class IntegerAmount(Amount):
+    """
+    Amount that keeps its value as integer number of base units (satoshis)
+    of the asset.
+
+    Additions, subtractions, scaling and conversions with a
+    :class:`bitshares.price.Price` are computed exactly on integers and
+    rounded (half to even) to full satoshis once per operation. The asset
+    is checked once per operation and carried as a
+    :class:`bitshares.asset.AssetInfo`. The decimal value in the ``amount``
+    key is only derived for display and compatibility.
+
+    :param list args: Same representations as :class:`Amount`
+    :param bitshares.bitshares.BitShares blockchain_instance: BitShares instance
+
+    .. code-block:: python
+
+        from bitshares.amount import IntegerAmount
+        a = IntegerAmount("0.3 USD")
+        int(a)                      # 3000 (with a precision of 4)
+        int(a * 3)                  # 9000, no floating point drift
+        IntegerAmount.from_satoshis(3000, Asset("USD"))
+
+    Decimal values (``float``, ``str``, :class:`decimal.Decimal`) are
+    interpreted as written, i.e. ``0.1`` is exactly one tenth.
+    """
+
+    def __init__(self, *args, **kwargs):
+        # This class does not have @BlockchainInstance.inject because of MRO
+        BlockchainInstance.__init__(self, **kwargs)
+        self.define_classes()
+
+        amount = kwargs.get("amount", None)
+        asset = kwargs.get("asset", None)
+
+        if len(args) == 1 and isinstance(args[0], IntegerAmount):
+            satoshis, asset = args[0].satoshis, args[0]["asset"]
+        elif len(args) == 1 and isinstance(args[0], GrapheneAmount):
+            # Also covers amounts of bitshares.aio
+            amount, asset = args[0]["amount"], args[0]["asset"]
+            satoshis = None
+        elif len(args) == 1 and isinstance(args[0], str):
+            amount, asset = args[0].split(" ")
+            satoshis = None
+        elif len(args) == 1 and isinstance(args[0], dict) and "amount" in args[0]:
+            satoshis = int(args[0]["amount"])
+            asset = args[0].get("asset_id", args[0].get("asset"))
+        elif len(args) == 2:
+            amount, asset = args
+            satoshis = None
+        elif len(args) == 0 and amount is not None and asset is not None:
+            satoshis = None
+        else:
+            raise ValueError
+
+        asset = AssetInfo.load(asset, self.blockchain)
+        if satoshis is None:
+            satoshis = self.to_satoshis(amount, asset.precision)
+        self._set(satoshis, asset)
+
+    @classmethod
+    def from_satoshis(cls, satoshis, asset, **kwargs):
+        """
+        Create an instance from an integer number of base units.
+
+        :param int satoshis: Amount in base units of the asset
+        :param asset: Asset (symbol, id, :class:`bitshares.asset.Asset` or
+            :class:`bitshares.asset.AssetInfo`)
+        """
+        return cls({"amount": int(satoshis), "asset": asset}, **kwargs)
+
+    @staticmethod
+    def to_satoshis(value, precision):
+        """
+        Convert a decimal value into integer base units.
+
+        :param value: Decimal value (``int``, ``float``, ``str``,
+            :class:`decimal.Decimal` or :class:`fractions.Fraction`)
+        :param int precision: Precision of the asset
+        """
+        return round(_fraction(value) * 10 ** precision)
+
+    def _set(self, satoshis, asset):
+        self.satoshis = satoshis
+        dict.__init__(
+            self,
+            amount=satoshis / 10 ** asset.precision,
+            symbol=asset.symbol,
+            asset=asset,
+        )
+        return self
+
+    def _new(self, satoshis, asset=None):
+        a = self.__class__.__new__(self.__class__)
+        BlockchainInstance.__init__(a, blockchain_instance=self.blockchain)
+        a.define_classes()
+        return a._set(satoshis, asset or self["asset"])
+
+    def _other_satoshis(self, other):
+        if isinstance(other, Amount):
+            assert other["asset"]["id"] == self["asset"]["id"]
+            if isinstance(other, IntegerAmount):
+                return other.satoshis
+            return int(other)
+        return self.to_satoshis(other or 0, self["asset"].precision)
+
+    def copy(self):
+        """Copy the instance"""
+        return self._new(self.satoshis)
+
+    def compact(self):
+        return self.copy()
+
+    def json(self):
+        return {"amount": self.satoshis, "asset_id": self["asset"]["id"]}
+
+    @property
+    def decimal(self):
+        """Returns the exact value as :class:`decimal.Decimal`"""
+        return Decimal(self.satoshis).scaleb(-self["asset"].precision)
+
+    def __str__(self):
+        return "{:,.{prec}f} {}".format(
+            self.decimal, self["symbol"], prec=self["asset"].precision
+        )
+
+    def __int__(self):
+        return self.satoshis
+
+    def convert(self, price, asset=None):
+        """
+        Convert this amount into another asset.
+
+        :param price: Either a :class:`bitshares.price.Price` whose quote is
+            the asset of this amount, or a number denoted in ``asset`` per
+            unit of this amount's asset
+        :param asset: Target asset (required if ``price`` is a number)
+        :returns: Instance of :class:`IntegerAmount` in the target asset
+        """
+        if isinstance(price, GraphenePrice):
+            assert price["quote"]["asset"]["id"] == self["asset"]["id"]
+            target = AssetInfo.from_asset(price["base"]["asset"])
+            rate = Fraction(int(price["base"]), int(price["quote"]))
+        else:
+            target = AssetInfo.load(asset, self.blockchain)
+            rate = _fraction(price) * 10 ** target.precision
+            rate /= 10 ** self["asset"].precision
+        return self._new(round(self.satoshis * rate), target)
+
+    def __neg__(self):
+        return self._new(-self.satoshis)
+
+    def __abs__(self):
+        return self._new(abs(self.satoshis))
+
+    def __add__(self, other):
+        return self._new(self.satoshis + self._other_satoshis(other))
+
+    def __sub__(self, other):
+        return self._new(self.satoshis - self._other_satoshis(other))
+
+    def __mul__(self, other):
+        if isinstance(other, GraphenePrice):
+            return self.convert(other)
+        if isinstance(other, Amount):
+            raise TypeError("Cannot multiply two amounts")
+        return self._new(round(self.satoshis * _fraction(other)))
+
+    def __div__(self, other):
+        if isinstance(other, GraphenePrice):
+            return self.convert(other.copy().invert())
+        if isinstance(other, Amount):
+            return self.price_class(self, other)
+        return self._new(round(self.satoshis / _fraction(other)))
+
+    def __floordiv__(self, other):
+        if isinstance(other, Amount):
+            return self.price_class(self, other)
+        return self._new(math.floor(self.satoshis / _fraction(other)))
+
+    def __mod__(self, other):
+        return self._new(self.satoshis % self._other_satoshis(other))
+
+    def __pow__(self, other):
+        return NotImplemented
+
+    def __iadd__(self, other):
+        return self._set(self.satoshis + self._other_satoshis(other), self["asset"])
+
+    def __isub__(self, other):
+        return self._set(self.satoshis - self._other_satoshis(other), self["asset"])
+
+    def __imul__(self, other):
+        return self._set(round(self.satoshis * _fraction(other)), self["asset"])
+
+    def __idiv__(self, other):
+        return self._set(round(self.satoshis / _fraction(other)), self["asset"])
+
+    def __ifloordiv__(self, other):
+        return self._set(math.floor(self.satoshis / _fraction(other)), self["asset"])
+
+    def __imod__(self, other):
+        return self._set(self.satoshis % self._other_satoshis(other), self["asset"])
+
+    def __ipow__(self, other):
+        return NotImplemented
+
+    def __lt__(self, other):
+        return self.satoshis < self._other_satoshis(other)
+
+    def __le__(self, other):
+        return self.satoshis <= self._other_satoshis(other)
+
+    def __eq__(self, other):
+        return self.satoshis == self._other_satoshis(other)
+
+    def __ne__(self, other):
+        return self.satoshis != self._other_satoshis(other)
+
+    def __ge__(self, other):
+        return self.satoshis >= self._other_satoshis(other)
+
+    def __gt__(self, other):
+        return self.satoshis > self._other_satoshis(other)
+
+    __repr__ = __str__
+    __truediv__ = __div__
+    __itruediv__ = __idiv__
+    __rmul__ = __mul__
+    __radd__ = __add__
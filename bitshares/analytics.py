@@ -0,0 +1,269 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+
+from .amount import IntegerAmount
+from .asset import AssetInfo
+from .exceptions import InvalidAssetException
+from .instance import BlockchainInstance
+from .market import Market
+from .vector import PriceArray
+
+
+class OrderBookSnapshot(BlockchainInstance):
+    """
+    Depth, VWAP and slippage analytics on an order book snapshot.
+
+    The snapshot is built straight from the result of ``get_order_book``
+    into :class:`bitshares.vector.PriceArray` columns, i.e. no
+    :class:`bitshares.price.Order` or :class:`bitshares.amount.Amount` is
+    constructed per order. All amounts are in integer base units.
+
+    :param dict orders: Result of ``get_order_book(base, quote, limit)``
+    :param base: Base asset of the market
+    :param quote: Quote asset of the market
+    :param bitshares.bitshares.BitShares blockchain_instance: BitShares instance
+
+    .. code-block:: python
+
+        from bitshares.analytics import OrderBookSnapshot
+
+        book = OrderBookSnapshot.from_market("USD:BTS", limit=50)
+        book.vwap(100)                  # avg. price to buy 100 USD
+        book.vwap(100, side="bids")     # avg. price to sell 100 USD
+        book.slippage([10, 100, 1000])  # vectorized over sizes
+        book.depth_within(0.02)         # USD within 2% of the mid price
+
+    Amounts can be given as number (in units of quote), as
+    :class:`bitshares.amount.Amount` of either asset of the market or as
+    array of numbers. ``asks`` are consumed when buying and ``bids`` when
+    selling quote. Sizes that exceed the snapshot yield ``nan``.
+
+    .. note:: This module requires NumPy (``pip install bitshares[vector]``)
+    """
+
+    def __init__(self, orders, base, quote, **kwargs):
+        BlockchainInstance.__init__(self, **kwargs)
+        self.base = AssetInfo.load(base, self.blockchain)
+        self.quote = AssetInfo.load(quote, self.blockchain)
+        book = PriceArray.from_order_book(
+            orders, self.base, self.quote, blockchain_instance=self.blockchain
+        )
+        self.bids = book["bids"]
+        self.asks = book["asks"]
+        self._cumulative = {}
+
+    @classmethod
+    def from_market(cls, market, limit=50, **kwargs):
+        """
+        Obtain a snapshot of a market.
+
+        :param bitshares.market.Market market: Market (or market string)
+        :param int limit: Number of levels per side (max. 50)
+        """
+        if not isinstance(market, Market):
+            market = Market(market, **kwargs)
+        orders = market.blockchain.rpc.get_order_book(
+            market["base"]["id"], market["quote"]["id"], limit
+        )
+        return cls(
+            orders,
+            market["base"],
+            market["quote"],
+            blockchain_instance=market.blockchain,
+        )
+
+    def _side(self, side):
+        if side not in ("bids", "asks"):
+            raise ValueError("side needs to be 'bids' or 'asks'")
+        return getattr(self, side)
+
+    def _cumsum(self, side):
+        # Cumulative base and quote amounts of the levels
+        if side not in self._cumulative:
+            levels = self._side(side)
+            self._cumulative[side] = (
+                np.cumsum(levels.base.values),
+                np.cumsum(levels.quote.values),
+            )
+        return self._cumulative[side]
+
+    def _target(self, amount):
+        """Returns ``(satoshis, is_quote)`` of an amount"""
+        if isinstance(amount, dict) and "asset" in amount:
+            satoshis = int(IntegerAmount(amount, blockchain_instance=self.blockchain))
+            if amount["asset"]["id"] == self.quote.id:
+                return np.asarray(satoshis), True
+            if amount["asset"]["id"] == self.base.id:
+                return np.asarray(satoshis), False
+            raise InvalidAssetException
+        values = np.asarray(amount, dtype=np.float64)
+        return np.rint(values * 10 ** self.quote.precision), True
+
+    def _price(self, base, quote):
+        """Convert satoshi ratios into prices denoted in base/quote"""
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return (base / 10 ** self.base.precision) / (
+                quote / 10 ** self.quote.precision
+            )
+
+    def _fill(self, amount, side):
+        """Returns the base and quote satoshis to fill ``amount`` and the
+        index of the last level that is touched"""
+        target, is_quote = self._target(amount)
+        cum_base, cum_quote = self._cumsum(side)
+        levels = self._side(side)
+        if is_quote:
+            cum_x, cum_y = cum_quote, cum_base
+            x, y = levels.quote.values, levels.base.values
+        else:
+            cum_x, cum_y = cum_base, cum_quote
+            x, y = levels.base.values, levels.quote.values
+
+        # First level at which the cumulative amount reaches the target
+        index = np.searchsorted(cum_x, target, side="left")
+        exhausted = index >= len(x)
+        last = np.minimum(index, max(len(x) - 1, 0))
+        if not len(x):
+            nan = np.full(np.shape(target), np.nan)
+            return nan, nan, last, exhausted
+
+        prev_x = np.where(last > 0, cum_x[last - 1], 0)
+        prev_y = np.where(last > 0, cum_y[last - 1], 0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            filled_y = prev_y + (target - prev_x) * y[last] / x[last]
+        filled_y = np.where(exhausted, np.nan, filled_y)
+        target = np.where(exhausted, np.nan, target)
+        if is_quote:
+            return filled_y, target, last, exhausted
+        return target, filled_y, last, exhausted
+
+    def best(self, side="asks"):
+        """Returns the best price of a side (``nan`` if empty)"""
+        levels = self._side(side)
+        if not len(levels):
+            return np.nan
+        return float(levels.price[0])
+
+    def mid(self):
+        """Returns the mid price between best bid and best ask"""
+        return (self.best("bids") + self.best("asks")) / 2
+
+    def spread(self):
+        """Returns the difference between best ask and best bid"""
+        return self.best("asks") - self.best("bids")
+
+    def relative_spread(self):
+        """Returns the spread relative to the mid price"""
+        return self.spread() / self.mid()
+
+    def depth(self, side="asks"):
+        """
+        Returns the cumulative depth curve of one side.
+
+        :param str side: ``bids`` or ``asks``
+        :returns: tuple of ``float64`` arrays ``(price, quote, base)`` with
+            the price of each level and the accumulated amounts up to
+            (including) this level
+        """
+        cum_base, cum_quote = self._cumsum(side)
+        return (
+            self._side(side).price,
+            cum_quote / 10 ** self.quote.precision,
+            cum_base / 10 ** self.base.precision,
+        )
+
+    def depth_within(self, fraction, side="asks"):
+        """
+        Returns the amount of quote available within a price range around
+        the mid price.
+
+        :param float fraction: Range relative to mid price (e.g. ``0.02``)
+        :param str side: ``bids`` or ``asks``
+        :returns: :class:`bitshares.amount.IntegerAmount` of quote
+        """
+        mid = self.mid()
+        levels = self._side(side)
+        if side == "asks":
+            mask = levels.price <= mid * (1 + fraction)
+        else:
+            mask = levels.price >= mid * (1 - fraction)
+        return levels.quote[mask].sum()
+
+    def vwap(self, amount, side="asks"):
+        """
+        Returns the volume weighted average price to fill an amount.
+
+        :param amount: Amount to buy (``asks``) or sell (``bids``)
+        :param str side: ``bids`` or ``asks``
+        :returns: ``float`` (or array for array input) denoted in base/quote
+        """
+        base, quote, _, _ = self._fill(amount, side)
+        return self._price(base, quote)[()]
+
+    def cost(self, amount, side="asks"):
+        """
+        Returns the amount of the other asset required (``asks``) or
+        received (``bids``) to fill an amount.
+
+        :param amount: Amount to buy (``asks``) or sell (``bids``)
+        :param str side: ``bids`` or ``asks``
+        :returns: ``float`` (or array) in units of the other asset, i.e.
+            base if the amount is given in quote
+        """
+        _, is_quote = self._target(amount)
+        base, quote, _, _ = self._fill(amount, side)
+        if is_quote:
+            return (base / 10 ** self.base.precision)[()]
+        return (quote / 10 ** self.quote.precision)[()]
+
+    def slippage(self, amount, side="asks"):
+        """
+        Returns by how much the average price of a fill is worse than the
+        best price, relative to the best price.
+
+        :param amount: Amount to buy (``asks``) or sell (``bids``)
+        :param str side: ``bids`` or ``asks``
+        """
+        best = self.best(side)
+        vwap = self.vwap(amount, side)
+        if side == "asks":
+            return (vwap - best) / best
+        return (best - vwap) / best
+
+    def price_impact(self, amount, side="asks"):
+        """
+        Returns how far the price of the last level touched by a fill lies
+        from the mid price, relative to the mid price.
+
+        :param amount: Amount to buy (``asks``) or sell (``bids``)
+        :param str side: ``bids`` or ``asks``
+        """
+        _, _, last, exhausted = self._fill(amount, side)
+        levels = self._side(side)
+        if not len(levels):
+            return np.nan
+        mid = self.mid()
+        impact = np.abs(levels.price[last] - mid) / mid
+        return np.where(exhausted, np.nan, impact)[()]
+
+
+def spread_statistics(snapshots):
+    """
+    Returns statistics of the relative spreads of several snapshots (e.g.
+    of many markets or of one market over time).
+
+    :param list snapshots: Instances of :class:`OrderBookSnapshot`
+    :returns: dict with ``mean``, ``median``, ``std``, ``min`` and ``max``
+        (empty books are ignored)
+    """
+    spreads = np.array([s.relative_spread() for s in snapshots], dtype=np.float64)
+    spreads = spreads[~np.isnan(spreads)]
+    if not len(spreads):
+        return {}
+    return {
+        "mean": float(np.mean(spreads)),
+        "median": float(np.median(spreads)),
+        "std": float(np.std(spreads)),
+        "min": float(np.min(spreads)),
+        "max": float(np.max(spreads)),
+    }
@@ -8,7 +8,7 @@ from bitsharesbase.asset_permissions import (
     test_permissions,
     todict,
 )
-from .blockchainobject import BlockchainObject
+from .blockchainobject import BlockchainObject, NegativeCaching
 from .exceptions import AssetDoesNotExistsException
 from .instance import BlockchainInstance
 
@@ -16,7 +16,7 @@ from graphenecommon.asset import Asset as GrapheneAsset
 
 
 @BlockchainInstance.inject
-class Asset(GrapheneAsset):
+class Asset(NegativeCaching, GrapheneAsset):
     """
     Deals with Assets of the network.
 
@@ -30,7 +30,9 @@ class Asset(GrapheneAsset):
 
     .. note:: This class comes with its own caching function to reduce the
               load on the API server. Instances of this class can be
-              refreshed with ``Asset.refresh()``.
+              refreshed with ``Asset.refresh()``. Lookups of non-existing
+              assets are remembered for a short period of time (see
+              :func:`bitshares.blockchainobject.NegativeCacheMixin.set_negative_cache_expiration`).
     """
 
     def define_classes(self):
@@ -47,6 +49,15 @@ class Asset(GrapheneAsset):
         except Exception:
             self["description"] = self["options"]["description"]
 
+    @property
+    def info(self):
+        """
+        Compact descriptor of this asset.
+
+        :returns: Interned instance of :class:`bitshares.asset.AssetInfo`
+        """
+        return AssetInfo(self["id"], self["symbol"], self["precision"])
+
     @property
     def market_fee_percent(self):
         return self["options"]["market_fee_percent"] / 100 / 100
@@ -142,6 +153,26 @@ class Asset(GrapheneAsset):
             )
         return r
 
+    def simulate_settlement(self, prices, limit=300, book=None):
+        """
+        Simulate margin calls and force settlements for hypothetical
+        settlement prices.
+
+        :param prices: Settlement prices (floats denoted in backing asset
+            per this asset)
+        :param int limit: Number of call and settle orders to load
+        :param bitshares.orderbook.LocalOrderBook book: Order book of this
+            asset against its backing asset (optional)
+        :returns: dict of arrays, see
+            :meth:`bitshares.settlement.SettlementSimulation.run`
+        """
+        from .settlement import SettlementSimulation
+
+        simulation = SettlementSimulation(
+            self, limit=limit, book=book, blockchain_instance=self.blockchain
+        )
+        return simulation.run(prices)
+
     @property
     def settlements(self):
         return self.get_settle_orders(10)
@@ -622,3 +653,110 @@ class Asset(GrapheneAsset):
             }
         )
         return self.blockchain.finalizeOp(op, self["issuer"], "active", **kwargs)
+
+
+class AssetInfo:
+    """
+    Immutable, compact description of an asset consisting of ``id``,
+    ``symbol`` and ``precision`` only.
+
+    Instances are interned, i.e. creating an ``AssetInfo`` for the same asset
+    twice returns the very same object. This allows
+    :class:`bitshares.amount.Amount` and :class:`bitshares.price.Price` to
+    carry this descriptor instead of a full :class:`Asset` which keeps them
+    small and makes comparisons cheap. The full asset is only loaded when
+    calling :func:`resolve`.
+
+    :param str asset_id: Object id of the asset (e.g. ``1.3.0``)
+    :param str symbol: Symbol of the asset
+    :param int precision: Precision of the asset
+
+    The descriptor can be read like an asset, i.e. ``info["symbol"]`` works
+    for the keys ``id``, ``symbol`` and ``precision``.
+
+    .. code-block:: python
+
+        from bitshares.asset import Asset, AssetInfo
+        info = Asset("USD").info
+        info is AssetInfo("1.3.121", "USD", 4)  # True
+    """
+
+    __slots__ = ("id", "symbol", "precision")
+
+    _fields = ("id", "symbol", "precision")
+    _interned = {}
+
+    def __new__(cls, asset_id, symbol, precision):
+        precision = int(precision)
+        key = (asset_id, symbol, precision)
+        info = cls._interned.get(key)
+        if info is None:
+            info = object.__new__(cls)
+            object.__setattr__(info, "id", asset_id)
+            object.__setattr__(info, "symbol", symbol)
+            object.__setattr__(info, "precision", precision)
+            info = cls._interned.setdefault(key, info)
+        return info
+
+    @classmethod
+    def from_asset(cls, asset):
+        """Obtain the descriptor for an asset (or asset-like dict)"""
+        if isinstance(asset, cls):
+            return asset
+        return cls(asset["id"], asset["symbol"], asset["precision"])
+
+    @classmethod
+    def load(cls, asset, blockchain_instance=None):
+        """Obtain the descriptor for an asset given as descriptor,
+        asset-like dict or symbol/id (loaded as :class:`Asset`)"""
+        if isinstance(asset, cls):
+            return asset
+        if isinstance(asset, dict) and "precision" in asset:
+            return cls.from_asset(asset)
+        return Asset(asset, blockchain_instance=blockchain_instance).info
+
+    def __setattr__(self, key, value):
+        raise AttributeError("AssetInfo is immutable")
+
+    def __delattr__(self, key):
+        raise AttributeError("AssetInfo is immutable")
+
+    def __getitem__(self, key):
+        if key in self._fields:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __contains__(self, key):
+        return key in self._fields
+
+    def get(self, key, default=None):
+        if key in self:
+            return self[key]
+        return default
+
+    def __eq__(self, other):
+        if isinstance(other, AssetInfo):
+            return self is other or self.id == other.id
+        if isinstance(other, dict):
+            return self.id == other.get("id")
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(self.id)
+
+    def __bool__(self):
+        return True
+
+    def __reduce__(self):
+        return (AssetInfo, (self.id, self.symbol, self.precision))
+
+    def copy(self):
+        """Instances are immutable, hence no copy is required"""
+        return self
+
+    def resolve(self, **kwargs):
+        """Load the full :class:`Asset` for this descriptor"""
+        return Asset(self.id, **kwargs)
+
+    def __repr__(self):
+        return "<AssetInfo {} {} ({})>".format(self.id, self.symbol, self.precision)
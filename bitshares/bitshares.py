@@ -9,12 +9,18 @@ from bitsharesapi.bitsharesnoderpc import BitSharesNodeRPC
 from bitsharesbase import operations
 from bitsharesbase.account import PublicKey
 from bitsharesbase.asset_permissions import asset_permissions, toint
+from bitsharesbase.signedtransactions import Signed_Transaction
+from bitsharesbase.verifier import SignatureVerifier
 
-from .account import Account
+from .account import Account, FillHistory
 from .amount import Amount
 from .asset import Asset
 from .committee import Committee
-from .exceptions import AccountExistsException, KeyAlreadyInStoreException
+from .exceptions import (
+    AccountExistsException,
+    KeyAlreadyInStoreException,
+    MissingKeyError,
+)
 from .instance import set_shared_blockchain_instance, shared_blockchain_instance
 from .price import Price
 from .storage import get_default_config_store
@@ -124,6 +130,98 @@ class BitShares(AbstractGrapheneChain):
         self.transactionbuilder_class = TransactionBuilder
         self.blockchainobject_class = BlockchainObject
 
+    def clear_cache(self):
+        """Clear the object caches (and fill histories of accounts) of the
+        chain this instance is connected to."""
+        chain_id = self.blockchainobject_class.chain_id_of(self)
+        self.blockchainobject_class.clear_chain_caches(chain_id=chain_id)
+        FillHistory.clear(chain_id=chain_id)
+
+    # -------------------------------------------------------------------------
+    # Batch signing
+    # -------------------------------------------------------------------------
+    def _batch_signing_keys(self, tx, wifs):
+        """Private keys to sign a transaction of a batch with: ``wifs`` and
+        the keys of the wallet listed in ``missing_signatures``"""
+        keys = list(wifs)
+        for pub in tx.get("missing_signatures", []):
+            keys.append(self.wallet.getPrivateKeyForPublicKey(pub))
+        return keys
+
+    def _sign_batch(self, transactions, keys, max_workers):
+        if not all(keys):
+            raise MissingKeyError
+        return Signed_Transaction.sign_many(
+            transactions, keys, chain=self.rpc.chain_params, max_workers=max_workers
+        )
+
+    def sign_batch(self, txs, wifs=[], max_workers=None):
+        """
+        Sign many transactions in parallel (see :meth:`sign`).
+
+        The transactions are signed by a pool of processes (see
+        :meth:`bitsharesbase.signedtransactions.Signed_Transaction.sign_many`).
+
+        :param list txs: Transactions as dicts (e.g. unsigned transactions
+            with ``missing_signatures``) or instances of
+            :class:`bitshares.transactionbuilder.TransactionBuilder` (with
+            their signers)
+        :param list wifs: Additional private keys to sign every transaction
+            with
+        :param int max_workers: Number of processes (defaults to the number
+            of CPUs)
+        :returns: list of the signed transactions in order, ready to be
+            broadcast (see :meth:`broadcast`)
+
+        .. code-block:: python
+
+            txs = [builder.json() for builder in builders]
+            for tx in bitshares.sign_batch(txs, wifs=[wif]):
+                bitshares.broadcast(tx)
+        """
+        transactions, keys = [], []
+        for tx in txs:
+            tx_keys = []
+            if isinstance(tx, self.transactionbuilder_class):
+                tx_keys = list(tx.wifs)
+                tx = tx.json()
+            transactions.append(tx)
+            keys.append(tx_keys + self._batch_signing_keys(tx, wifs))
+        return self._sign_batch(transactions, keys, max_workers)
+
+    # -------------------------------------------------------------------------
+    # Batch verification
+    # -------------------------------------------------------------------------
+    @property
+    def verifier(self):
+        """Signature verifier of this instance (see
+        :class:`bitsharesbase.verifier.SignatureVerifier`), its cache of
+        recovered keys is shared by all batches while the processes only
+        live for a batch"""
+        if getattr(self, "_verifier", None) is None:
+            self._verifier = SignatureVerifier(prefix=self.prefix)
+        return self._verifier
+
+    def verify_batch(self, txs):
+        """
+        Recover the public keys that signed many transactions.
+
+        The keys are recovered by a pool of processes and cached by
+        signature (see :attr:`verifier`), e.g. to audit the pending
+        transactions of :class:`bitshares.notify.Notify` (``on_tx``).
+
+        :param list txs: Signed transactions as dicts
+        :returns: list with the public keys of every transaction, one per
+            signature (``None`` for an invalid signature)
+
+        .. code-block:: python
+
+            for tx, keys in zip(txs, bitshares.verify_batch(txs)):
+                if None in keys:
+                    print("Invalid signature in", tx)
+        """
+        return self.verifier.verify_transactions(txs, chain=self.rpc.chain_params)
+
     # -------------------------------------------------------------------------
     # Simple Transfer
     # -------------------------------------------------------------------------
@@ -1,4 +1,15 @@
 # -*- coding: utf-8 -*-
+from .exceptions import (
+    AccountDoesNotExistsException,
+    AssetDoesNotExistsException,
+    BlockDoesNotExistsException,
+    CommitteeMemberDoesNotExistsException,
+    HtlcDoesNotExistException,
+    ProposalDoesNotExistException,
+    VestingBalanceDoesNotExistsException,
+    WitnessDoesNotExistsException,
+    WorkerDoesNotExistsException,
+)
 from .instance import BlockchainInstance
 from graphenecommon.blockchainobject import (
     BlockchainObject as GrapheneBlockchainObject,
@@ -7,8 +18,215 @@ from graphenecommon.blockchainobject import (
 )
 
 
+class NegativeObjectCache(ObjectCache):
+    """
+    Cache that remembers identifiers which the backend reported as non-existing.
+
+    Entries expire after ``default_expiration`` seconds so that objects that
+    are created later on become visible quickly. The cache counts ``hits``
+    (lookups that were answered without an RPC) and ``stores`` (misses that
+    have been recorded).
+    """
+
+    def __init__(self, default_expiration=10, max_length=1000):
+        ObjectCache.__init__(
+            self, default_expiration=default_expiration, max_length=max_length
+        )
+        self.hits = 0
+        self.stores = 0
+
+    def set_expiration(self, expiration):
+        """Set new expiration time in seconds (``0`` disables the cache)"""
+        self.default_expiration = expiration
+        self.max_age = expiration
+
+    def stats(self):
+        """Return the counters of this cache"""
+        return {"hits": self.hits, "stores": self.stores, "entries": len(self)}
+
+
+class ChainScopedCaching:
+    """
+    Mixin that keeps a separate object cache per chain.
+
+    The regular cache of blockchain objects is a class attribute and thus
+    shared by all instances of :class:`bitshares.bitshares.BitShares` in a
+    process. This mixin looks up the cache by the chain id of the
+    connected node (``BitShares.rpc.chain_params``, which resolves the
+    network through :attr:`bitsharesbase.chains.known_chains`) so that
+    several instances that talk to different chains can keep independent
+    caches. Offline instances share the cache stored under ``None``.
+    """
+
+    _chain_caches = {}
+    _chain_cache_class = ObjectCache
+    _chain_cache_args = ()
+    _chain_cache_kwargs = {}
+
+    @staticmethod
+    def chain_id_of(blockchain):
+        """Return the chain id of a blockchain instance (or ``None``)"""
+        rpc = getattr(blockchain, "rpc", None)
+        if not rpc:
+            return None
+        try:
+            return rpc.chain_params["chain_id"]
+        except (AttributeError, KeyError, TypeError):
+            # Not (yet) connected
+            return None
+
+    @classmethod
+    def chain_cache(cls, chain_id=None):
+        """
+        Return the object cache for a chain.
+
+        :param str chain_id: Chain id (``None`` for offline instances)
+        """
+        caches = cls._chain_caches
+        if chain_id not in caches:
+            caches[chain_id] = ChainScopedCaching._chain_cache_class(
+                *ChainScopedCaching._chain_cache_args,
+                **ChainScopedCaching._chain_cache_kwargs
+            )
+        return caches[chain_id]
+
+    @staticmethod
+    def _cache_owners():
+        """Classes that hold caches of their own (see :meth:`clear_cache`)"""
+        classes = [ChainScopedCaching]
+        for klass in classes:
+            classes.extend(klass.__subclasses__())
+        return [klass for klass in classes if "_chain_caches" in vars(klass)]
+
+    @staticmethod
+    def set_cache_store(klass, *args, **kwargs):
+        """Use ``klass(*args, **kwargs)`` for the object cache of each chain"""
+        ChainScopedCaching._chain_cache_class = klass
+        ChainScopedCaching._chain_cache_args = args
+        ChainScopedCaching._chain_cache_kwargs = kwargs
+        ChainScopedCaching.clear_chain_caches()
+
+    @classmethod
+    def clear_cache(cls, chain_id=False):
+        """
+        Clear/Reset the cache of this class.
+
+        As in graphenecommon, the class gets a cache of its own, other
+        classes keep theirs (see :meth:`clear_chain_caches`).
+
+        :param str chain_id: Only clear the cache of this chain (defaults to
+            clearing the caches of all chains)
+        """
+        caches = {}
+        if chain_id is not False:
+            caches = dict(cls._chain_caches)
+            caches.pop(chain_id, None)
+        cls._chain_caches = caches
+
+    @staticmethod
+    def clear_chain_caches(chain_id=False):
+        """
+        Clear the caches of all classes.
+
+        :param str chain_id: Only clear the caches of this chain (defaults
+            to clearing the caches of all chains)
+        """
+        for klass in ChainScopedCaching._cache_owners():
+            if chain_id is False:
+                klass._chain_caches.clear()
+            else:
+                klass._chain_caches.pop(chain_id, None)
+
+    @property
+    def _cache(self):
+        return self.chain_cache(self.chain_id_of(self.blockchain))
+
+
+class NegativeCacheMixin(ChainScopedCaching):
+    """
+    Mixin for blockchain objects that remembers lookups of non-existing
+    objects for a short period of time.
+
+    Subsequent lookups of the same identifier raise the same exception
+    without querying the API node. Only exceptions listed in
+    ``missing_exceptions`` are cached, errors of the connection are not.
+    Like the object cache, misses are remembered per chain.
+
+    The store is shared by the synchronous and the asyncio classes.
+    """
+
+    missing_exceptions = (
+        AccountDoesNotExistsException,
+        AssetDoesNotExistsException,
+        BlockDoesNotExistsException,
+        CommitteeMemberDoesNotExistsException,
+        HtlcDoesNotExistException,
+        ProposalDoesNotExistException,
+        VestingBalanceDoesNotExistsException,
+        WitnessDoesNotExistsException,
+        WorkerDoesNotExistsException,
+    )
+    _negative_cache = NegativeObjectCache()
+
+    @staticmethod
+    def set_negative_cache_expiration(expiration):
+        """
+        Set the time (in seconds) for how long misses are remembered.
+
+        :param int expiration: Expiration in seconds, ``0`` disables negative
+            caching
+        """
+        NegativeCacheMixin._negative_cache.set_expiration(expiration)
+
+    @staticmethod
+    def negative_cache_stats():
+        """Return hits/stores counters of the negative cache"""
+        return NegativeCacheMixin._negative_cache.stats()
+
+    @staticmethod
+    def clear_negative_cache():
+        """Forget all remembered misses and reset the counters"""
+        cache = NegativeCacheMixin._negative_cache
+        NegativeCacheMixin._negative_cache = NegativeObjectCache(
+            default_expiration=cache.get_expiration()
+        )
+
+    def _negative_cache_key(self):
+        return "{}-{}-{}".format(
+            self.chain_id_of(self.blockchain),
+            self.__class__.__name__,
+            self.identifier,
+        )
+
+    def _raise_if_known_missing(self):
+        cache = NegativeCacheMixin._negative_cache
+        exception = cache.get(self._negative_cache_key())
+        if exception is not None:
+            cache.hits += 1
+            raise exception(self.identifier)
+
+    def _remember_missing(self, exception):
+        cache = NegativeCacheMixin._negative_cache
+        if not cache.get_expiration():
+            return
+        cache[self._negative_cache_key()] = exception.__class__
+        cache.stores += 1
+
+
+class NegativeCaching(NegativeCacheMixin):
+    """Negative caching for synchronous :func:`refresh` implementations."""
+
+    def refresh(self, *args, **kwargs):
+        self._raise_if_known_missing()
+        try:
+            return super().refresh(*args, **kwargs)
+        except self.missing_exceptions as e:
+            self._remember_missing(e)
+            raise
+
+
 @BlockchainInstance.inject
-class BlockchainObject(GrapheneBlockchainObject):
+class BlockchainObject(NegativeCaching, GrapheneBlockchainObject):
     pass
 
 
@@ -0,0 +1,253 @@
+# -*- coding: utf-8 -*-
+import calendar
+import logging
+
+from collections import OrderedDict
+from datetime import datetime
+
+from .amount import IntegerAmount
+from .asset import AssetInfo
+from .instance import BlockchainInstance
+from .price import FilledOrder
+from .utils import formatTimeString
+
+
+log = logging.getLogger(__name__)
+
+
+def bucket_open(time, bucket):
+    """
+    Returns the open time of the bucket that ``time`` falls into.
+
+    :param datetime time: Time (UTC)
+    :param int bucket: Bucket size in seconds
+    """
+    timestamp = calendar.timegm(time.utctimetuple())
+    return datetime.utcfromtimestamp(timestamp - timestamp % bucket)
+
+
+class CandleAggregator(BlockchainInstance):
+    """
+    Incremental OHLCV aggregation for a market.
+
+    Candles are dictionaries with the keys ``time`` (open time, UTC),
+    ``open``, ``high``, ``low``, ``close`` (prices denoted in base/quote),
+    ``base_volume`` and ``quote_volume`` (instances of
+    :class:`bitshares.amount.IntegerAmount`).
+
+    The aggregator is seeded with candles (e.g. from
+    :meth:`bitshares.market.Market.candles`) and afterwards updated with
+    fills, i.e. :class:`bitshares.price.FilledOrder` from
+    :class:`bitshares.notify.Notify` or rows of
+    :meth:`bitshares.market.Market.trades` with ``raw=True``. Larger
+    buckets are computed locally with :meth:`resample`.
+
+    :param bitshares.market.Market market: Market
+    :param int bucket: Bucket size in seconds
+    :param list candles: Candles to start with
+    :param int maxlen: Maximum number of candles to keep (optional)
+    :param bitshares.notify.Notify notify: Notify instance to subscribe to
+    :param bitshares.bitshares.BitShares blockchain_instance: BitShares instance
+
+    .. code-block:: python
+
+        from bitshares.candles import CandleAggregator
+        from bitshares.market import Market
+        from bitshares.notify import Notify
+
+        market = Market("USD:BTS")
+        notify = Notify(markets=["USD:BTS"])
+        candles = CandleAggregator(
+            market, bucket=60, candles=market.candles(60), notify=notify
+        )
+        notify.listen()
+
+        # from another thread
+        candles.current
+        candles.resample(900)
+
+    .. note:: Each match is reported once for each of the two orders. Fills
+              that carry ``is_maker`` are only counted for the maker side.
+    """
+
+    def __init__(
+        self, market, bucket=60, candles=None, maxlen=None, notify=None, **kwargs
+    ):
+        BlockchainInstance.__init__(self, **kwargs)
+        self.base = AssetInfo.from_asset(market["base"])
+        self.quote = AssetInfo.from_asset(market["quote"])
+        self.bucket = bucket
+        self.maxlen = maxlen
+        self.candles = OrderedDict()
+        for candle in candles or []:
+            self.add_candle(candle)
+        if notify is not None:
+            notify.on_market += self.apply
+
+    def _amount(self, satoshis, asset):
+        return IntegerAmount.from_satoshis(
+            satoshis, asset, blockchain_instance=self.blockchain
+        )
+
+    def _price(self, base, quote):
+        return (base / 10 ** self.base.precision) / (quote / 10 ** self.quote.precision)
+
+    def _store(self, candle):
+        time = candle["time"]
+        if self.candles and time < next(reversed(self.candles)):
+            # Keep the candles ordered by time
+            self.candles[time] = candle
+            self.candles = OrderedDict(sorted(self.candles.items()))
+        else:
+            self.candles[time] = candle
+        if self.maxlen and len(self.candles) > self.maxlen:
+            self.candles.popitem(last=False)
+
+    def add_candle(self, candle):
+        """Add (or replace) a candle of size ``bucket``"""
+        self._store(dict(candle))
+
+    def add_trade(self, time, base, quote):
+        """
+        Add a trade to the corresponding candle.
+
+        :param datetime time: Time of the trade (UTC)
+        :param int base: Amount of base in satoshis
+        :param int quote: Amount of quote in satoshis
+        """
+        if not base or not quote:
+            return
+        price = self._price(base, quote)
+        open_time = bucket_open(time, self.bucket)
+        candle = self.candles.get(open_time)
+        if candle is None:
+            self._store(
+                {
+                    "time": open_time,
+                    "open": price,
+                    "high": price,
+                    "low": price,
+                    "close": price,
+                    "base_volume": self._amount(base, self.base),
+                    "quote_volume": self._amount(quote, self.quote),
+                }
+            )
+            return
+        candle["high"] = max(candle["high"], price)
+        candle["low"] = min(candle["low"], price)
+        candle["close"] = price
+        # Volumes may be shared with resampled candles, don't update in place
+        candle["base_volume"] = candle["base_volume"] + self._amount(base, self.base)
+        candle["quote_volume"] = candle["quote_volume"] + self._amount(
+            quote, self.quote
+        )
+
+    def apply(self, update):
+        """
+        Add a fill to the candles. Other market notifications are ignored.
+
+        :param update: Instance of :class:`bitshares.price.FilledOrder`, a
+            fill operation or a trade row of ``get_trade_history``
+        """
+        if "pays" in update and "receives" in update:
+            if not update.get("is_maker", True):
+                return
+            amounts = {
+                a["asset_id"]: int(a["amount"])
+                for a in (update["pays"], update["receives"])
+            }
+            if set(amounts) != {self.base.id, self.quote.id}:
+                return
+            time = update.get("time")
+            if not isinstance(time, datetime):
+                time = formatTimeString(time) if time else datetime.utcnow()
+            self.add_trade(time, amounts[self.base.id], amounts[self.quote.id])
+        elif "date" in update and "value" in update and "amount" in update:
+            self.add_trade(
+                formatTimeString(update["date"]),
+                IntegerAmount.to_satoshis(update["value"], self.base.precision),
+                IntegerAmount.to_satoshis(update["amount"], self.quote.precision),
+            )
+        elif not isinstance(update, FilledOrder):
+            log.debug("Ignoring market update %s" % update)
+
+    @property
+    def current(self):
+        """Returns the latest candle (or ``None``)"""
+        if self.candles:
+            return next(reversed(self.candles.values()))
+
+    def resample(self, bucket):
+        """
+        Aggregate the candles into larger buckets.
+
+        :param int bucket: Bucket size in seconds (multiple of ``bucket``)
+        :returns: list of candles
+        """
+        if bucket % self.bucket:
+            raise ValueError(
+                "Bucket size needs to be a multiple of %d seconds" % self.bucket
+            )
+        result = OrderedDict()
+        for candle in self.candles.values():
+            open_time = bucket_open(candle["time"], bucket)
+            merged = result.get(open_time)
+            if merged is None:
+                merged = result[open_time] = dict(candle, time=open_time)
+                continue
+            merged["high"] = max(merged["high"], candle["high"])
+            merged["low"] = min(merged["low"], candle["low"])
+            merged["close"] = candle["close"]
+            merged["base_volume"] = merged["base_volume"] + candle["base_volume"]
+            merged["quote_volume"] = merged["quote_volume"] + candle["quote_volume"]
+        return list(result.values())
+
+    def from_bucket(self, bucket):
+        """
+        Convert a bucket object of ``get_market_history`` into a candle.
+
+        The node stores buckets ordered by asset id, hence prices are
+        inverted if required.
+        """
+        fields = {
+            name: int(bucket[name])
+            for name in (
+                "open_base",
+                "open_quote",
+                "high_base",
+                "high_quote",
+                "low_base",
+                "low_quote",
+                "close_base",
+                "close_quote",
+                "base_volume",
+                "quote_volume",
+            )
+        }
+        candle = {"time": formatTimeString(bucket["key"]["open"])}
+        if bucket["key"]["base"] == self.base.id:
+            for name in ("open", "high", "low", "close"):
+                candle[name] = self._price(
+                    fields[name + "_base"], fields[name + "_quote"]
+                )
+            base_volume, quote_volume = fields["base_volume"], fields["quote_volume"]
+        else:
+            for name, other in (
+                ("open", "open"),
+                ("high", "low"),
+                ("low", "high"),
+                ("close", "close"),
+            ):
+                candle[name] = self._price(
+                    fields[other + "_quote"], fields[other + "_base"]
+                )
+            base_volume, quote_volume = fields["quote_volume"], fields["base_volume"]
+        candle["base_volume"] = self._amount(base_volume, self.base)
+        candle["quote_volume"] = self._amount(quote_volume, self.quote)
+        return candle
+
+    def __iter__(self):
+        return iter(list(self.candles.values()))
+
+    def __len__(self):
+        return len(self.candles)
@@ -0,0 +1,272 @@
+# -*- coding: utf-8 -*-
+import logging
+
+import numpy as np
+from events import Events
+
+from .asset import Asset
+from .instance import BlockchainInstance
+from .vector import AmountArray
+
+log = logging.getLogger(__name__)
+
+#: Position states
+OK, MARGIN_CALL, UNDERCOLLATERALIZED = 0, 1, 2
+
+
+class CollateralMonitor(Events, BlockchainInstance):
+    """
+    Collateral ratios and call prices of the debt positions of a bitasset.
+
+    The call orders are held as NumPy columns (collateral, debt and target
+    collateral ratio), so that the collateral ratios and call prices of all
+    positions are recomputed in one vectorized pass whenever the price feed
+    changes. Positions that cross a threshold are reported via events:
+
+    * ``on_margin_call``: the collateral ratio fell below the maintenance
+      collateral ratio (MCR)
+    * ``on_undercollateralized``: the collateral ratio fell below the
+      maximum short squeeze ratio (MSSR), i.e. the collateral does not
+      cover the debt at the squeeze price
+    * ``on_recovered``: the collateral ratio rose above the MCR again
+
+    Each callback is called with a list of positions (see :meth:`positions`).
+
+    :param bitshares.asset.Asset asset: Bitasset to monitor
+    :param int limit: Number of call orders to load (at most the node's
+        ``api_limit_get_call_orders``, 300 by default)
+    :param fnt on_margin_call: Callback for positions below MCR
+    :param fnt on_undercollateralized: Callback for positions below MSSR
+    :param fnt on_recovered: Callback for positions back above MCR
+    :param bitshares.bitshares.BitShares blockchain_instance: BitShares instance
+
+    .. code-block:: python
+
+        from bitshares.collateral import CollateralMonitor
+        from bitshares.notify import Notify
+
+        monitor = CollateralMonitor("USD", on_margin_call=print)
+        monitor.at_risk(2.0)        # positions with a ratio below 2.0
+
+        # Follow the feed
+        notify = Notify(objects=[monitor.bitasset_id], on_object=monitor.apply)
+        notify.listen()
+
+    The node returns the call orders ordered by collateralization, hence
+    the positions that are closest to a margin call are loaded first.
+    ``complete`` tells whether all call orders of the asset have been
+    loaded.
+
+    .. note:: This module requires NumPy (``pip install bitshares[vector]``)
+    """
+
+    __events__ = ["on_margin_call", "on_undercollateralized", "on_recovered"]
+
+    def __init__(
+        self,
+        asset,
+        limit=300,
+        on_margin_call=None,
+        on_undercollateralized=None,
+        on_recovered=None,
+        **kwargs
+    ):
+        Events.__init__(self)
+        BlockchainInstance.__init__(self, **kwargs)
+        if on_margin_call:
+            self.on_margin_call += on_margin_call
+        if on_undercollateralized:
+            self.on_undercollateralized += on_undercollateralized
+        if on_recovered:
+            self.on_recovered += on_recovered
+
+        self.asset = Asset(asset, blockchain_instance=self.blockchain)
+        if not self.asset.is_bitasset:
+            raise ValueError("%s is not a bitasset!" % self.asset["symbol"])
+        self.bitasset_id = self.asset["bitasset_data_id"]
+        self.limit = limit
+        self.feed = None
+        self.load()
+
+    def load(self):
+        """(Re)load the call orders and the price feed from the API node"""
+        bitasset = self.blockchain.rpc.get_object(self.bitasset_id)
+        calls = self.blockchain.rpc.get_call_orders(self.asset["id"], self.limit)
+        self.complete = len(calls) < self.limit
+        self.backing = Asset(
+            bitasset["options"]["short_backing_asset"],
+            blockchain_instance=self.blockchain,
+        )
+        self._set_calls(calls)
+        self.status = np.zeros(len(self.ids), dtype=np.int8)
+        self.set_feed(bitasset["current_feed"], emit=False)
+
+    def _set_calls(self, calls):
+        self.ids = [c["id"] for c in calls]
+        self.borrowers = [c["borrower"] for c in calls]
+        self.collateral = AmountArray(
+            self.backing,
+            [int(c["collateral"]) for c in calls],
+            blockchain_instance=self.blockchain,
+        )
+        self.debt = AmountArray(
+            self.asset,
+            [int(c["debt"]) for c in calls],
+            blockchain_instance=self.blockchain,
+        )
+        self.target_ratio = np.array(
+            [c.get("target_collateral_ratio") or np.nan for c in calls],
+            dtype=np.float64,
+        )
+        self.target_ratio /= 1000
+
+    def _feed_price(self, feed):
+        """Returns the settlement price in backing asset per debt asset"""
+        price = feed["settlement_price"]
+        amounts = {price[k]["asset_id"]: int(price[k]["amount"]) for k in price}
+        debt = amounts.get(self.asset["id"], 0)
+        backing = amounts.get(self.backing["id"], 0)
+        if not debt or not backing:
+            return np.nan
+        return (backing / 10 ** self.backing["precision"]) / (
+            debt / 10 ** self.asset["precision"]
+        )
+
+    def set_feed(self, feed, emit=True):
+        """
+        Recompute all positions for a (new) price feed.
+
+        :param dict feed: Price feed (``current_feed`` of the bitasset data)
+        :param bool emit: Call the callbacks for positions that cross a
+            threshold
+        """
+        self.feed = feed
+        self.price = self._feed_price(feed)
+        self.mcr = feed["maintenance_collateral_ratio"] / 1000
+        self.mssr = feed["maximum_short_squeeze_ratio"] / 1000
+        self._compute(emit)
+
+    def _compute(self, emit=True):
+        collateral = self.collateral.decimals
+        debt = self.debt.decimals
+        with np.errstate(divide="ignore", invalid="ignore"):
+            self.ratio = collateral / (debt * self.price)
+            self.call_price = collateral / (debt * self.mcr)
+        status = np.where(
+            self.ratio < self.mssr,
+            UNDERCOLLATERALIZED,
+            np.where(self.ratio < self.mcr, MARGIN_CALL, OK),
+        ).astype(np.int8)
+        previous, self.status = self.status, status
+        if not emit:
+            return
+        called = np.flatnonzero((previous == OK) & (status != OK))
+        if len(called):
+            self.on_margin_call(self.positions(called))
+        under = np.flatnonzero(
+            (previous != UNDERCOLLATERALIZED) & (status == UNDERCOLLATERALIZED)
+        )
+        if len(under):
+            self.on_undercollateralized(self.positions(under))
+        recovered = np.flatnonzero((previous != OK) & (status == OK))
+        if len(recovered):
+            self.on_recovered(self.positions(recovered))
+
+    def _remove_call(self, index):
+        del self.ids[index]
+        del self.borrowers[index]
+        self.collateral.values = np.delete(self.collateral.values, index)
+        self.debt.values = np.delete(self.debt.values, index)
+        self.target_ratio = np.delete(self.target_ratio, index)
+        self.status = np.delete(self.status, index)
+
+    def _update_call(self, call):
+        """Insert, update or remove (no debt left) a call order"""
+        debt = int(call.get("debt", 0))
+        target = (call.get("target_collateral_ratio") or np.nan) / 1000
+        if call["id"] in self.ids:
+            index = self.ids.index(call["id"])
+            if debt:
+                self.collateral.values[index] = int(call["collateral"])
+                self.debt.values[index] = debt
+                self.target_ratio[index] = target
+                return
+            self._remove_call(index)
+        elif debt:
+            self.ids.append(call["id"])
+            self.borrowers.append(call["borrower"])
+            self.collateral.values = np.append(
+                self.collateral.values, int(call["collateral"])
+            )
+            self.debt.values = np.append(self.debt.values, debt)
+            self.target_ratio = np.append(self.target_ratio, target)
+            self.status = np.append(self.status, np.int8(OK))
+
+    def apply(self, update):
+        """
+        Apply an object notification.
+
+        :param dict update: Bitasset data of the asset (a new feed), a
+            call order of the asset or the id of a removed (closed) call
+            order. Other objects are ignored.
+        """
+        if isinstance(update, str):
+            if update in self.ids:
+                self._remove_call(self.ids.index(update))
+                self._compute()
+            return
+        if not isinstance(update, dict):
+            return
+        if update.get("id") == self.bitasset_id and "current_feed" in update:
+            if update["current_feed"] != self.feed:
+                self.set_feed(update["current_feed"])
+        elif "borrower" in update and "call_price" in update:
+            assets = {
+                update["call_price"]["base"]["asset_id"],
+                update["call_price"]["quote"]["asset_id"],
+            }
+            if self.asset["id"] in assets:
+                self._update_call(update)
+                self._compute()
+
+    def positions(self, index=None):
+        """
+        Returns positions as list of dictionaries.
+
+        :param index: Indices or boolean mask of the positions (defaults to
+            all positions)
+        """
+        indices = range(len(self.ids))
+        if index is not None:
+            indices = np.arange(len(self.ids))[index]
+        return [
+            {
+                "id": self.ids[i],
+                "borrower": self.borrowers[i],
+                "collateral": self.collateral[int(i)],
+                "debt": self.debt[int(i)],
+                "ratio": float(self.ratio[i]),
+                "call_price": float(self.call_price[i]),
+                "target_collateral_ratio": (
+                    None
+                    if np.isnan(self.target_ratio[i])
+                    else float(self.target_ratio[i])
+                ),
+            }
+            for i in indices
+        ]
+
+    def margin_called(self):
+        """Returns the positions below the maintenance collateral ratio"""
+        return self.positions(self.status != OK)
+
+    def undercollateralized(self):
+        """Returns the positions below the maximum short squeeze ratio"""
+        return self.positions(self.status == UNDERCOLLATERALIZED)
+
+    def at_risk(self, ratio):
+        """Returns the positions with a collateral ratio below ``ratio``"""
+        return self.positions(self.ratio < ratio)
+
+    def __len__(self):
+        return len(self.ids)
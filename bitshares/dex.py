@@ -3,11 +3,11 @@
 from bitsharesbase import operations
 
 from .account import Account
-from .amount import Amount
+from .amount import Amount, IntegerAmount
 from .asset import Asset
+from .fees import FeeSchedule
 from .instance import BlockchainInstance
 from .price import Price
-from .market import Market
 
 
 class Dex(BlockchainInstance):
@@ -28,6 +28,8 @@ class Dex(BlockchainInstance):
         """
         Returns a dictionary of all fees that apply through the network.
 
+        The fee schedule is cached (see :class:`bitshares.fees.FeeSchedule`).
+
         Example output:
 
         .. code-block:: js
@@ -43,22 +45,8 @@ class Dex(BlockchainInstance):
             10000000.0}, 'assert': {'fee': 20000.0},
             'committee_member_create': {'fee': 100000000.0}}
         """
-        from bitsharesbase.operations import operations
-
-        r = {}
-        obj, base = self.blockchain.rpc.get_objects(["2.0.0", "1.3.0"])
-        fees = obj["parameters"]["current_fees"]["parameters"]
-        scale = float(obj["parameters"]["current_fees"]["scale"])
-        for f in fees:
-            op_name = "unknown %d" % f[0]
-            for name in operations:
-                if operations[name] == f[0]:
-                    op_name = name
-            fs = f[1]
-            for _type in fs:
-                fs[_type] = float(fs[_type]) * scale / 1e4 / 10 ** base["precision"]
-            r[op_name] = fs
-        return r
+        schedule = FeeSchedule(blockchain_instance=self.blockchain)
+        return schedule.fees()
 
     def list_debt_positions(self, account=None):
         """
@@ -82,38 +70,27 @@ class Dex(BlockchainInstance):
             raise ValueError("You need to provide an account")
         account = Account(account, full=True, blockchain_instance=self.blockchain)
 
+        call_orders = account.get("call_orders") or []
+        assets, bitassets = self._debt_assets(call_orders)
+        positions = self._debt_positions(call_orders, assets, bitassets)
+        pairs = self._ticker_pairs(positions)
+        tickers = {pair: self.blockchain.rpc.get_ticker(*pair) for pair in pairs}
+
         r = {}
-        for debt in account.get("call_orders"):
-            base = Asset(
-                debt["call_price"]["base"]["asset_id"],
-                full=True,
-                blockchain_instance=self.blockchain,
-            )
-            quote = Asset(
-                debt["call_price"]["quote"]["asset_id"],
-                full=True,
+        for debt, base, quote, bitasset, settlement_price in positions:
+            collateral_amount = Amount(
+                {"amount": debt["collateral"], "asset": base},
                 blockchain_instance=self.blockchain,
             )
-            if not quote.is_bitasset:
-                continue
-            quote.ensure_full()
-            bitasset = quote["bitasset_data"]
-            settlement_price = Price(
-                bitasset["current_feed"]["settlement_price"],
+            debt_amount = Amount(
+                {"amount": debt["debt"], "asset": quote},
                 blockchain_instance=self.blockchain,
             )
-            if not settlement_price:
-                continue
-            collateral_amount = Amount({"amount": debt["collateral"], "asset": base})
-            debt_amount = Amount({"amount": debt["debt"], "asset": quote})
-            # call_price = Price(debt["call_price"], blockchain_instance=self.blockchain)
             call_price = collateral_amount / (
                 debt_amount
                 * (bitasset["current_feed"]["maintenance_collateral_ratio"] / 1000)
             )
-            latest = Market("{}:{}".format(base["symbol"], quote["symbol"])).ticker()[
-                "latest"
-            ]
+            latest = tickers[(quote["id"], base["id"])]["latest"] or 0.0
             r[quote["symbol"]] = {
                 "collateral": collateral_amount,
                 "debt": debt_amount,
@@ -123,6 +100,67 @@ class Dex(BlockchainInstance):
             }
         return r
 
+    def _debt_assets(self, call_orders):
+        """Returns the assets and bitasset data (by id) of call orders
+
+        Each is obtained with a single ``get_objects`` call, the assets
+        are stored in the cache.
+        """
+        ids = sorted(
+            {
+                debt["call_price"][side]["asset_id"]
+                for debt in call_orders
+                for side in ("base", "quote")
+            }
+        )
+        assets = {}
+        if ids:
+            for data in self.blockchain.rpc.get_objects(ids):
+                asset = Asset(data, blockchain_instance=self.blockchain)
+                asset.store(data, data["symbol"])
+                assets[data["id"]] = asset
+        bitasset_ids = self._bitasset_ids(assets, call_orders)
+        bitassets = {}
+        if bitasset_ids:
+            bitassets = dict(
+                zip(bitasset_ids, self.blockchain.rpc.get_objects(bitasset_ids))
+            )
+        return assets, bitassets
+
+    @staticmethod
+    def _bitasset_ids(assets, call_orders):
+        """Returns the ids of the bitasset data of the debt assets"""
+        quotes = [assets[d["call_price"]["quote"]["asset_id"]] for d in call_orders]
+        return sorted({a["bitasset_data_id"] for a in quotes if a.is_bitasset})
+
+    def _debt_positions(self, call_orders, assets, bitassets):
+        """Returns ``(debt, base, quote, bitasset, settlement_price)`` of
+        the call orders that are listed"""
+        positions = []
+        for debt in call_orders:
+            base = assets[debt["call_price"]["base"]["asset_id"]]
+            quote = assets[debt["call_price"]["quote"]["asset_id"]]
+            if not quote.is_bitasset:
+                continue
+            bitasset = bitassets[quote["bitasset_data_id"]]
+            settlement_price = Price(
+                bitasset["current_feed"]["settlement_price"],
+                blockchain_instance=self.blockchain,
+            )
+            if not settlement_price:
+                continue
+            positions.append((debt, base, quote, bitasset, settlement_price))
+        return positions
+
+    @staticmethod
+    def _ticker_pairs(positions):
+        pairs = []
+        for _, base, quote, _, _ in positions:
+            # get_ticker(debt, collateral): latest in debt per collateral
+            if (quote["id"], base["id"]) not in pairs:
+                pairs.append((quote["id"], base["id"]))
+        return pairs
+
     def close_debt_position(self, symbol, account=None):
         """
         Close a debt position and reclaim the collateral.
@@ -140,21 +178,15 @@ class Dex(BlockchainInstance):
         if symbol not in debts:
             raise ValueError("No call position open for %s" % symbol)
         debt = debts[symbol]
-        asset = debt["debt"]["asset"]
-        collateral_asset = debt["collateral"]["asset"]
+        debt_amount = IntegerAmount(debt["debt"], blockchain_instance=self.blockchain)
+        collateral_amount = IntegerAmount(
+            debt["collateral"], blockchain_instance=self.blockchain
+        )
         op = operations.Call_order_update(
             **{
                 "fee": {"amount": 0, "asset_id": "1.3.0"},
-                "delta_debt": {
-                    "amount": int(-float(debt["debt"]) * 10 ** asset["precision"]),
-                    "asset_id": asset["id"],
-                },
-                "delta_collateral": {
-                    "amount": int(
-                        -float(debt["collateral"]) * 10 ** collateral_asset["precision"]
-                    ),
-                    "asset_id": collateral_asset["id"],
-                },
+                "delta_debt": (-debt_amount).json(),
+                "delta_collateral": (-collateral_amount).json(),
                 "funding_account": account["id"],
                 "extensions": [],
             }
@@ -244,16 +276,12 @@ class Dex(BlockchainInstance):
 
         payload = {
             "fee": {"amount": 0, "asset_id": "1.3.0"},
-            "delta_debt": {
-                "amount": int(float(delta) * 10 ** asset["precision"]),
-                "asset_id": asset["id"],
-            },
-            "delta_collateral": {
-                "amount": int(
-                    float(amount_of_collateral) * 10 ** collateral_asset["precision"]
-                ),
-                "asset_id": collateral_asset["id"],
-            },
+            "delta_debt": IntegerAmount(
+                delta["amount"], asset, blockchain_instance=self.blockchain
+            ).json(),
+            "delta_collateral": IntegerAmount(
+                amount_of_collateral, collateral_asset, blockchain_instance=self.blockchain
+            ).json(),
             "funding_account": account["id"],
             "extensions": {},
         }
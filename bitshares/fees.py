@@ -0,0 +1,218 @@
+# -*- coding: utf-8 -*-
+import logging
+
+from datetime import datetime
+
+from bitsharesbase.objects import Operation
+from bitsharesbase.operations import operations
+
+from .asset import Asset
+from .blockchainobject import ChainScopedCaching
+from .instance import BlockchainInstance
+from .utils import formatTimeString
+
+
+log = logging.getLogger(__name__)
+
+#: Operation names by operation id
+operation_names = {v: k for k, v in operations.items()}
+
+#: Operations that are charged by the size of a single field
+data_fee_fields = {
+    "transfer": "memo",
+    "override_transfer": "memo",
+    "asset_issue": "memo",
+    "withdraw_permission_claim": "memo",
+    "custom": "data",
+}
+
+SECONDS_PER_DAY = 86400
+GRAPHENE_100_PERCENT = 10000
+
+
+def data_fee(size, price_per_kbyte):
+    """Returns the fee for ``size`` bytes of data"""
+    return size * price_per_kbyte // 1024
+
+
+def is_cheap_name(name):
+    """Returns whether an account name is charged the basic fee (i.e. it
+    contains a digit, ``.``, ``-`` or ``/``, or no vowels)"""
+    if any(c.isdigit() or c in ".-/" for c in name):
+        return True
+    return not any(c in "aeiouy" for c in name)
+
+
+class FeeSchedule(BlockchainInstance):
+    """
+    Cached fee schedule of the network.
+
+    The fee parameters (``2.0.0``), the next maintenance time (``2.1.0``)
+    and the core asset are obtained with a single ``get_objects`` call and
+    shared by all instances connected to the same chain. Changes of the
+    fee schedule only take effect at maintenance, hence the schedule is
+    only reloaded once the next maintenance time has passed (or with
+    :meth:`refresh`).
+
+    :param bitshares.bitshares.BitShares blockchain_instance: BitShares instance
+
+    .. code-block:: python
+
+        from bitshares.fees import FeeSchedule
+
+        schedule = FeeSchedule()
+        schedule.parameters("transfer")
+        schedule.estimate(op)                       # in BTS
+        schedule.estimate(op, asset_id="1.3.121")   # in USD
+
+    Fees are estimated locally, i.e. without ``get_required_fees``,
+    following the fee calculation of the node: the base fee of the
+    operation plus the data fee (``price_per_kbyte``) of the serialized
+    operation (or of its memo/data), scaled by the schedule's ``scale``
+    and converted by the core exchange rate of the fee asset.
+
+    .. note:: The fees of the operations contained in a proposal are not
+              included.
+    """
+
+    #: Fee schedules by chain id
+    schedules = {}
+
+    def __init__(self, **kwargs):
+        BlockchainInstance.__init__(self, **kwargs)
+        if not self._cached():
+            self.refresh()
+
+    def _chain_id(self):
+        return ChainScopedCaching.chain_id_of(self.blockchain)
+
+    def _cached(self):
+        """Use the cached schedule if it is still valid"""
+        schedule = self.schedules.get(self._chain_id())
+        if schedule is None or datetime.utcnow() >= schedule["expiration"]:
+            return False
+        self.schedule = schedule
+        return True
+
+    def refresh(self):
+        """Reload the fee schedule from the API node"""
+        self._set(*self.blockchain.rpc.get_objects(["2.0.0", "2.1.0", "1.3.0"]))
+
+    def _set(self, properties, dynamic, core):
+        fees = properties["parameters"]["current_fees"]
+        self.schedule = self.schedules[self._chain_id()] = {
+            "parameters": {op_id: params for op_id, params in fees["parameters"]},
+            "scale": int(fees["scale"]),
+            "precision": core["precision"],
+            "expiration": formatTimeString(dynamic["next_maintenance_time"]),
+        }
+        log.debug("Loaded fee schedule valid until %s" % self.schedule["expiration"])
+
+    @property
+    def scale(self):
+        return self.schedule["scale"]
+
+    def parameters(self, op):
+        """
+        Returns the fee parameters of an operation.
+
+        :param op: Operation id or name
+        """
+        if isinstance(op, str):
+            op = operations[op]
+        return self.schedule["parameters"].get(op, {})
+
+    def fees(self):
+        """
+        Returns the fees of all operations in units of the core asset (see
+        :meth:`bitshares.dex.Dex.returnFees`).
+        """
+        precision = self.schedule["precision"]
+        return {
+            operation_names.get(op_id, "unknown %d" % op_id): {
+                name: float(value) * self.scale / 1e4 / 10 ** precision
+                for name, value in params.items()
+            }
+            for op_id, params in self.schedule["parameters"].items()
+        }
+
+    @staticmethod
+    def _operation(op):
+        if not isinstance(op, Operation):
+            op = Operation(list(op) if isinstance(op, tuple) else op)
+        return op
+
+    def _base_fee(self, op):
+        """Returns the fee of an operation before scaling (in satoshis)"""
+        params = {k: int(v) for k, v in self.parameters(op.id).items()}
+        name = operation_names.get(op.id)
+        if name == "account_create":
+            if is_cheap_name(op.op.json()["name"]):
+                fee = params.get("basic_fee", 0)
+            else:
+                fee = params.get("premium_fee", 0)
+        elif name == "asset_create":
+            symbol = op.op.json()["symbol"]
+            fee = params.get(
+                {3: "symbol3", 4: "symbol4"}.get(len(symbol), "long_symbol"), 0
+            )
+        elif name in ("htlc_create", "htlc_extend"):
+            data = op.op.json()
+            seconds = data.get("claim_period_seconds", data.get("seconds_to_add", 0))
+            days = (seconds + SECONDS_PER_DAY - 1) // SECONDS_PER_DAY
+            return params.get("fee", 0) + params.get("fee_per_day", 0) * days
+        else:
+            fee = params.get("fee", 0)
+
+        if "price_per_kbyte" in params:
+            field = data_fee_fields.get(name)
+            if field is None:
+                fee += data_fee(len(bytes(op.op)), params["price_per_kbyte"])
+            elif field == "data" or not op.op.data[field].isempty():
+                value = op.op.data[field]
+                if field != "data":
+                    # pack_size(*memo): the memo without the optional flag
+                    value = value.data
+                fee += data_fee(len(bytes(value)), params["price_per_kbyte"])
+        return fee
+
+    def core_fee(self, op):
+        """
+        Returns the fee of an operation in satoshis of the core asset.
+
+        :param op: Operation (instance of an operation of
+            :mod:`bitsharesbase.operations`, of
+            :class:`bitsharesbase.objects.Operation` or ``[id, data]``)
+        """
+        op = self._operation(op)
+        return self._base_fee(op) * self.scale // GRAPHENE_100_PERCENT
+
+    @staticmethod
+    def _convert(core_fee, asset_id, core_exchange_rate):
+        """Convert a core fee with the core exchange rate like the node
+        does (rounding up)"""
+        if core_exchange_rate["base"]["asset_id"] == asset_id:
+            amount = int(core_exchange_rate["base"]["amount"])
+            core = int(core_exchange_rate["quote"]["amount"])
+        else:
+            amount = int(core_exchange_rate["quote"]["amount"])
+            core = int(core_exchange_rate["base"]["amount"])
+        fee = core_fee * amount // core
+        while fee * core // amount < core_fee:
+            fee += 1
+        return fee
+
+    def estimate(self, op, asset_id="1.3.0"):
+        """
+        Estimate the fee of an operation without asking the API node.
+
+        :param op: Operation (see :meth:`core_fee`)
+        :param str asset_id: Asset to pay the fee with
+        :returns: fee as ``{"amount": ..., "asset_id": ...}`` (like
+            ``get_required_fees``)
+        """
+        fee = self.core_fee(op)
+        if asset_id != "1.3.0":
+            asset = Asset(asset_id, blockchain_instance=self.blockchain)
+            fee = self._convert(fee, asset_id, asset["options"]["core_exchange_rate"])
+        return {"amount": fee, "asset_id": asset_id}
@@ -1,14 +1,26 @@
 # -*- coding: utf-8 -*-
+import sys
+import time
+
 from datetime import datetime, timedelta
+from decimal import Decimal
+from fractions import Fraction
 
 from bitsharesbase import operations
 
 from .account import Account
-from .amount import Amount
+from .amount import Amount, IntegerAmount
 from .asset import Asset
+from .exceptions import AssetDoesNotExistsException
 from .instance import BlockchainInstance
 from .price import FilledOrder, Order, Price
-from .utils import assets_from_string, formatTime, formatTimeFromNow
+from .utils import (
+    assets_from_string,
+    formatTime,
+    formatTimeFromNow,
+    formatTimeString,
+    read_ahead,
+)
 
 
 @BlockchainInstance.inject
@@ -115,6 +127,24 @@ class Market(dict):
                 }
             }
         """
+        bitasset_data_id = self._bitasset_data_id()
+        bitasset = None
+        if bitasset_data_id:
+            bitasset = self.blockchain.rpc.get_object(bitasset_data_id)
+        ticker = self.blockchain.rpc.get_ticker(self["base"]["id"], self["quote"]["id"])
+        return self._ticker(ticker, bitasset)
+
+    def _bitasset_data_id(self):
+        """Returns the id of the bitasset data that :meth:`ticker` needs (or
+        ``None``)"""
+        if "bitasset_data_id" in self["quote"]:
+            return self["quote"]["bitasset_data_id"]
+        elif "bitasset_data_id" in self["base"]:
+            return self["base"]["bitasset_data_id"]
+
+    def _ticker(self, ticker, bitasset=None):
+        """Build the result of :meth:`ticker` from the result of
+        ``get_ticker`` and the bitasset data of the market"""
         data = {}
         # Core Exchange rate
         if self["quote"]["id"] == "1.3.0":
@@ -127,7 +157,6 @@ class Market(dict):
 
         # smartcoin stuff
         if "bitasset_data_id" in self["quote"]:
-            bitasset = self.blockchain.rpc.get_object(self["quote"]["bitasset_data_id"])
             backing_asset_id = bitasset["options"]["short_backing_asset"]
             if backing_asset_id == self["base"]["id"]:
                 sp = bitasset["current_feed"]["settlement_price"]
@@ -140,7 +169,6 @@ class Market(dict):
                     ].invert()
 
         elif "bitasset_data_id" in self["base"]:
-            bitasset = self.blockchain.rpc.get_object(self["base"]["bitasset_data_id"])
             backing_asset_id = bitasset["options"]["short_backing_asset"]
             if backing_asset_id == self["quote"]["id"]:
                 data["baseSettlement_price"] = Price(
@@ -148,7 +176,6 @@ class Market(dict):
                     blockchain_instance=self.blockchain,
                 )
 
-        ticker = self.blockchain.rpc.get_ticker(self["base"]["id"], self["quote"]["id"])
         data["baseVolume"] = Amount(
             ticker["base_volume"] or 0.0,
             self["base"],
@@ -311,14 +338,61 @@ class Market(dict):
             )
         )
 
-    def trades(self, limit=25, start=None, stop=None):
+    def trades(
+        self,
+        limit=25,
+        start=None,
+        stop=None,
+        readahead=0,
+        raw=False,
+        batch=False,
+        store=None,
+    ):
         """
         Returns your trade history for a given market.
 
         :param int limit: Limit the amount of orders (default: 25)
         :param datetime start: start time
         :param datetime stop: stop time
+        :param int readahead: Number of pages (of 100 trades) to fetch in a
+            background thread while the current page is being consumed
+            (default: 0, i.e. fetch pages on demand)
+        :param bool raw: Yield the trades as returned by the API instead of
+            instances of :class:`bitshares.price.FilledOrder`
+        :param bool batch: Yield one columnar batch per page, i.e. a dict
+            with lists ``sequence``, ``date``, ``price``, ``amount`` (quote)
+            and ``value`` (base)
+        :param bitshares.tradestore.SqliteTradeStore store: Serve the
+            trades from this store if it covers the time range
+
+        .. code-block:: python
+
+            # Backfill with read-ahead in columnar batches
+            for columns in market.trades(
+                limit=10 ** 6, start=start, readahead=4, batch=True
+            ):
+                prices = numpy.array(columns["price"])
         """
+        # The ranges of the store are in UTC
+        store_stop = stop or datetime.utcnow()
+        store_start = start or store_stop - timedelta(hours=24)
+        if store is not None and store.covers(self, store_start, store_stop):
+            pages = [store.trades(self, store_start, store_stop, limit=limit)]
+        else:
+            pages = self._trade_pages(limit=limit, start=start, stop=stop)
+            if readahead:
+                pages = read_ahead(pages, readahead)
+        for page in pages:
+            if batch:
+                yield self._trade_columns(page)
+            elif raw:
+                yield from page
+            else:
+                for order in page:
+                    yield self._filled_order(order)
+
+    def _trade_pages(self, limit=25, start=None, stop=None):
+        """Yields the raw trade history page by page"""
         # FIXME, this call should also return whether it was a buy or
         # sell
         if not stop:
@@ -344,7 +418,8 @@ class Market(dict):
                 )
             else:
                 # obtain subsequent set of orders
-                continuous_limit = min(limit - cnt, 100)
+                # One more as the start sequence (already seen) is included
+                continuous_limit = min(limit - cnt + 1, 100)
                 orders = self.blockchain.rpc.get_trade_history_by_sequence(
                     self["base"]["symbol"],
                     self["quote"]["symbol"],
@@ -353,27 +428,106 @@ class Market(dict):
                     continuous_limit,
                 )
 
+            if sequence:
+                # The start sequence is inclusive, skip what we have seen
+                orders = [o for o in orders if o.get("sequence", 0) < sequence]
             if len(orders) == 0:
                 return
-            for order in orders:
-                cnt += 1
-                yield FilledOrder(
-                    order,
-                    quote=Amount(
-                        order["amount"],
-                        self["quote"],
-                        blockchain_instance=self.blockchain,
-                    ),
-                    base=Amount(
-                        float(order["amount"]) * float(order["price"]),
-                        self["base"],
-                        blockchain_instance=self.blockchain,
-                    ),
-                    blockchain_instance=self.blockchain,
-                )
-                if cnt >= limit:
-                    return
-                sequence = order.get("sequence")
+            orders = orders[: limit - cnt]
+            cnt += len(orders)
+            yield orders
+            if cnt >= limit:
+                return
+            sequence = orders[-1].get("sequence")
+
+    def _filled_order(self, order):
+        return FilledOrder(
+            order,
+            quote=Amount(
+                order["amount"],
+                self["quote"],
+                blockchain_instance=self.blockchain,
+            ),
+            base=Amount(
+                float(order["amount"]) * float(order["price"]),
+                self["base"],
+                blockchain_instance=self.blockchain,
+            ),
+            blockchain_instance=self.blockchain,
+        )
+
+    @staticmethod
+    def _trade_columns(orders):
+        return {
+            "sequence": [o.get("sequence") for o in orders],
+            "date": [o["date"] for o in orders],
+            "price": [float(o["price"]) for o in orders],
+            "amount": [float(o["amount"]) for o in orders],
+            "value": [float(o["value"]) for o in orders],
+        }
+
+    def candles(self, bucket=3600, start=None, stop=None):
+        """
+        Returns OHLCV candles of the market.
+
+        The candles are taken from the market history buckets of the node.
+        If ``bucket`` is no native bucket size of the node, the candles are
+        resampled locally from the largest native bucket size that divides
+        it (or aggregated from the trade history if there is none).
+
+        :param int bucket: Bucket size in seconds (default: 3600)
+        :param datetime start: start time (UTC, defaults to 200 buckets
+            before ``stop``)
+        :param datetime stop: stop time (UTC, defaults to now)
+        :returns: list of candles as described in
+            :class:`bitshares.candles.CandleAggregator`
+        """
+        from .candles import CandleAggregator
+
+        if not stop:
+            stop = datetime.utcnow()
+        if not start:
+            start = stop - timedelta(seconds=bucket * 200)
+
+        native = [
+            size
+            for size in self.blockchain.rpc.get_market_history_buckets(api="history")
+            if size <= bucket and bucket % size == 0
+        ]
+        if native:
+            aggregator = CandleAggregator(
+                self, bucket=max(native), blockchain_instance=self.blockchain
+            )
+            for row in self._market_history(aggregator.bucket, start, stop):
+                aggregator.add_candle(aggregator.from_bucket(row))
+        else:
+            aggregator = CandleAggregator(
+                self, bucket=bucket, blockchain_instance=self.blockchain
+            )
+            for page in self._trade_pages(limit=sys.maxsize, start=start, stop=stop):
+                # Trades come newest first
+                for trade in reversed(page):
+                    aggregator.apply(trade)
+        return aggregator.resample(bucket)
+
+    def _market_history(self, bucket, start, stop):
+        """Yields the market history buckets of the node"""
+        while True:
+            rows = self.blockchain.rpc.get_market_history(
+                self["base"]["id"],
+                self["quote"]["id"],
+                bucket,
+                formatTime(start),
+                formatTime(stop),
+                api="history",
+            )
+            yield from rows
+            # The node returns at most 200 buckets per call
+            if len(rows) < 200:
+                return
+            start = formatTimeString(rows[-1]["key"]["open"]) + timedelta(
+                seconds=bucket
+            )
 
     def accounttrades(self, account=None, limit=25):
         """
@@ -393,7 +547,8 @@ class Market(dict):
         .. note:: This call goes through the trade history and
                   searches for your account, if there are no orders
                   within ``limit`` trades, this call will return an
-                  empty array.
+                  empty array. See :meth:`accountfills` for a lookup
+                  through the account's history.
         """
         if not account:
             if "default_account" in self.blockchain.config:
@@ -418,6 +573,38 @@ class Market(dict):
                 )
         return trades
 
+    def accountfills(self, account=None, limit=25):
+        """
+        Returns the fills of an account's orders in this market in time
+        order (oldest first).
+
+        Unlike :meth:`accounttrades`, this walks the operation history of
+        the account (see :meth:`bitshares.account.Account.fills`), i.e. it
+        finds the latest ``limit`` fills no matter how much has been
+        traded by others in the meantime. Fills are cached per account.
+
+        :param bitshares.account.Account account: Account name or instance
+            of Account
+        :param int limit: Number of fills (``None`` for all)
+        :returns: list of :class:`bitshares.price.FilledOrder` with the
+            additional key ``block_num``
+        """
+        if not account:
+            if "default_account" in self.blockchain.config:
+                account = self.blockchain.config["default_account"]
+        if not account:
+            raise ValueError("You need to provide an account")
+        account = Account(account, blockchain_instance=self.blockchain)
+
+        trades = []
+        for entry in account.fills(market=self, limit=limit):
+            trade = FilledOrder(
+                entry, base_asset=self["base"], blockchain_instance=self.blockchain
+            )
+            trade["block_num"] = entry["block_num"]
+            trades.append(trade)
+        return trades
+
     def accountopenorders(self, account=None):
         """
         Returns open Orders.
@@ -514,26 +701,16 @@ class Market(dict):
                 amount, self["quote"]["symbol"], blockchain_instance=self.blockchain
             )
 
+        # Exact integer arithmetic on satoshis
+        quote_amount = IntegerAmount(amount, blockchain_instance=self.blockchain)
+        base_amount = quote_amount.convert(price, self["base"])
+
         order = operations.Limit_order_create(
             **{
                 "fee": {"amount": 0, "asset_id": "1.3.0"},
                 "seller": account["id"],
-                "amount_to_sell": {
-                    "amount": int(
-                        round(
-                            float(amount)
-                            * float(price)
-                            * 10 ** self["base"]["precision"]
-                        )
-                    ),
-                    "asset_id": self["base"]["id"],
-                },
-                "min_to_receive": {
-                    "amount": int(
-                        round(float(amount) * 10 ** self["quote"]["precision"])
-                    ),
-                    "asset_id": self["quote"]["id"],
-                },
+                "amount_to_sell": base_amount.json(),
+                "min_to_receive": quote_amount.json(),
                 "expiration": formatTimeFromNow(expiration),
                 "fill_or_kill": killfill,
             }
@@ -606,26 +783,16 @@ class Market(dict):
                 amount, self["quote"]["symbol"], blockchain_instance=self.blockchain
             )
 
+        # Exact integer arithmetic on satoshis
+        quote_amount = IntegerAmount(amount, blockchain_instance=self.blockchain)
+        base_amount = quote_amount.convert(price, self["base"])
+
         order = operations.Limit_order_create(
             **{
                 "fee": {"amount": 0, "asset_id": "1.3.0"},
                 "seller": account["id"],
-                "amount_to_sell": {
-                    "amount": int(
-                        round(float(amount) * 10 ** self["quote"]["precision"])
-                    ),
-                    "asset_id": self["quote"]["id"],
-                },
-                "min_to_receive": {
-                    "amount": int(
-                        round(
-                            float(amount)
-                            * float(price)
-                            * 10 ** self["base"]["precision"]
-                        )
-                    ),
-                    "asset_id": self["base"]["id"],
-                },
+                "amount_to_sell": quote_amount.json(),
+                "min_to_receive": base_amount.json(),
                 "expiration": formatTimeFromNow(expiration),
                 "fill_or_kill": killfill,
             }
@@ -643,6 +810,299 @@ class Market(dict):
 
         return tx
 
+    def _account(self, account=None):
+        if not account:
+            if "default_account" in self.blockchain.config:
+                account = self.blockchain.config["default_account"]
+        if not account:
+            raise ValueError("You need to provide an account")
+        return Account(account, blockchain_instance=self.blockchain)
+
+    def _order_op(self, side, price, amount, account, expiration, killfill=False):
+        """Returns the ``Limit_order_create`` operation of a buy or sell
+        order (see :meth:`buy` and :meth:`sell`)"""
+        if side not in ("buy", "sell"):
+            raise ValueError("side needs to be 'buy' or 'sell'")
+        if isinstance(price, Price):
+            price = price.as_base(self["base"]["symbol"])
+        if isinstance(amount, Amount):
+            assert (
+                amount["asset"]["symbol"] == self["quote"]["symbol"]
+            ), "Price: {} does not match amount: {}".format(str(price), str(amount))
+            quote_amount = IntegerAmount(amount, blockchain_instance=self.blockchain)
+        else:
+            quote_amount = IntegerAmount(
+                amount, self["quote"], blockchain_instance=self.blockchain
+            )
+        base_amount = quote_amount.convert(price, self["base"])
+        if side == "buy":
+            amount_to_sell, min_to_receive = base_amount, quote_amount
+        else:
+            amount_to_sell, min_to_receive = quote_amount, base_amount
+        return operations.Limit_order_create(
+            **{
+                "fee": {"amount": 0, "asset_id": "1.3.0"},
+                "seller": account["id"],
+                "amount_to_sell": amount_to_sell.json(),
+                "min_to_receive": min_to_receive.json(),
+                "expiration": formatTimeFromNow(expiration),
+                "fill_or_kill": killfill,
+            }
+        )
+
+    @staticmethod
+    def _split_ops(ops, max_size, overhead=1024):
+        """Split operations into chunks whose serialized size stays below
+        ``max_size`` bytes (minus ``overhead`` for the transaction header
+        and signatures)"""
+        chunks = [[]]
+        size = 0
+        for op in ops:
+            # Operation id plus the serialized operation
+            op_size = len(bytes(op)) + 1
+            if chunks[-1] and size + op_size > max_size - overhead:
+                chunks.append([])
+                size = 0
+            chunks[-1].append(op)
+            size += op_size
+        return chunks
+
+    def _finalize_ops(self, ops, account, returnOrderId=False, split=True, **kwargs):
+        """
+        Broadcast operations in as few transactions as the maximum
+        transaction size allows (or in one transaction if ``split`` is
+        ``False``).
+
+        If the operations are not broadcast right away (``append_to``,
+        bundle, unsigned or proposer mode) they are all added to the
+        same transaction.
+        """
+        if (
+            kwargs.get("append_to")
+            or self.blockchain.bundle
+            or self.blockchain.unsigned
+            or self.blockchain.proposer
+        ):
+            return [
+                self.blockchain.finalizeOp(ops, account["name"], "active", **kwargs)
+            ]
+
+        chunks = [ops]
+        if split:
+            max_size = self.blockchain.rpc.get_global_properties()["parameters"][
+                "maximum_transaction_size"
+            ]
+            chunks = self._split_ops(ops, max_size)
+        if returnOrderId:
+            # Make blocking broadcasts
+            prevblocking = self.blockchain.blocking
+            self.blockchain.blocking = returnOrderId
+        try:
+            txs = []
+            for chunk in chunks:
+                tx = self.blockchain.finalizeOp(
+                    chunk, account["name"], "active", **kwargs
+                )
+                if returnOrderId and tx.get("operation_results"):
+                    tx["orderids"] = [
+                        result[1]
+                        for op, result in zip(chunk, tx["operation_results"])
+                        if isinstance(op, operations.Limit_order_create)
+                    ]
+                txs.append(tx)
+        finally:
+            if returnOrderId:
+                self.blockchain.blocking = prevblocking
+        return txs
+
+    def _in_market(self, order):
+        """Is a raw limit order part of this market?"""
+        assets = {
+            order["sell_price"]["base"]["asset_id"],
+            order["sell_price"]["quote"]["asset_id"],
+        }
+        return assets == {self["base"]["id"], self["quote"]["id"]}
+
+    @staticmethod
+    def _same_order(order, op):
+        """Is the open (raw) ``order`` what the ``Limit_order_create``
+        operation ``op`` would place?"""
+        sell_price = order["sell_price"]
+        new = op.json()
+        to_sell, to_receive = new["amount_to_sell"], new["min_to_receive"]
+        return (
+            sell_price["base"]["asset_id"] == to_sell["asset_id"]
+            and sell_price["quote"]["asset_id"] == to_receive["asset_id"]
+            and int(order["for_sale"]) == int(to_sell["amount"])
+            and int(sell_price["base"]["amount"]) * int(to_receive["amount"])
+            == int(sell_price["quote"]["amount"]) * int(to_sell["amount"])
+        )
+
+    def _unchanged(self, open_orders, ops):
+        """Match open orders against new order operations. Returns the ids of
+        the orders that need to be cancelled and the operations that need to
+        be broadcast"""
+        ops = list(ops)
+        cancel = []
+        for order in open_orders:
+            for i, op in enumerate(ops):
+                if self._same_order(order, op):
+                    del ops[i]
+                    break
+            else:
+                cancel.append(order["id"])
+        return cancel, ops
+
+    def _cancel_ops(self, order_ids, account):
+        return [
+            operations.Limit_order_cancel(
+                **{
+                    "fee": {"amount": 0, "asset_id": "1.3.0"},
+                    "fee_paying_account": account["id"],
+                    "order": order_id,
+                    "extensions": [],
+                    "prefix": self.blockchain.prefix,
+                }
+            )
+            for order_id in order_ids
+        ]
+
+    def _open_orders(self, account):
+        """Returns the raw open orders of an account in this market"""
+        account = Account(account["id"], full=True, blockchain_instance=self.blockchain)
+        account.refresh()
+        return [o for o in account["limit_orders"] if self._in_market(o)]
+
+    def place_orders(
+        self,
+        orders,
+        expiration=None,
+        killfill=False,
+        account=None,
+        returnOrderId=False,
+        **kwargs
+    ):
+        """
+        Places several orders (e.g. a ladder) in as few transactions as
+        possible.
+
+        :param list orders: List of ``(side, price, amount)`` with ``side``
+            being ``"buy"`` or ``"sell"`` (see :meth:`buy` and :meth:`sell`)
+        :param number expiration: (optional) expiration time of the orders
+            in seconds
+        :param bool killfill: flag that indicates if the orders shall be
+            killed if they are not filled (defaults to False)
+        :param string account: Account name that executes the orders
+        :param string returnOrderId: If set to "head" or "irreversible" the
+            call will wait for the transactions to appear in the
+            head/irreversible block and add the key "orderids" to each
+            transaction
+        :returns: list of broadcast transactions (usually one)
+
+        All orders are placed with one ``TransactionBuilder``, i.e. the fees
+        are obtained and the transaction is signed only once. The
+        operations are split into several transactions only if they exceed
+        the maximum transaction size of the chain.
+
+        .. code-block:: python
+
+            market = Market("USD:BTS")
+            market.place_orders(
+                [("buy", 29.5, 10), ("buy", 29.0, 10), ("sell", 31.0, 10)],
+                account="init0",
+            )
+        """
+        if not expiration:
+            expiration = self.blockchain.config["order-expiration"]
+        account = self._account(account)
+        ops = [
+            self._order_op(side, price, amount, account, expiration, killfill)
+            for side, price, amount in orders
+        ]
+        return self._finalize_ops(ops, account, returnOrderId=returnOrderId, **kwargs)
+
+    def replace(
+        self,
+        order_ids=None,
+        orders=None,
+        expiration=None,
+        killfill=False,
+        account=None,
+        returnOrderId=False,
+        only_changed=False,
+        **kwargs
+    ):
+        """
+        Cancels orders and places new ones in a single transaction, e.g. to
+        re-quote a ladder without being exposed in between.
+
+        :param list order_ids: Ids of the orders to cancel (``1.7.x``)
+        :param list orders: New orders as list of ``(side, price, amount)``
+            (see :meth:`place_orders`)
+        :param number expiration: (optional) expiration time of the new
+            orders in seconds
+        :param bool killfill: flag that indicates if the new orders shall be
+            killed if they are not filled (defaults to False)
+        :param string account: Account name that executes the orders
+        :param string returnOrderId: If set to "head" or "irreversible" the
+            call will wait for the transaction to appear in the
+            head/irreversible block and add the key "orderids" with the ids
+            of the new orders
+        :param bool only_changed: Leave open orders that are identical to a
+            new order (same side, price and remaining amount) untouched. If
+            ``order_ids`` is not given, all open orders of the account in
+            this market are considered.
+        :returns: The broadcast transaction (``None`` if there is nothing to
+            do)
+
+        .. code-block:: python
+
+            market = Market("USD:BTS")
+            market.replace(
+                orders=[("buy", 29.5, 10), ("sell", 31.0, 10)],
+                account="init0",
+                only_changed=True,
+            )
+        """
+        if not expiration:
+            expiration = self.blockchain.config["order-expiration"]
+        account = self._account(account)
+        if isinstance(order_ids, str):
+            order_ids = [order_ids]
+        ops = [
+            self._order_op(side, price, amount, account, expiration, killfill)
+            for side, price, amount in orders or []
+        ]
+        if only_changed:
+            open_orders = self._open_orders(account)
+            if order_ids is not None:
+                open_orders = [o for o in open_orders if o["id"] in order_ids]
+            order_ids, ops = self._unchanged(open_orders, ops)
+
+        ops = self._cancel_ops(order_ids or [], account) + ops
+        if not ops:
+            return None
+        txs = self._finalize_ops(
+            ops, account, returnOrderId=returnOrderId, split=False, **kwargs
+        )
+        return txs[0]
+
+    def trader(self, account=None, expiration=None, killfill=False):
+        """
+        Returns a :class:`Trader` that places orders in this market on
+        behalf of one account with as little overhead per order as
+        possible.
+
+        :param string account: Account name that executes the orders
+        :param number expiration: (optional) expiration time of the orders
+            in seconds
+        :param bool killfill: flag that indicates if the orders shall be
+            killed if they are not filled (defaults to False)
+        """
+        if not expiration:
+            expiration = self.blockchain.config["order-expiration"]
+        return Trader(self, self._account(account), expiration, killfill)
+
     def cancel(self, orderNumber, account=None, **kwargs):
         """
         Cancels an order you have placed in a given market. Requires only the
@@ -687,3 +1147,213 @@ class Market(dict):
             blockchain_instance=self.blockchain,
         )
         return Market(quote=self["base"], base=collateral)
+
+
+def _ratio(value):
+    """Numerator and denominator of a number as it is written"""
+    if isinstance(value, int):
+        return value, 1
+    if isinstance(value, float):
+        # Same as Fraction(repr(value)), but faster
+        return Decimal(repr(value)).as_integer_ratio()
+    value = Fraction(value)
+    return value.numerator, value.denominator
+
+
+def _round_div(numerator, denominator):
+    """Round ``numerator / denominator`` half to even, i.e. like ``round()``
+    of a :class:`fractions.Fraction`"""
+    quotient, remainder = divmod(numerator, denominator)
+    if 2 * remainder > denominator or (2 * remainder == denominator and quotient % 2):
+        quotient += 1
+    return quotient
+
+
+class Trader:
+    """
+    Fast path to place orders in a market on behalf of one account.
+
+    The account, the assets and their precisions as well as the expiration
+    are resolved once (see :meth:`Market.trader`). Orders are computed from
+    plain numbers with integer arithmetic and result in the same
+    operations as :meth:`Market.buy` and :meth:`Market.sell`.
+
+    .. code-block:: python
+
+        trader = Market("USD:BTS").trader("init0")
+        trader.buy(29.5, 10)
+        trader.place([("buy", 29.5, 10), ("sell", 31.0, 10)])
+
+    .. note:: Prices need to be numbers denoted in base/quote and amounts
+              numbers in units of quote.
+    """
+
+    def __init__(self, market, account, expiration, killfill=False):
+        self.market = market
+        self.blockchain = market.blockchain
+        self.account = account
+        self.expiration = int(expiration)
+        self.killfill = killfill
+        self._seller = account["id"]
+        self._base_id = market["base"]["id"]
+        self._quote_id = market["quote"]["id"]
+        self._quote_scale = 10 ** market["quote"]["precision"]
+        self._base_scale = 10 ** market["base"]["precision"]
+        self._second = None
+        self._expires = None
+
+    def _expiration(self):
+        # Only format the expiration once per second
+        now = int(time.time())
+        if now != self._second:
+            self._second = now
+            self._expires = formatTimeFromNow(self.expiration)
+        return self._expires
+
+    def amounts(self, price, amount):
+        """Returns the satoshis of quote and base of an order"""
+        numerator, denominator = _ratio(amount)
+        quote = _round_div(numerator * self._quote_scale, denominator)
+        numerator, denominator = _ratio(price)
+        base = _round_div(
+            quote * numerator * self._base_scale, denominator * self._quote_scale
+        )
+        return quote, base
+
+    def order_op(self, side, price, amount):
+        """
+        Returns the ``Limit_order_create`` operation of an order.
+
+        :param str side: ``buy`` or ``sell``
+        :param float price: price denoted in ``base``/``quote``
+        :param float amount: Amount of ``quote`` to buy or sell
+        """
+        quote, base = self.amounts(price, amount)
+        quote = {"amount": quote, "asset_id": self._quote_id}
+        base = {"amount": base, "asset_id": self._base_id}
+        if side == "buy":
+            amount_to_sell, min_to_receive = base, quote
+        elif side == "sell":
+            amount_to_sell, min_to_receive = quote, base
+        else:
+            raise ValueError("side needs to be 'buy' or 'sell'")
+        return operations.Limit_order_create(
+            fee={"amount": 0, "asset_id": "1.3.0"},
+            seller=self._seller,
+            amount_to_sell=amount_to_sell,
+            min_to_receive=min_to_receive,
+            expiration=self._expiration(),
+            fill_or_kill=self.killfill,
+        )
+
+    def buy(self, price, amount, **kwargs):
+        """Places a buy order (see :meth:`Market.buy`)"""
+        return self.blockchain.finalizeOp(
+            self.order_op("buy", price, amount),
+            self.account["name"],
+            "active",
+            **kwargs
+        )
+
+    def sell(self, price, amount, **kwargs):
+        """Places a sell order (see :meth:`Market.sell`)"""
+        return self.blockchain.finalizeOp(
+            self.order_op("sell", price, amount),
+            self.account["name"],
+            "active",
+            **kwargs
+        )
+
+    def place(self, orders, **kwargs):
+        """Places several orders (see :meth:`Market.place_orders`)"""
+        ops = [self.order_op(*order) for order in orders]
+        return self.market._finalize_ops(ops, self.account, **kwargs)
+
+
+@BlockchainInstance.inject
+class Markets(list):
+    """
+    A list of markets whose data is obtained in batches.
+
+    :param list markets: Markets as strings (e.g. ``"USD:BTS"``) or
+        instances of :class:`Market`
+    :param bitshares.bitshares.BitShares blockchain_instance: BitShares instance
+
+    All assets given by symbol are looked up with a single
+    ``lookup_asset_symbols`` call and shared between the markets, the
+    bitasset data of all markets is obtained with a single
+    ``get_objects`` call.
+
+    .. code-block:: python
+
+        from bitshares.market import Markets
+
+        markets = Markets(["USD:BTS", "CNY:BTS", "USD:CNY"])
+        for name, ticker in markets.tickers().items():
+            print(name, ticker["latest"])
+    """
+
+    def __init__(self, markets, **kwargs):
+        markets = list(markets)
+        symbols = self._symbols(markets)
+        assets = {}
+        if symbols:
+            assets = self._store_assets(
+                symbols, self.blockchain.rpc.lookup_asset_symbols(symbols)
+            )
+        list.__init__(self, [self._market(m, assets) for m in markets])
+
+    @staticmethod
+    def _symbols(markets):
+        return sorted(
+            {s for m in markets if isinstance(m, str) for s in assets_from_string(m)}
+        )
+
+    def _store_assets(self, symbols, results):
+        """Returns a dict of symbol to asset and feeds the asset cache"""
+        assets = {}
+        for symbol, data in zip(symbols, results):
+            if not data:
+                raise AssetDoesNotExistsException(symbol)
+            asset = assets[symbol] = Asset(data, blockchain_instance=self.blockchain)
+            asset.store(data, data["symbol"])
+        return assets
+
+    def _market(self, market, assets):
+        if isinstance(market, Market):
+            return market
+        quote, base = assets_from_string(market)
+        return Market(
+            base=assets[base], quote=assets[quote], blockchain_instance=self.blockchain
+        )
+
+    def _bitasset_ids(self):
+        return sorted({m._bitasset_data_id() for m in self} - {None})
+
+    def _ticker_pairs(self):
+        pairs = []
+        for m in self:
+            pair = (m["base"]["id"], m["quote"]["id"])
+            if pair not in pairs:
+                pairs.append(pair)
+        return pairs
+
+    def tickers(self):
+        """
+        Returns the tickers of all markets.
+
+        :returns: dict of market string (e.g. ``USD:BTS``) to the result of
+            :meth:`Market.ticker`
+        """
+        ids = self._bitasset_ids()
+        bitassets = dict(zip(ids, self.blockchain.rpc.get_objects(ids))) if ids else {}
+        tickers = {
+            pair: self.blockchain.rpc.get_ticker(*pair) for pair in self._ticker_pairs()
+        }
+        return {
+            m.get_string(): m._ticker(
+                tickers[(m["base"]["id"], m["quote"]["id"])],
+                bitassets.get(m._bitasset_data_id()),
+            )
+            for m in self
+        }
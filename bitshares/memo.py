@@ -1,10 +1,13 @@
 # -*- coding: utf-8 -*-
 from graphenecommon.memo import Memo as GrapheneMemo
 from bitsharesbase.account import PrivateKey, PublicKey
+from bitsharesbase.memo import decode_memo_with_secret, get_shared_secrets
 
 from .account import Account
 from .instance import BlockchainInstance
 from .exceptions import (
+    KeyNotFound,
+    MissingKeyError,
     InvalidMemoKeyException,
     AccountDoesNotExistsException,
     WrongMemoKey,
@@ -12,8 +15,98 @@ from .exceptions import (
 )
 
 
+class SharedSecretMixin:
+    """Decrypt memos with cached shared secrets (see
+    :func:`bitsharesbase.memo.get_shared_secrets`) and in batches"""
+
+    def _memo_keys(self, message):
+        """Private key (of the receiver or sender, whichever is in the
+        wallet) and public key (of the other party) of a memo"""
+        try:
+            memo_wif = self.blockchain.wallet.getPrivateKeyForPublicKey(message["to"])
+            pubkey = message["from"]
+        except KeyNotFound:
+            try:
+                # if that failed, we assume that we have sent the memo
+                memo_wif = self.blockchain.wallet.getPrivateKeyForPublicKey(
+                    message["from"]
+                )
+                pubkey = message["to"]
+            except KeyNotFound:
+                # if all fails, raise exception
+                raise MissingKeyError(
+                    "None of the required memo keys are installed!"
+                    "Need any of {}".format([message["to"], message["from"]])
+                )
+
+        if not hasattr(self, "chain_prefix"):
+            self.chain_prefix = self.blockchain.prefix
+
+        return (
+            self.privatekey_class(memo_wif),
+            self.publickey_class(pubkey, prefix=self.chain_prefix),
+        )
+
+    def decrypt(self, message):
+        """Decrypt a message
+
+        :param dict message: encrypted memo message
+        :returns: decrypted message
+        :rtype: str
+        """
+        if not message:
+            return None
+        (shared_secret,) = get_shared_secrets([self._memo_keys(message)])
+        return decode_memo_with_secret(
+            shared_secret, int(message.get("nonce")), message.get("message")
+        )
+
+    def decrypt_many(self, messages, max_workers=1):
+        """Decrypt many messages
+
+        The memos are grouped by key pair, the shared secret of each pair
+        is derived once (and cached). The secrets of pairs that are not
+        cached yet can be derived by a pool of processes.
+
+        :param list messages: encrypted memo messages (``None`` for
+            operations without a memo)
+        :param int max_workers: Number of processes (``None`` for the
+            number of CPUs); with ``1`` the secrets are derived in this
+            process
+        :returns: decrypted messages in order
+        :rtype: list
+
+        .. code-block:: python
+
+            memos = [op["memo"] for op in transfers if "memo" in op]
+            for text in Memo(blockchain_instance=bitshares).decrypt_many(memos):
+                print(text)
+        """
+        messages = list(messages)
+        pairs, keys = {}, []
+        for message in messages:
+            if not message:
+                keys.append(None)
+                continue
+            parties = (message["from"], message["to"])
+            if parties not in pairs:
+                pairs[parties] = self._memo_keys(message)
+            keys.append(parties)
+        secrets = dict(
+            zip(pairs, get_shared_secrets(list(pairs.values()), max_workers))
+        )
+        return [
+            decode_memo_with_secret(
+                secrets[parties], int(message.get("nonce")), message.get("message")
+            )
+            if parties
+            else None
+            for message, parties in zip(messages, keys)
+        ]
+
+
 @BlockchainInstance.inject
-class Memo(GrapheneMemo):
+class Memo(SharedSecretMixin, GrapheneMemo):
     """
     Deals with Memos that are attached to a transfer.
 
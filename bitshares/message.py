@@ -1,4 +1,9 @@
 # -*- coding: utf-8 -*-
+import json
+import re
+
+from binascii import unhexlify
+
 from graphenecommon.message import Message as GrapheneMessage, InvalidMessageSignature
 from bitsharesbase.account import PublicKey
 
@@ -11,6 +16,106 @@ from .exceptions import (
 )
 
 
+def _parse_v1(message):
+    """Parse a message that is encapsulated with ``MESSAGE_SPLIT``, the data
+    is signed as ``SIGNED_MESSAGE_META``"""
+    parts = re.split("|".join(message.MESSAGE_SPLIT), message.message)
+    parts = [x for x in parts if x.strip()]
+    if len(parts) < 3:
+        raise ValueError("Incorrect number of message parts")
+    plain = parts[0].strip()
+    meta = dict(re.findall(r"(\S+)=(.*)", parts[1]))
+    for key in ["account", "memokey", "block", "timestamp"]:
+        if key not in meta:
+            raise ValueError("No '{}' could be found in meta data".format(key))
+    return dict(
+        account=meta["account"].strip(),
+        memokey=meta["memokey"].strip(),
+        signed=message.SIGNED_MESSAGE_META.format(message=plain, meta=meta),
+        signature=unhexlify(parts[2].strip()),
+        meta=meta,
+        plain_message=plain,
+    )
+
+
+def _parse_v2(message):
+    """Parse a message given as JSON (or dict) with ``payload``, ``signed``
+    and ``signature``"""
+    data = message.message
+    if not isinstance(data, dict):
+        data = json.loads(data)
+    payload = data.get("payload")
+    if not payload:
+        raise ValueError("Missing payload")
+    if json.dumps(payload, separators=(",", ":")) != data.get("signed"):
+        raise ValueError("payload doesn't match signed message")
+    payload_dict = dict(zip(payload[::2], payload[1::2]))
+    if not payload_dict.get("from", "").strip() or not payload_dict.get("key"):
+        raise ValueError("Missing account name 'from' or 'key'")
+    return dict(
+        account=payload_dict["from"].strip(),
+        memokey=payload_dict["key"].strip(),
+        signed=data["signed"],
+        signature=unhexlify(data.get("signature", "")),
+        meta=None,
+        plain_message=payload_dict.get("text"),
+    )
+
+
+def _parse_signed(message):
+    """Parse a signed message of any format that graphenecommon supports
+    without verifying it
+
+    :returns: dict with the ``account`` name, ``memokey``, ``signed`` data,
+        ``signature`` (bytes), ``meta`` and ``plain_message``
+    :raises ValueError: if no format accepts the message
+    """
+    for parse in [_parse_v1, _parse_v2]:
+        try:
+            return parse(message)
+        except Exception:
+            # As graphenecommon, try the next format
+            continue
+    raise ValueError("No Decoder accepted the message")
+
+
+def _check_memo_key(signed, prefix):
+    try:
+        PublicKey(signed["memokey"], prefix=prefix)
+    except Exception:
+        raise InvalidMemoKeyException("The memo key in the message is invalid")
+
+
+def _missing_account(name):
+    return AccountDoesNotExistsException(
+        "Could not find account {}. Are you connected to the right chain?".format(
+            name
+        )
+    )
+
+
+def _check_signer(message, signed, account, pubkey):
+    """Compare the memo key of the account with the one in the message and
+    the public key recovered from the signature"""
+    if account["options"]["memo_key"] != signed["memokey"]:
+        raise WrongMemoKey(
+            "Memo Key of account {} on the Blockchain ".format(account["name"])
+            + "differs from memo key in the message: {} != {}".format(
+                account["options"]["memo_key"], signed["memokey"]
+            )
+        )
+    if pubkey is None:
+        # graphenecommon gives up on all formats if no key can be recovered
+        raise ValueError("No Decoder accepted the message")
+    if pubkey != signed["memokey"]:
+        raise InvalidMessageSignature("The signature doesn't match the memo key")
+    message.signed_by_account = account
+    message.signed_by_name = account["name"]
+    message.meta = signed["meta"]
+    message.plain_message = signed["plain_message"]
+    return True
+
+
 @BlockchainInstance.inject
 class Message(GrapheneMessage):
     MESSAGE_SPLIT = (
@@ -23,3 +128,61 @@ class Message(GrapheneMessage):
     def define_classes(self):
         self.account_class = Account
         self.publickey_class = PublicKey
+
+    @classmethod
+    def verify_many(cls, messages, verifier=None, **kwargs):
+        """
+        Verify many signed messages (see :meth:`verify`).
+
+        The public keys of the signatures are recovered in one batch by a
+        pool of processes and cached by signature (see
+        :class:`bitsharesbase.verifier.SignatureVerifier`).
+
+        :param list messages: Signed messages (str, dict or
+            :class:`Message`)
+        :param bitsharesbase.verifier.SignatureVerifier verifier: Verifier
+            to use (defaults to the one of the blockchain instance)
+        :returns: list with ``True`` for every verified message or the
+            exception that :meth:`verify` would raise
+
+        .. code-block:: python
+
+            for message, result in zip(messages, Message.verify_many(messages)):
+                if result is not True:
+                    print("Invalid message:", result)
+        """
+        messages = [m if isinstance(m, cls) else cls(m, **kwargs) for m in messages]
+        if not messages:
+            return []
+        blockchain = messages[0].blockchain
+        verifier = verifier or blockchain.verifier
+        errors = cls.valid_exceptions + (ValueError,)
+
+        results, pending = [], []
+        for i, message in enumerate(messages):
+            try:
+                signed = _parse_signed(message)
+                _check_memo_key(signed, blockchain.prefix)
+                try:
+                    account = message.account_class(
+                        signed["account"], blockchain_instance=message.blockchain
+                    )
+                except AccountDoesNotExistsException:
+                    raise _missing_account(signed["account"])
+            except errors as e:
+                results.append(e)
+                continue
+            results.append(None)
+            pending.append((i, signed, account))
+
+        # Recover the signers in one batch
+        keys = verifier.recover(
+            [(signed["signed"], signed["signature"]) for _, signed, _ in pending],
+            blockchain.prefix,
+        )
+        for (i, signed, account), pubkey in zip(pending, keys):
+            try:
+                results[i] = _check_signer(messages[i], signed, account, pubkey)
+            except errors as e:
+                results[i] = e
+        return results
@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*-
+import logging
+import threading
+
+from .account import Account
+from .instance import BlockchainInstance
+from .market import Market
+from .price import FilledOrder, Order
+
+
+log = logging.getLogger(__name__)
+
+
+class OpenOrders(BlockchainInstance):
+    """
+    Open limit orders of an account that are maintained locally.
+
+    The orders are seeded once, either from ``get_account_limit_orders``
+    for the given markets or from ``get_full_accounts`` for all markets,
+    and afterwards kept up to date by applying the market notifications of
+    :class:`bitshares.notify.Notify` (orders of other accounts are
+    ignored). Queries do not require any RPC call.
+
+    :param bitshares.account.Account account: Account name or instance
+    :param list markets: Markets (or market strings, e.g. ``"USD:BTS"``) to
+        track (optional, defaults to all markets)
+    :param bitshares.notify.Notify notify: Notify instance to subscribe to
+        (optional, updates can also be fed to :meth:`apply`)
+    :param bitshares.bitshares.BitShares blockchain_instance: BitShares instance
+
+    .. code-block:: python
+
+        from bitshares.notify import Notify
+        from bitshares.openorders import OpenOrders
+
+        notify = Notify(markets=["USD:BTS"])
+        orders = OpenOrders("init0", markets=["USD:BTS"], notify=notify)
+        notify.listen()
+
+        # from another thread
+        orders.orders("USD:BTS")
+
+    .. note:: Notifications are only received for the markets that the
+              :class:`bitshares.notify.Notify` instance subscribes to.
+              Call :meth:`resync` after a reconnect.
+    """
+
+    def __init__(self, account, markets=None, notify=None, **kwargs):
+        BlockchainInstance.__init__(self, **kwargs)
+        self.account = Account(account, blockchain_instance=self.blockchain)
+        self.markets = None
+        if markets is not None:
+            self.markets = [self._market(m) for m in markets]
+        self.resyncs = 0
+        self._lock = threading.RLock()
+        self.resync()
+        if notify is not None:
+            notify.on_market += self.apply
+
+    def _market(self, market):
+        if not isinstance(market, Market):
+            market = Market(market, blockchain_instance=self.blockchain)
+        return market
+
+    @staticmethod
+    def _key(order):
+        sell_price = order["sell_price"]
+        return frozenset(
+            (sell_price["base"]["asset_id"], sell_price["quote"]["asset_id"])
+        )
+
+    def _account_limit_orders(self, sell, buy, limit=101):
+        """All orders of the account that sell ``sell`` for ``buy``"""
+        orders = {}
+        start = []
+        while True:
+            page = self.blockchain.rpc.get_account_limit_orders(
+                self.account["id"], sell, buy, limit, *start
+            )
+            new = [o for o in page if o["id"] not in orders]
+            for order in new:
+                orders[order["id"]] = order
+            if len(page) < limit or not new:
+                return list(orders.values())
+            # The page starts with the given order
+            start = [new[-1]["id"], new[-1]["sell_price"]]
+
+    def resync(self):
+        """Reload the open orders from the API node"""
+        if self.markets is None:
+            full = self.blockchain.rpc.get_full_accounts([self.account["id"]], False)
+            orders = full[0][1]["limit_orders"]
+        else:
+            orders = []
+            for market in self.markets:
+                base, quote = market["base"]["id"], market["quote"]["id"]
+                orders.extend(self._account_limit_orders(base, quote))
+                orders.extend(self._account_limit_orders(quote, base))
+        with self._lock:
+            self._orders = {}
+            for order in orders:
+                self._add(order)
+            self.resyncs += 1
+
+    def _tracked(self, order):
+        if self.markets is None:
+            return True
+        key = self._key(order)
+        return any(key == {m["base"]["id"], m["quote"]["id"]} for m in self.markets)
+
+    def _add(self, order):
+        if order["seller"] != self.account["id"] or not self._tracked(order):
+            return
+        for_sale = int(order["for_sale"])
+        if not for_sale:
+            self._orders.pop(order["id"], None)
+            return
+        self._orders[order["id"]] = {
+            "id": order["id"],
+            "seller": order["seller"],
+            "for_sale": for_sale,
+            "sell_price": order["sell_price"],
+            "expiration": order.get("expiration"),
+            "deferred_fee": order.get("deferred_fee"),
+        }
+
+    def apply(self, update):
+        """
+        Apply a market notification.
+
+        :param update: Instance of :class:`bitshares.price.Order`, a raw
+            limit order object or the id of a removed order. Fills and
+            other notifications are ignored (the new state of the order
+            follows as separate update).
+        """
+        with self._lock:
+            if isinstance(update, str):
+                self._orders.pop(update, None)
+            elif isinstance(update, FilledOrder) or "pays" in update:
+                return
+            elif update.get("deleted"):
+                self._orders.pop(update.get("id"), None)
+            elif "sell_price" in update and "seller" in update:
+                self._add(update)
+
+    def ids(self, market=None):
+        """Returns the ids of the open orders (of a market)"""
+        with self._lock:
+            if market is None:
+                return list(self._orders)
+            market = self._market(market)
+            key = {market["base"]["id"], market["quote"]["id"]}
+            return [i for i, o in self._orders.items() if self._key(o) == key]
+
+    def raw(self, market=None):
+        """Returns the open orders (of a market) as raw limit order objects"""
+        with self._lock:
+            return [dict(self._orders[i]) for i in self.ids(market)]
+
+    def orders(self, market=None):
+        """
+        Returns the open orders (of a market).
+
+        :param bitshares.market.Market market: Market (or market string)
+        :returns: list of :class:`bitshares.price.Order`
+        """
+        return [Order(o, blockchain_instance=self.blockchain) for o in self.raw(market)]
+
+    def __contains__(self, order_id):
+        return order_id in self._orders
+
+    def __len__(self):
+        return len(self._orders)
@@ -0,0 +1,388 @@
+# -*- coding: utf-8 -*-
+import bisect
+import itertools
+import logging
+import threading
+
+from fractions import Fraction
+
+from .amount import IntegerAmount
+from .asset import AssetInfo
+from .instance import BlockchainInstance
+from .market import Market
+from .price import FilledOrder, Order, Price, UpdateCallOrder
+
+
+log = logging.getLogger(__name__)
+
+
+class _BookSide:
+    """
+    One side of the book.
+
+    Price levels (in satoshis of base per satoshi of quote) are kept in a
+    sorted list and aggregated in ``levels`` so that the best price is
+    available in constant time and levels are found in logarithmic time
+    (bisect). Adding or removing a level shifts the list, i.e. takes linear
+    time.
+
+    The amounts of the levels are summed up in a Fenwick tree (binary
+    indexed tree) over the sorted list, hence :meth:`total` (the depth up
+    to a price) takes logarithmic time. Changes of existing levels update
+    the tree in logarithmic time, when levels are added or removed the tree
+    is rebuilt (linear time) with the next :meth:`total`.
+    """
+
+    def __init__(self, descending):
+        self.descending = descending
+        self.keys = []
+        self.levels = {}
+        self.orders = {}
+        # Fenwick trees of base and quote, None if they need to be rebuilt
+        self._sums = None
+
+    def __len__(self):
+        return len(self.keys)
+
+    def _key(self, price):
+        # Store bids negated so that both sides are sorted best-first
+        return -price if self.descending else price
+
+    def _update(self, price, base, quote):
+        if self._sums is None:
+            return
+        sums_base, sums_quote = self._sums
+        i = bisect.bisect_left(self.keys, self._key(price)) + 1
+        while i < len(sums_base):
+            sums_base[i] += base
+            sums_quote[i] += quote
+            i += i & -i
+
+    def add(self, order_id, price, base, quote):
+        if order_id in self.orders:
+            self.remove(order_id)
+        self.orders[order_id] = (price, base, quote)
+        level = self.levels.get(price)
+        if level is None:
+            bisect.insort(self.keys, self._key(price))
+            level = self.levels[price] = [0, 0, 0]
+            self._sums = None
+        level[0] += base
+        level[1] += quote
+        level[2] += 1
+        self._update(price, base, quote)
+
+    def remove(self, order_id):
+        price, base, quote = self.orders.pop(order_id)
+        level = self.levels[price]
+        level[0] -= base
+        level[1] -= quote
+        level[2] -= 1
+        if not level[2]:
+            del self.levels[price]
+            key = self._key(price)
+            del self.keys[bisect.bisect_left(self.keys, key)]
+            self._sums = None
+        self._update(price, -base, -quote)
+
+    def best(self):
+        if self.keys:
+            return self._key(self.keys[0])
+
+    def _stop(self, price):
+        """Number of levels from the best one up to ``price``"""
+        if price is None:
+            return len(self.keys)
+        return bisect.bisect_right(self.keys, self._key(price))
+
+    def walk(self, price=None):
+        """Yield ``(price, base, quote, count)`` from the best level on"""
+        for key in itertools.islice(self.keys, self._stop(price)):
+            price = self._key(key)
+            yield (price,) + tuple(self.levels[price])
+
+    def total(self, price=None):
+        """Returns the summed up ``(base, quote)`` of the levels from the
+        best one up to ``price``"""
+        if self._sums is None:
+            size = len(self.keys) + 1
+            sums_base, sums_quote = [0] * size, [0] * size
+            for i, key in enumerate(self.keys, 1):
+                level = self.levels[self._key(key)]
+                sums_base[i] += level[0]
+                sums_quote[i] += level[1]
+                parent = i + (i & -i)
+                if parent < size:
+                    sums_base[parent] += sums_base[i]
+                    sums_quote[parent] += sums_quote[i]
+            self._sums = (sums_base, sums_quote)
+        sums_base, sums_quote = self._sums
+        base = quote = 0
+        i = self._stop(price)
+        while i:
+            base += sums_base[i]
+            quote += sums_quote[i]
+            i -= i & -i
+        return base, quote
+
+
+class LocalOrderBook(BlockchainInstance):
+    """
+    Order book of a market that is maintained locally.
+
+    The book is seeded from ``get_limit_orders`` and afterwards kept up to
+    date by applying the market notifications of
+    :class:`bitshares.notify.Notify` (:class:`bitshares.price.Order`,
+    :class:`bitshares.price.FilledOrder` and
+    :class:`bitshares.price.UpdateCallOrder`). Orders are aggregated into
+    sorted price levels, hence reads do not require any RPC call.
+
+    :param bitshares.market.Market market: Market (or market string, e.g.
+        ``"USD:BTS"``)
+    :param int limit: Number of orders per side to seed from (max. 300)
+    :param bitshares.notify.Notify notify: Notify instance to subscribe to
+        (optional, updates can also be fed to :meth:`apply`)
+    :param bitshares.bitshares.BitShares blockchain_instance: BitShares instance
+
+    .. code-block:: python
+
+        from bitshares.notify import Notify
+        from bitshares.orderbook import LocalOrderBook
+
+        notify = Notify(markets=["USD:BTS"])
+        book = LocalOrderBook("USD:BTS", notify=notify)
+        notify.listen()
+
+        # from another thread
+        book.best_bid(), book.best_ask(), book.spread()
+        book.depth("bids", price=0.0035)
+
+    Notifications carry no sequence numbers. The book is therefore resynced
+    from the node whenever it detects that it missed updates, i.e. if an
+    unknown maker order of this market is filled (unless the seeded book
+    has been truncated by ``limit``) or if the book ends up crossed.
+    :meth:`resync` can also be called manually, e.g. after a reconnect.
+    """
+
+    def __init__(self, market, limit=300, notify=None, **kwargs):
+        BlockchainInstance.__init__(self, **kwargs)
+        if not isinstance(market, Market):
+            market = Market(market, blockchain_instance=self.blockchain)
+        self.market = market
+        self.base = AssetInfo.from_asset(market["base"])
+        self.quote = AssetInfo.from_asset(market["quote"])
+        self.limit = limit
+        self.sequence = 0
+        self.resyncs = 0
+        self.last_fill = None
+        self.last_call_update = None
+        self._lock = threading.RLock()
+        self.resync()
+        if notify is not None:
+            notify.on_market += self.apply
+
+    def resync(self):
+        """Rebuild the book from ``get_limit_orders``"""
+        orders = self.blockchain.rpc.get_limit_orders(
+            self.base.id, self.quote.id, self.limit
+        )
+        with self._lock:
+            self.bids = _BookSide(descending=True)
+            self.asks = _BookSide(descending=False)
+            for order in orders:
+                self._add(order)
+            # Fewer orders than the limit means we know the entire side
+            self._complete = {
+                "bids": len(self.bids.orders) < self.limit,
+                "asks": len(self.asks.orders) < self.limit,
+            }
+            self.resyncs += 1
+            self.sequence = 0
+
+    def _add(self, order):
+        sell_price = order["sell_price"]
+        sell_id = sell_price["base"]["asset_id"]
+        buy_id = sell_price["quote"]["asset_id"]
+        for_sale = int(order["for_sale"])
+        sell = int(sell_price["base"]["amount"])
+        buy = int(sell_price["quote"]["amount"])
+        if sell_id == self.base.id and buy_id == self.quote.id:
+            price = Fraction(sell, buy)
+            self.bids.add(order["id"], price, for_sale, round(for_sale / price))
+        elif sell_id == self.quote.id and buy_id == self.base.id:
+            price = Fraction(buy, sell)
+            self.asks.add(order["id"], price, round(for_sale * price), for_sale)
+
+    def _side_of(self, order_id):
+        if order_id in self.bids.orders:
+            return self.bids
+        if order_id in self.asks.orders:
+            return self.asks
+
+    def _gap(self, order_id):
+        """An order we do not know about has been touched"""
+        if all(self._complete.values()):
+            log.info("Missed updates for %s, resyncing" % order_id)
+            return True
+        return False
+
+    def _in_market(self, *asset_ids):
+        return set(asset_ids) == {self.base.id, self.quote.id}
+
+    def apply(self, update):
+        """
+        Apply a market notification to the book.
+
+        :param update: Instance of :class:`bitshares.price.Order`,
+            :class:`bitshares.price.FilledOrder` or
+            :class:`bitshares.price.UpdateCallOrder`, a raw limit order
+            object or the id of a removed order
+        """
+        resync = False
+        with self._lock:
+            if isinstance(update, str):
+                update = {"id": update, "deleted": True}
+
+            if isinstance(update, FilledOrder) or "pays" in update:
+                if not self._in_market(
+                    update["pays"]["asset_id"], update["receives"]["asset_id"]
+                ):
+                    return
+                self.last_fill = update
+                order_id = update.get("order_id", "")
+                # The new state of the order follows as separate update. The
+                # taker may fill right away and never be on the book.
+                if (
+                    update.get("is_maker")
+                    and order_id.startswith("1.7.")
+                    and self._side_of(order_id) is None
+                ):
+                    resync = self._gap(order_id)
+
+            elif isinstance(update, UpdateCallOrder) or "call_price" in update:
+                if "call_price" in update:
+                    update = UpdateCallOrder(
+                        update, blockchain_instance=self.blockchain
+                    )
+                if not self._in_market(
+                    update["base"]["asset"]["id"], update["quote"]["asset"]["id"]
+                ):
+                    return
+                self.last_call_update = update
+
+            elif update.get("deleted"):
+                # Removals carry no assets and may belong to another market
+                side = self._side_of(update["id"])
+                if side is not None:
+                    side.remove(update["id"])
+
+            elif "sell_price" in update:
+                self._add(update)
+
+            else:
+                log.error("Unknown market update type: %s" % update)
+                return
+
+            self.sequence += 1
+            bid, ask = self.bids.best(), self.asks.best()
+            if bid is not None and ask is not None and bid >= ask:
+                log.info("Book of %s is crossed, resyncing" % self.market.get_string())
+                resync = True
+
+        if resync:
+            self.resync()
+
+    def _price(self, price):
+        """Convert a price in satoshis into a float denoted in base/quote"""
+        return float(price * 10 ** self.quote.precision / 10 ** self.base.precision)
+
+    def _satoshi_price(self, price):
+        if isinstance(price, Price):
+            price = price.as_base(self.base.symbol)
+            return Fraction(int(price["base"]), int(price["quote"]))
+        return Fraction(repr(float(price))) * (
+            Fraction(10 ** self.base.precision, 10 ** self.quote.precision)
+        )
+
+    def _order(self, price, base, quote):
+        order = Order(
+            base=IntegerAmount.from_satoshis(
+                base, self.base, blockchain_instance=self.blockchain
+            ),
+            quote=IntegerAmount.from_satoshis(
+                quote, self.quote, blockchain_instance=self.blockchain
+            ),
+            blockchain_instance=self.blockchain,
+        )
+        # Amounts are rounded to satoshis, the level carries the exact price
+        dict.__setitem__(order, "price", self._price(price))
+        return order
+
+    def _side(self, side):
+        if side not in ("bids", "asks"):
+            raise ValueError("side needs to be 'bids' or 'asks'")
+        return getattr(self, side)
+
+    def best_bid(self):
+        """Returns the best bid as float (denoted in base/quote) or ``None``"""
+        with self._lock:
+            best = self.bids.best()
+        return self._price(best) if best is not None else None
+
+    def best_ask(self):
+        """Returns the best ask as float (denoted in base/quote) or ``None``"""
+        with self._lock:
+            best = self.asks.best()
+        return self._price(best) if best is not None else None
+
+    def spread(self):
+        """Returns the difference between best ask and best bid"""
+        bid, ask = self.best_bid(), self.best_ask()
+        if bid is not None and ask is not None:
+            return ask - bid
+
+    def levels(self, side, limit=25):
+        """
+        Returns the aggregated price levels of one side, best first.
+
+        :param str side: ``bids`` or ``asks``
+        :param int limit: Number of levels
+        :returns: list of :class:`bitshares.price.Order` whose ``base`` and
+            ``quote`` are the total amounts of the level
+        """
+        with self._lock:
+            rows = []
+            for price, base, quote, _ in self._side(side).walk():
+                if len(rows) >= limit:
+                    break
+                rows.append((price, base, quote))
+        return [self._order(*row) for row in rows]
+
+    def orderbook(self, limit=25):
+        """Returns ``bids`` and ``asks`` like
+        :meth:`bitshares.market.Market.orderbook` does"""
+        return {"bids": self.levels("bids", limit), "asks": self.levels("asks", limit)}
+
+    def depth(self, side, price=None):
+        """
+        Returns the accumulated amounts of one side up to a price.
+
+        The amounts of the levels are summed up in a Fenwick tree, i.e. in
+        logarithmic time of the number of levels. Once levels have been
+        added or removed, the tree is rebuilt (in linear time) first.
+
+        :param str side: ``bids`` or ``asks``
+        :param price: Worst price to include (float denoted in base/quote or
+            :class:`bitshares.price.Price`), defaults to the entire side
+        :returns: :class:`bitshares.price.Order` with the total ``base`` and
+            ``quote`` amounts (the price is their ratio)
+        """
+        if price is not None:
+            price = self._satoshi_price(price)
+        with self._lock:
+            total_base, total_quote = self._side(side).total(price)
+        average = Fraction(total_base, total_quote) if total_quote else 0
+        return self._order(average, total_base, total_quote)
+
+    def __len__(self):
+        return len(self.bids.orders) + len(self.asks.orders)
@@ -2,8 +2,8 @@
 from fractions import Fraction
 
 from .account import Account
-from .amount import Amount
-from .asset import Asset
+from .amount import Amount, IntegerAmount
+from .asset import Asset, AssetInfo
 from .exceptions import InvalidAssetException
 from .instance import BlockchainInstance
 from .utils import assets_from_string, formatTimeString, parse_time
@@ -56,6 +56,7 @@ class Price(GraphenePrice):
         * ``Price("10 GOLD", "1 USD")``
         * ``Price(Amount("10 GOLD"), Amount("1 USD"))``
         * ``Price(1.0, "USD/GOLD")``
+        * ``Price(0.315, base=Asset("USD").info, quote=Asset("BTS").info)``
 
         Instances of this class can be used in regular mathematical expressions
         (``+-*/%``) such as:
@@ -67,10 +68,44 @@ class Price(GraphenePrice):
             0.662600000 USD/BTS
     """
 
+    def __init__(self, *args, base=None, quote=None, **kwargs):
+        if (
+            len(args) == 1
+            and isinstance(base, AssetInfo)
+            and isinstance(quote, AssetInfo)
+        ):
+            self.define_classes()
+            frac = Fraction(float(args[0])).limit_denominator(10 ** base.precision)
+            self["quote"] = self.amount_class(
+                amount=frac.denominator, asset=quote, blockchain_instance=self.blockchain
+            )
+            self["base"] = self.amount_class(
+                amount=frac.numerator, asset=base, blockchain_instance=self.blockchain
+            )
+        else:
+            super().__init__(*args, base=base, quote=quote, **kwargs)
+
     def define_classes(self):
         self.amount_class = Amount
         self.asset_class = Asset
 
+    def compact(self):
+        """
+        Return this price as :class:`Price` whose amounts carry
+        :class:`bitshares.asset.AssetInfo` instead of full assets.
+        """
+        return Price(
+            base=self["base"].compact(),
+            quote=self["quote"].compact(),
+            blockchain_instance=self.blockchain,
+        )
+
+    def __mul__(self, other):
+        # Integer amounts are converted exactly on satoshis
+        if isinstance(other, IntegerAmount):
+            return other.convert(self)
+        return super().__mul__(other)
+
     @property
     def market(self):
         """
@@ -82,8 +117,8 @@ class Price(GraphenePrice):
         from .market import Market
 
         return Market(
-            base=self["base"]["asset"],
-            quote=self["quote"]["asset"],
+            base=self["base"].asset,
+            quote=self["quote"].asset,
             blockchain_instance=self.blockchain,
         )
 
@@ -0,0 +1,199 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+
+from .asset import Asset
+from .instance import BlockchainInstance
+from .market import Market
+from .orderbook import LocalOrderBook
+
+
+class SettlementSimulation(BlockchainInstance):
+    """
+    What-if simulation of margin calls and force settlements of a bitasset
+    for hypothetical settlement prices.
+
+    The call orders (``get_call_orders``), the settle orders
+    (``get_settle_orders``), the bitasset data and the asks of the market
+    debt asset : backing asset (a
+    :class:`bitshares.orderbook.LocalOrderBook`) are loaded once.
+    Afterwards :meth:`run` evaluates any number of feed prices in one
+    vectorized pass.
+
+    :param bitshares.asset.Asset asset: Bitasset
+    :param int limit: Number of call and settle orders to load
+    :param bitshares.orderbook.LocalOrderBook book: Order book of the
+        market debt asset : backing asset (optional, seeded from the node
+        otherwise)
+    :param bitshares.bitshares.BitShares blockchain_instance: BitShares instance
+
+    .. code-block:: python
+
+        from bitshares.asset import Asset
+
+        result = Asset("USD").simulate_settlement([0.0300, 0.0350, 0.0400])
+        result["margin_called"]         # number of positions per price
+        result["collateral_sold"]       # BTS sold per price
+
+    Prices are denoted in backing asset per debt asset (e.g. BTS/USD). For
+    each price, positions below the maintenance collateral ratio (MCR) are
+    margin called. They buy back their debt (or only as much as needed to
+    reach their target collateral ratio) from the asks of the order book up
+    to the maximum short squeeze price (MSSP). The target collateral ratio
+    is evaluated at the MSSP, i.e. the debt to cover is an upper bound.
+    Force settlements are executed at the feed price (minus the force
+    settlement offset) up to the maximum force settlement volume.
+
+    .. note:: This module requires NumPy (``pip install bitshares[vector]``)
+    """
+
+    def __init__(self, asset, limit=300, book=None, **kwargs):
+        BlockchainInstance.__init__(self, **kwargs)
+        self.asset = Asset(asset, blockchain_instance=self.blockchain)
+        if not self.asset.is_bitasset:
+            raise ValueError("%s is not a bitasset!" % self.asset["symbol"])
+        self.limit = limit
+        self.load(book)
+
+    def load(self, book=None):
+        """(Re)load positions, settlements and the order book"""
+        rpc = self.blockchain.rpc
+        bitasset, dynamic = rpc.get_objects(
+            [self.asset["bitasset_data_id"], self.asset["dynamic_asset_data_id"]]
+        )
+        self.backing = Asset(
+            bitasset["options"]["short_backing_asset"],
+            blockchain_instance=self.blockchain,
+        )
+        self.bitasset = bitasset
+        self.supply = int(dynamic["current_supply"])
+        feed = bitasset["current_feed"]
+        self.mcr = feed["maintenance_collateral_ratio"] / 1000
+        self.mssr = feed["maximum_short_squeeze_ratio"] / 1000
+
+        calls = rpc.get_call_orders(self.asset["id"], self.limit)
+        self.collateral = np.array(
+            [int(c["collateral"]) for c in calls], dtype=np.float64
+        ) / (10 ** self.backing["precision"])
+        self.debt = np.array([int(c["debt"]) for c in calls], dtype=np.float64) / (
+            10 ** self.asset["precision"]
+        )
+        self.target_ratio = (
+            np.array(
+                [c.get("target_collateral_ratio") or np.nan for c in calls],
+                dtype=np.float64,
+            )
+            / 1000
+        )
+
+        settles = rpc.get_settle_orders(self.asset["id"], self.limit)
+        self.settle_debt = sum(int(s["balance"]["amount"]) for s in settles) / (
+            10 ** self.asset["precision"]
+        )
+
+        if book is None:
+            market = Market(
+                base=self.backing, quote=self.asset, blockchain_instance=self.blockchain
+            )
+            book = LocalOrderBook(market, blockchain_instance=self.blockchain)
+        self._load_asks(book)
+
+    def _load_asks(self, book):
+        """Asks (selling the debt asset) as columns, best first"""
+        base = 10 ** self.backing["precision"]
+        quote = 10 ** self.asset["precision"]
+        levels = list(book.asks.walk())
+        self.ask_price = np.array(
+            [float(price) * quote / base for price, _, _, _ in levels],
+            dtype=np.float64,
+        )
+        self.ask_collateral = np.cumsum(
+            np.array([b for _, b, _, _ in levels], dtype=np.float64) / base
+        )
+        self.ask_debt = np.cumsum(
+            np.array([q for _, _, q, _ in levels], dtype=np.float64) / quote
+        )
+
+    def _debt_to_cover(self, prices, squeeze, called):
+        """Debt each margin called position buys back (prices x positions)"""
+        debt, collateral = self.debt, self.collateral
+        target = self.target_ratio * prices[:, None]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            partial = (target * debt - collateral) / (target - squeeze[:, None])
+        # Without a target ratio (or if it can't be reached) all debt is covered
+        cover = np.where(
+            np.isnan(partial) | (target <= squeeze[:, None]), debt, partial
+        )
+        return np.where(called, np.clip(cover, 0, debt), 0)
+
+    def _fill(self, debt, squeeze):
+        """Buy ``debt`` from the asks up to the squeeze price, returns the
+        debt filled and the collateral paid"""
+        if not len(self.ask_price):
+            return np.zeros_like(debt), np.zeros_like(debt)
+        available = np.searchsorted(self.ask_price, squeeze, side="right")
+        cum_debt = np.concatenate(([0.0], self.ask_debt))
+        cum_collateral = np.concatenate(([0.0], self.ask_collateral))
+        filled = np.minimum(debt, cum_debt[available])
+        level = np.minimum(
+            np.searchsorted(self.ask_debt, filled, side="left"),
+            len(self.ask_price) - 1,
+        )
+        paid = cum_collateral[level] + (
+            (filled - cum_debt[level]) * self.ask_price[level]
+        )
+        return filled, np.where(filled > 0, paid, 0)
+
+    def _settlement_volume(self):
+        """Debt that can be force settled in the current interval"""
+        options = self.bitasset["options"]
+        maximum = self.supply * options.get("maximum_force_settlement_volume", 0)
+        maximum = maximum / 10000 - int(self.bitasset.get("force_settled_volume", 0))
+        maximum = max(maximum, 0) / 10 ** self.asset["precision"]
+        return min(self.settle_debt, maximum)
+
+    def run(self, prices):
+        """
+        Simulate margin calls and force settlements.
+
+        :param prices: Hypothetical settlement prices (array of floats
+            denoted in backing asset per debt asset)
+        :returns: dict of arrays with one entry per price:
+
+            * ``price``: the settlement price
+            * ``margin_called``: number of positions below MCR
+            * ``debt_to_cover``: debt the margin called positions buy back
+            * ``debt_filled``: debt bought from the order book
+            * ``unfilled_debt``: debt to cover that exceeds the asks up to
+              the maximum short squeeze price
+            * ``collateral_sold``: collateral paid for ``debt_filled``
+            * ``settled_debt`` and ``settled_collateral``: force settled
+              debt and the collateral paid out
+            * ``global_settlement``: whether the least collateralized
+              position can not cover its debt at the squeeze price
+        """
+        prices = np.atleast_1d(np.asarray(prices, dtype=np.float64))
+        squeeze = prices * self.mssr
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ratio = self.collateral / (self.debt * prices[:, None])
+            backing_per_debt = self.collateral / self.debt
+        called = ratio < self.mcr
+        to_cover = self._debt_to_cover(prices, squeeze, called).sum(axis=1)
+        filled, sold = self._fill(to_cover, squeeze)
+
+        if len(backing_per_debt):
+            swan = backing_per_debt.min() < squeeze
+        else:
+            swan = np.zeros(len(prices), dtype=bool)
+        offset = self.bitasset["options"].get("force_settlement_offset_percent", 0)
+        settled = np.full(len(prices), self._settlement_volume())
+        return {
+            "price": prices,
+            "margin_called": called.sum(axis=1),
+            "debt_to_cover": to_cover,
+            "debt_filled": filled,
+            "unfilled_debt": to_cover - filled,
+            "collateral_sold": sold,
+            "settled_debt": settled,
+            "settled_collateral": settled * prices * (1 - offset / 10000),
+            "global_settlement": swan,
+        }
@@ -0,0 +1,271 @@
+# -*- coding: utf-8 -*-
+import calendar
+import logging
+import sqlite3
+import sys
+
+from datetime import datetime, timedelta
+
+from graphenestorage import SQLiteFile
+
+from .blockchainobject import ChainScopedCaching
+from .utils import formatTimeString, read_ahead
+
+
+log = logging.getLogger(__name__)
+
+
+def _timestamp(time):
+    if isinstance(time, str):
+        time = formatTimeString(time)
+    return calendar.timegm(time.utctimetuple())
+
+
+class SqliteTradeStore(SQLiteFile):
+    """
+    Local store of the trade history of markets.
+
+    Trades are stored by ``sequence`` in a SQLite database (by default
+    ``trades.sqlite`` in the user data directory of ``bitshares``). Each
+    call of :meth:`sync` only downloads the trades that are newer than
+    the latest stored one (and older ones if ``start`` lies before the
+    stored range). Time range queries are answered locally.
+
+    :param str profile: Name of the database file (default: ``trades``)
+    :param str data_dir: Directory of the database file (optional)
+
+    .. code-block:: python
+
+        from bitshares.market import Market
+        from bitshares.tradestore import SqliteTradeStore
+
+        store = SqliteTradeStore()
+        market = Market("USD:BTS")
+        store.sync(market, start=datetime(2020, 1, 1))
+
+        # Served from the store if the range has been synced
+        for trade in market.trades(limit=1000, start=start, store=store):
+            print(trade)
+
+    Rows are returned as by ``get_trade_history`` (newest first). The
+    stored range of a market is tracked, so that :meth:`covers` tells
+    whether a query can be answered without the API node.
+    """
+
+    __tablename__ = "trades"
+
+    def __init__(self, *args, **kwargs):
+        kwargs.setdefault("appname", "bitshares")
+        kwargs.setdefault("profile", "trades")
+        SQLiteFile.__init__(self, *args, **kwargs)
+        self.connection = sqlite3.connect(self.sqlite_file, check_same_thread=False)
+        self.create()
+
+    def create(self):
+        """Create the tables if they do not exist yet"""
+        with self.connection:
+            self.connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS {} (
+                    market TEXT NOT NULL,
+                    sequence INTEGER NOT NULL,
+                    timestamp INTEGER NOT NULL,
+                    date TEXT,
+                    price TEXT,
+                    amount TEXT,
+                    value TEXT,
+                    type TEXT,
+                    side1_account_id TEXT,
+                    side2_account_id TEXT,
+                    PRIMARY KEY (market, sequence)
+                )""".format(
+                    self.__tablename__
+                )
+            )
+            self.connection.execute(
+                "CREATE INDEX IF NOT EXISTS {0}_time ON {0} (market, timestamp)".format(
+                    self.__tablename__
+                )
+            )
+            self.connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS {}_coverage (
+                    market TEXT PRIMARY KEY,
+                    start INTEGER NOT NULL,
+                    stop INTEGER NOT NULL
+                )""".format(
+                    self.__tablename__
+                )
+            )
+
+    def close(self):
+        self.connection.close()
+
+    @staticmethod
+    def market_key(market):
+        """Returns the key of a market in the store (including the chain)"""
+        return "{}:{}:{}".format(
+            ChainScopedCaching.chain_id_of(market.blockchain),
+            market["quote"]["id"],
+            market["base"]["id"],
+        )
+
+    def coverage(self, market):
+        """Returns the synced range of a market as ``(start, stop)`` or
+        ``None``"""
+        row = self.connection.execute(
+            "SELECT start, stop FROM {}_coverage WHERE market=?".format(
+                self.__tablename__
+            ),
+            (self.market_key(market),),
+        ).fetchone()
+        if row:
+            return datetime.utcfromtimestamp(row[0]), datetime.utcfromtimestamp(row[1])
+
+    def covers(self, market, start, stop):
+        """Is the time range ``start`` to ``stop`` (UTC) stored?"""
+        coverage = self.coverage(market)
+        if not coverage:
+            return False
+        return coverage[0] <= start and stop <= coverage[1]
+
+    def _set_coverage(self, key, start, stop):
+        self.connection.execute(
+            "INSERT OR REPLACE INTO {}_coverage (market, start, stop) "
+            "VALUES (?, ?, ?)".format(self.__tablename__),
+            (key, _timestamp(start), _timestamp(stop)),
+        )
+
+    def insert(self, market, trades):
+        """
+        Store trades as returned by ``get_trade_history``.
+
+        Trades that are already stored are ignored.
+
+        :returns: Number of new trades
+        """
+        key = self.market_key(market)
+        before = self.connection.total_changes
+        with self.connection:
+            self.connection.executemany(
+                "INSERT OR IGNORE INTO {} VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)".format(
+                    self.__tablename__
+                ),
+                (
+                    (
+                        key,
+                        int(t["sequence"]),
+                        _timestamp(t["date"]),
+                        t["date"],
+                        str(t["price"]),
+                        str(t["amount"]),
+                        str(t["value"]),
+                        t.get("type"),
+                        t.get("side1_account_id"),
+                        t.get("side2_account_id"),
+                    )
+                    for t in trades
+                ),
+            )
+        return self.connection.total_changes - before
+
+    def _latest(self, key):
+        return self.connection.execute(
+            "SELECT MAX(sequence) FROM {} WHERE market=?".format(self.__tablename__),
+            (key,),
+        ).fetchone()[0]
+
+    def sync(self, market, start=None, readahead=2):
+        """
+        Download the trades of a market that are not stored yet.
+
+        :param bitshares.market.Market market: Market to sync
+        :param datetime start: Also backfill trades back to this time (UTC,
+            defaults to 24 hours before now for the first sync)
+        :param int readahead: Pages to fetch ahead (see
+            :meth:`bitshares.market.Market.trades`)
+        :returns: Number of new trades
+        """
+        key = self.market_key(market)
+        now = datetime.utcnow().replace(microsecond=0)
+        coverage = self.coverage(market)
+        if start is None:
+            start = coverage[0] if coverage else now - timedelta(hours=24)
+        count = 0
+
+        if coverage:
+            # Newer trades, stop at the first one we know already
+            latest = self._latest(key) or -1
+            pages = market.trades(
+                limit=sys.maxsize,
+                start=coverage[1],
+                stop=now,
+                readahead=readahead,
+                raw=True,
+                batch=False,
+            )
+            page = []
+            for trade in pages:
+                if int(trade["sequence"]) <= latest:
+                    break
+                page.append(trade)
+                if len(page) >= 1000:
+                    count += self.insert(market, page)
+                    page = []
+            pages.close()
+            count += self.insert(market, page)
+            stop = now
+            if start < coverage[0]:
+                # Backfill older trades
+                count += self._download(market, start, coverage[0], readahead)
+            else:
+                start = coverage[0]
+        else:
+            count += self._download(market, start, now, readahead)
+            stop = now
+
+        with self.connection:
+            self._set_coverage(key, start, stop)
+        log.debug("Stored %d new trades of %s" % (count, key))
+        return count
+
+    def _download(self, market, start, stop, readahead):
+        count = 0
+        pages = market._trade_pages(limit=sys.maxsize, start=start, stop=stop)
+        if readahead:
+            pages = read_ahead(pages, readahead)
+        for page in pages:
+            count += self.insert(market, page)
+        return count
+
+    def trades(self, market, start, stop, limit=None):
+        """
+        Returns the stored trades of a market in a time range, newest
+        first.
+
+        :param bitshares.market.Market market: Market
+        :param datetime start: start time (UTC)
+        :param datetime stop: stop time (UTC)
+        :param int limit: Maximum number of trades
+        """
+        cursor = self.connection.execute(
+            "SELECT sequence, date, price, amount, value, type, side1_account_id, "
+            "side2_account_id FROM {} WHERE market=? AND timestamp>=? AND "
+            "timestamp<=? ORDER BY sequence DESC LIMIT ?".format(self.__tablename__),
+            (
+                self.market_key(market),
+                _timestamp(start),
+                _timestamp(stop),
+                -1 if limit is None else limit,
+            ),
+        )
+        fields = [d[0] for d in cursor.description]
+        return [
+            {k: v for k, v in zip(fields, row) if v is not None}
+            for row in cursor.fetchall()
+        ]
+
+    def __len__(self):
+        return self.connection.execute(
+            "SELECT COUNT(*) FROM {}".format(self.__tablename__)
+        ).fetchone()[0]
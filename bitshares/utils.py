@@ -1,4 +1,8 @@
 # -*- coding: utf-8 -*-
+import asyncio
+import queue
+import threading
+
 from .exceptions import ObjectNotInProposalBuffer
 from .instance import BlockchainInstance
 
@@ -11,3 +15,86 @@ from graphenecommon.utils import (
     parse_time,
     assets_from_string,
 )
+
+
+def read_ahead(iterable, size=2):
+    """
+    Consume ``iterable`` in a background thread and buffer up to ``size``
+    items.
+
+    This is used to fetch the next pages of paginated API calls while the
+    consumer is still processing the current one. Exceptions raised by
+    ``iterable`` are re-raised in the consumer.
+
+    :param iterable: Iterable to read ahead (e.g. a generator of pages)
+    :param int size: Maximum number of buffered items
+    """
+    buffer = queue.Queue(maxsize=max(size, 1))
+    stop = threading.Event()
+    done = object()
+
+    def put(item):
+        # Don't block forever if the consumer went away
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce():
+        try:
+            for item in iterable:
+                if not put((item, None)):
+                    return
+        except Exception as e:
+            put((done, e))
+            return
+        put((done, None))
+
+    thread = threading.Thread(target=produce, daemon=True)
+    thread.start()
+    try:
+        while True:
+            item, error = buffer.get()
+            if item is done:
+                if error is not None:
+                    raise error
+                return
+            yield item
+    finally:
+        stop.set()
+
+
+async def read_ahead_async(aiterable, size=2):
+    """
+    Consume the asynchronous iterable ``aiterable`` in a separate task and
+    buffer up to ``size`` items (see :func:`read_ahead`).
+
+    :param aiterable: Asynchronous iterable to read ahead
+    :param int size: Maximum number of buffered items
+    """
+    buffer = asyncio.Queue(maxsize=max(size, 1))
+    done = object()
+
+    async def produce():
+        try:
+            async for item in aiterable:
+                await buffer.put((item, None))
+        except Exception as e:
+            await buffer.put((done, e))
+            return
+        await buffer.put((done, None))
+
+    task = asyncio.ensure_future(produce())
+    try:
+        while True:
+            item, error = await buffer.get()
+            if item is done:
+                if error is not None:
+                    raise error
+                return
+            yield item
+    finally:
+        task.cancel()
@@ -0,0 +1,422 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+
+from .amount import IntegerAmount
+from .asset import AssetInfo
+from .exceptions import InvalidAssetException
+from .instance import BlockchainInstance
+from .price import Price
+
+
+def _rint(values):
+    return np.rint(values).astype(np.int64)
+
+
+class AmountArray(BlockchainInstance):
+    """
+    Column of amounts of a single asset backed by a NumPy ``int64`` array.
+
+    Instead of one :class:`bitshares.amount.Amount` per row, the amounts
+    are stored as integer base units (satoshis) and all arithmetic is
+    vectorized. The asset is checked once per operation.
+
+    :param asset: Asset (symbol, id, :class:`bitshares.asset.Asset` or
+        :class:`bitshares.asset.AssetInfo`)
+    :param values: Integer amounts in base units of the asset
+    :param bitshares.bitshares.BitShares blockchain_instance: BitShares instance
+
+    .. code-block:: python
+
+        from bitshares.vector import AmountArray
+        a = AmountArray("USD", [10000, 25000])
+        b = AmountArray.from_decimals("USD", ["1.5", "0.25"])
+        (a + b).decimals        # array([2.5 , 2.75])
+        a.sum()                 # 3.5000 USD
+
+    Indexing with an integer returns a
+    :class:`bitshares.amount.IntegerAmount`, slices and masks return a new
+    :class:`AmountArray`.
+
+    .. note:: This module requires NumPy (``pip install bitshares[vector]``)
+    """
+
+    def __init__(self, asset, values=(), **kwargs):
+        BlockchainInstance.__init__(self, **kwargs)
+        self.asset = AssetInfo.load(asset, self.blockchain)
+        self.values = np.asarray(values, dtype=np.int64)
+
+    @classmethod
+    def from_decimals(cls, asset, values, **kwargs):
+        """
+        Create the column from decimal values (``float`` or ``str``).
+
+        :param asset: Asset of the amounts
+        :param values: Decimal amounts, e.g. as returned by
+            ``get_order_book`` or ``get_trade_history``
+        """
+        a = cls(asset, **kwargs)
+        a.values = _rint(np.asarray(values, dtype=np.float64) * 10 ** a.precision)
+        return a
+
+    @classmethod
+    def from_amounts(cls, amounts, asset=None, **kwargs):
+        """
+        Create the column from a list of :class:`bitshares.amount.Amount`.
+
+        :param list amounts: Amounts of the same asset
+        :param asset: Asset of the amounts (required if ``amounts`` is empty)
+        """
+        if asset is None:
+            asset = amounts[0]["asset"]
+        a = cls(asset, **kwargs)
+        for amount in amounts:
+            if amount["asset"]["id"] != a.asset.id:
+                raise InvalidAssetException
+        a.values = np.fromiter(
+            (int(IntegerAmount(x, blockchain_instance=a.blockchain)) for x in amounts),
+            dtype=np.int64,
+            count=len(amounts),
+        )
+        return a
+
+    def _new(self, values):
+        return self.__class__(self.asset, values, blockchain_instance=self.blockchain)
+
+    def _other_values(self, other):
+        if isinstance(other, AmountArray):
+            if other.asset.id != self.asset.id:
+                raise InvalidAssetException
+            return other.values
+        if isinstance(other, dict) and "asset" in other:
+            if other["asset"]["id"] != self.asset.id:
+                raise InvalidAssetException
+            return int(IntegerAmount(other, blockchain_instance=self.blockchain))
+        return _rint(np.asarray(other, dtype=np.float64) * 10 ** self.precision)
+
+    @property
+    def precision(self):
+        return self.asset.precision
+
+    @property
+    def symbol(self):
+        return self.asset.symbol
+
+    @property
+    def decimals(self):
+        """Returns the amounts as ``float64`` array"""
+        return self.values / 10 ** self.precision
+
+    def copy(self):
+        return self._new(self.values.copy())
+
+    def sum(self):
+        """Returns the sum as :class:`bitshares.amount.IntegerAmount`"""
+        return IntegerAmount.from_satoshis(
+            int(self.values.sum()), self.asset, blockchain_instance=self.blockchain
+        )
+
+    def cumsum(self):
+        """Returns the cumulative sums as new :class:`AmountArray`"""
+        return self._new(np.cumsum(self.values))
+
+    def convert(self, prices):
+        """
+        Convert each amount with the corresponding price.
+
+        :param PriceArray prices: Prices whose quote is the asset of this
+            column (same length or a single price)
+        :returns: :class:`AmountArray` in the base asset of ``prices``
+        """
+        if isinstance(prices, Price):
+            prices = PriceArray.from_prices([prices])
+        if prices.quote.asset.id != self.asset.id:
+            raise InvalidAssetException
+        base = prices.base
+        return base._new(
+            _rint(
+                self.values
+                * base.values.astype(np.float64)
+                / prices.quote.values.astype(np.float64)
+            )
+        )
+
+    def __len__(self):
+        return len(self.values)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def __getitem__(self, key):
+        if isinstance(key, (int, np.integer)):
+            return IntegerAmount.from_satoshis(
+                int(self.values[key]), self.asset, blockchain_instance=self.blockchain
+            )
+        return self._new(self.values[key])
+
+    def __repr__(self):
+        return "<AmountArray {} {}>".format(self.symbol, self.decimals)
+
+    def __neg__(self):
+        return self._new(-self.values)
+
+    def __abs__(self):
+        return self._new(np.abs(self.values))
+
+    def __add__(self, other):
+        return self._new(self.values + self._other_values(other))
+
+    def __sub__(self, other):
+        return self._new(self.values - self._other_values(other))
+
+    def __mul__(self, other):
+        if isinstance(other, (PriceArray, Price)):
+            return self.convert(other)
+        if isinstance(other, (AmountArray, dict)):
+            raise TypeError("Cannot multiply two amounts")
+        return self._new(_rint(self.values * np.asarray(other, dtype=np.float64)))
+
+    def __div__(self, other):
+        if isinstance(other, (PriceArray, Price)):
+            return self.convert(other.copy().invert())
+        if isinstance(other, AmountArray):
+            return PriceArray(self, other, blockchain_instance=self.blockchain)
+        return self._new(_rint(self.values / np.asarray(other, dtype=np.float64)))
+
+    def __lt__(self, other):
+        return self.values < self._other_values(other)
+
+    def __le__(self, other):
+        return self.values <= self._other_values(other)
+
+    def __eq__(self, other):
+        return self.values == self._other_values(other)
+
+    def __ne__(self, other):
+        return self.values != self._other_values(other)
+
+    def __ge__(self, other):
+        return self.values >= self._other_values(other)
+
+    def __gt__(self, other):
+        return self.values > self._other_values(other)
+
+    __truediv__ = __div__
+    __rmul__ = __mul__
+    __radd__ = __add__
+    __hash__ = None
+
+
+class PriceArray(BlockchainInstance):
+    """
+    Column of prices (or orders) of one market.
+
+    Like :class:`bitshares.price.Price`, a price is the ratio of a
+    ``base`` and a ``quote`` amount. Both are kept as :class:`AmountArray`
+    so that the rows can also represent the actual amounts of orders or
+    fills (as :class:`bitshares.price.Order` does).
+
+    :param AmountArray base: Amounts of the base asset
+    :param AmountArray quote: Amounts of the quote asset
+    :param bitshares.bitshares.BitShares blockchain_instance: BitShares instance
+
+    .. code-block:: python
+
+        from bitshares.vector import PriceArray
+        book = PriceArray.from_order_book(
+            bitshares.rpc.get_order_book("1.3.0", "1.3.121", 50), "BTS", "USD"
+        )
+        book["bids"].price              # float64 prices in BTS/USD
+        book["bids"].quote.cumsum()     # depth in USD
+        book["asks"].as_base("USD")     # prices in USD/BTS
+    """
+
+    def __init__(self, base, quote, **kwargs):
+        BlockchainInstance.__init__(self, **kwargs)
+        if len(base) != len(quote):
+            raise ValueError("base and quote need to have the same length")
+        self.base = base
+        self.quote = quote
+
+    @classmethod
+    def from_prices(cls, prices, base=None, quote=None, **kwargs):
+        """
+        Create the column from a list of :class:`bitshares.price.Price`.
+
+        Prices are rotated into ``base``/``quote`` if given, otherwise the
+        orientation of the first price is used.
+        """
+        if base is None or quote is None:
+            base, quote = prices[0]["base"]["asset"], prices[0]["quote"]["asset"]
+        base = AssetInfo.load(base, kwargs.get("blockchain_instance"))
+        quote = AssetInfo.load(quote, kwargs.get("blockchain_instance"))
+        prices = [p.as_base(base.symbol) for p in prices]
+        return cls(
+            AmountArray.from_amounts([p["base"] for p in prices], base, **kwargs),
+            AmountArray.from_amounts([p["quote"] for p in prices], quote, **kwargs),
+            **kwargs
+        )
+
+    @classmethod
+    def from_order_book(cls, orders, base, quote, **kwargs):
+        """
+        Create bids and asks from the result of ``get_order_book``.
+
+        :param dict orders: Result of ``get_order_book(base, quote, limit)``
+        :param base: Base asset of the market
+        :param quote: Quote asset of the market
+        :returns: dict with ``bids`` and ``asks`` as :class:`PriceArray`
+        """
+        data = {}
+        for side in ("bids", "asks"):
+            data[side] = cls(
+                AmountArray.from_decimals(
+                    base, [x["base"] for x in orders[side]], **kwargs
+                ),
+                AmountArray.from_decimals(
+                    quote, [x["quote"] for x in orders[side]], **kwargs
+                ),
+                **kwargs
+            )
+        return data
+
+    @classmethod
+    def from_limit_orders(cls, orders, base, quote, **kwargs):
+        """
+        Create bids and asks from a list of limit order objects (``1.7.x``)
+        as returned by ``get_limit_orders``.
+
+        The amounts of each row are the remaining amounts of the order
+        (``for_sale`` and what is received for it).
+
+        :param list orders: Limit order objects of the market
+        :param base: Base asset of the market
+        :param quote: Quote asset of the market
+        :returns: dict with ``bids`` and ``asks`` as :class:`PriceArray`
+        """
+        base = AssetInfo.load(base, kwargs.get("blockchain_instance"))
+        quote = AssetInfo.load(quote, kwargs.get("blockchain_instance"))
+        data = {}
+        # Bids sell the base asset, asks sell the quote asset
+        for side, sell, buy in (("bids", base, quote), ("asks", quote, base)):
+            rows = [o for o in orders if o["sell_price"]["base"]["asset_id"] == sell.id]
+            for_sale = np.array([int(o["for_sale"]) for o in rows], dtype=np.int64)
+            sell_price = np.array(
+                [int(o["sell_price"]["base"]["amount"]) for o in rows], dtype=np.int64
+            )
+            buy_price = np.array(
+                [int(o["sell_price"]["quote"]["amount"]) for o in rows], dtype=np.int64
+            )
+            sold = AmountArray(sell, for_sale, **kwargs)
+            bought = AmountArray(
+                buy, _rint(for_sale * (buy_price / sell_price)), **kwargs
+            )
+            if side == "bids":
+                data[side] = cls(sold, bought, **kwargs)
+            else:
+                data[side] = cls(bought, sold, **kwargs)
+        return data
+
+    @classmethod
+    def from_trade_history(cls, trades, base, quote, **kwargs):
+        """
+        Create the column from the result of ``get_trade_history`` (or
+        ``get_trade_history_by_sequence``).
+
+        :param list trades: Trades of the market
+        :param base: Base asset of the market
+        :param quote: Quote asset of the market
+        """
+        return cls(
+            AmountArray.from_decimals(base, [t["value"] for t in trades], **kwargs),
+            AmountArray.from_decimals(quote, [t["amount"] for t in trades], **kwargs),
+            **kwargs
+        )
+
+    def _new(self, base, quote):
+        return self.__class__(base, quote, blockchain_instance=self.blockchain)
+
+    @property
+    def price(self):
+        """Returns the prices as ``float64`` array (``nan`` for empty rows)"""
+        quote = self.quote.decimals
+        return np.divide(
+            self.base.decimals,
+            quote,
+            out=np.full(len(quote), np.nan),
+            where=quote != 0,
+        )
+
+    def symbols(self):
+        return self.base.symbol, self.quote.symbol
+
+    def copy(self):
+        return self._new(self.base.copy(), self.quote.copy())
+
+    def invert(self):
+        """Invert the prices (e.g. go from ``USD/BTS`` into ``BTS/USD``)"""
+        self.base, self.quote = self.quote, self.base
+        return self
+
+    def as_base(self, base):
+        """Returns the prices so that the base asset is ``base``.
+
+        Note: This makes a copy of the object!
+        """
+        if base == self.base.symbol:
+            return self.copy()
+        elif base == self.quote.symbol:
+            return self.copy().invert()
+        else:
+            raise InvalidAssetException
+
+    def as_quote(self, quote):
+        """Returns the prices so that the quote asset is ``quote``.
+
+        Note: This makes a copy of the object!
+        """
+        if quote == self.quote.symbol:
+            return self.copy()
+        elif quote == self.base.symbol:
+            return self.copy().invert()
+        else:
+            raise InvalidAssetException
+
+    def __len__(self):
+        return len(self.base)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def __getitem__(self, key):
+        if isinstance(key, (int, np.integer)):
+            return Price(
+                base=self.base[key],
+                quote=self.quote[key],
+                blockchain_instance=self.blockchain,
+            )
+        return self._new(self.base[key], self.quote[key])
+
+    def __repr__(self):
+        return "<PriceArray {}/{} {}>".format(
+            self.base.symbol, self.quote.symbol, self.price
+        )
+
+    def __mul__(self, other):
+        if isinstance(other, (AmountArray, dict)):
+            if isinstance(other, dict):
+                other = AmountArray(
+                    other["asset"],
+                    [int(IntegerAmount(other, blockchain_instance=self.blockchain))],
+                    blockchain_instance=self.blockchain,
+                )
+            return other.convert(self)
+        # Scale the base like Price does
+        return self._new(self.base * other, self.quote.copy())
+
+    def __div__(self, other):
+        return self._new(self.base / other, self.quote.copy())
+
+    __truediv__ = __div__
+    __rmul__ = __mul__
@@ -8,6 +8,8 @@ __all__ = [
     "objecttypes",
     "operationids",
     "operations",
+    "serializer",
     "signedtransactions",
     "transactions",
+    "verifier",
 ]
@@ -1,2 +1,139 @@
 # -*- coding: utf-8 -*-
-from graphenebase.memo import get_shared_secret, encode_memo, decode_memo, _unpad, _pad
+import hashlib
+import os
+import threading
+
+from binascii import hexlify, unhexlify
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+from graphenebase.memo import get_shared_secret, init_aes, _unpad, _pad
+
+from .account import PrivateKey, PublicKey
+
+#: Number of shared secrets to cache (see :func:`get_shared_secrets`)
+shared_secret_cache_size = 4096
+
+#: Shared secrets by digest of (private key, public key), least recently
+#: used first
+_shared_secrets = OrderedDict()
+_shared_secrets_lock = threading.Lock()
+
+
+def _derive_shared_secret(pair):
+    """Derive the shared secret of a key pair given as hex"""
+    priv, pub = pair
+    return get_shared_secret(PrivateKey(priv), PublicKey(pub))
+
+
+def _pair_digest(priv, pub):
+    """Cache key of a key pair that does not reveal the private key"""
+    return hashlib.sha256(bytes(priv) + bytes(pub)).digest()
+
+
+def clear_shared_secrets():
+    """Remove all cached shared secrets"""
+    with _shared_secrets_lock:
+        _shared_secrets.clear()
+
+
+def get_shared_secrets(pairs, max_workers=1):
+    """Derive the shared secrets of many key pairs
+
+    Shared secrets are cached (least recently used) by a digest of the key
+    pair, only the pairs that are not cached are derived, optionally by a
+    pool of processes. :func:`clear_shared_secrets` empties the cache.
+
+    :param list pairs: ``(PrivateKey, PublicKey)`` pairs
+    :param int max_workers: Number of processes (``None`` for the number
+        of CPUs); with ``1`` the secrets are derived in this process
+    :return: Shared secrets (hex) of the pairs in order
+    :rtype: list
+    """
+    pairs = list(pairs)
+    keys = [_pair_digest(priv, pub) for priv, pub in pairs]
+    with _shared_secrets_lock:
+        secrets = {}
+        for key in keys:
+            if key in _shared_secrets:
+                _shared_secrets.move_to_end(key)
+                secrets[key] = _shared_secrets[key]
+    jobs = {}
+    for key, (priv, pub) in zip(keys, pairs):
+        if key not in secrets and key not in jobs:
+            jobs[key] = (repr(priv), repr(pub))
+    missing = list(jobs)
+
+    workers = max_workers or os.cpu_count() or 1
+    if workers == 1 or len(missing) < 2:
+        derived = [_derive_shared_secret(job) for job in jobs.values()]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            chunksize = max(1, len(missing) // (4 * workers))
+            derived = list(
+                executor.map(
+                    _derive_shared_secret, jobs.values(), chunksize=chunksize
+                )
+            )
+
+    with _shared_secrets_lock:
+        for key, secret in zip(missing, derived):
+            secrets[key] = _shared_secrets[key] = secret
+        while len(_shared_secrets) > shared_secret_cache_size:
+            _shared_secrets.popitem(last=False)
+    return [secrets[key] for key in keys]
+
+
+def encode_memo_with_secret(shared_secret, nonce, message):
+    """Encode a message with a shared secret (see :func:`encode_memo`)"""
+    aes = init_aes(shared_secret, nonce)
+    raw = bytes(message, "utf8")
+    # Prepend the first 4 bytes of the checksum, pad to the AES block size
+    raw = _pad(hashlib.sha256(raw).digest()[0:4] + raw, 16)
+    return hexlify(aes.encrypt(raw)).decode("ascii")
+
+
+def decode_memo_with_secret(shared_secret, nonce, message):
+    """Decode a message with a shared secret (see :func:`decode_memo`)"""
+    aes = init_aes(shared_secret, nonce)
+    cleartext = aes.decrypt(unhexlify(bytes(message, "ascii")))
+    # The first 4 bytes are the checksum of the (unpadded) message
+    checksum = cleartext[0:4]
+    message = _unpad(cleartext[4:], 16)
+    if hashlib.sha256(message).digest()[0:4] != checksum:  # pragma: no cover
+        raise ValueError("checksum verification failure")
+    return message.decode("utf8")
+
+
+def encode_memo(priv, pub, nonce, message):
+    """Encode a message with a shared secret between Alice and Bob
+
+    :param PrivateKey priv: Private Key (of Alice)
+    :param PublicKey pub: Public Key (of Bob)
+    :param int nonce: Random nonce
+    :param str message: Memo message
+    :return: Encrypted message
+    :rtype: hex
+
+    The shared secret is cached (see :func:`get_shared_secrets`).
+    """
+    (shared_secret,) = get_shared_secrets([(priv, pub)])
+    return encode_memo_with_secret(shared_secret, nonce, message)
+
+
+def decode_memo(priv, pub, nonce, message):
+    """Decode a message with a shared secret between Alice and Bob
+
+    :param PrivateKey priv: Private Key (of Bob)
+    :param PublicKey pub: Public Key (of Alice)
+    :param int nonce: Nonce used for Encryption
+    :param bytes message: Encrypted Memo message
+    :return: Decrypted message
+    :rtype: str
+    :raise ValueError: if message cannot be decoded as valid UTF-8
+           string
+
+    The shared secret is cached (see :func:`get_shared_secrets`).
+    """
+    (shared_secret,) = get_shared_secrets([(priv, pub)])
+    return decode_memo_with_secret(shared_secret, nonce, message)
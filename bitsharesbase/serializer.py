@@ -0,0 +1,1089 @@
+# -*- coding: utf-8 -*-
+import struct
+import time as _time
+
+from binascii import hexlify, unhexlify
+from calendar import timegm
+from functools import lru_cache
+
+from graphenebase.utils import unicodify
+
+from .account import PublicKey
+from .objects import Operation
+from .objecttypes import object_type
+from .operationids import operations
+from .operations import ticket_type_strings
+
+
+default_prefix = "BTS"
+timeformat = "%Y-%m-%dT%H:%M:%S"
+
+
+def varint(n):
+    """Varint encoding"""
+    if n < 0x80:
+        return bytes((n,))
+    data = bytearray()
+    while n >= 0x80:
+        data.append((n & 0x7F) | 0x80)
+        n >>= 7
+    data.append(n)
+    return bytes(data)
+
+
+def read_varint(data, offset):
+    """Returns a varint and the offset after it"""
+    result = shift = 0
+    while True:
+        byte = data[offset]
+        offset += 1
+        result |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return result, offset
+        shift += 7
+
+
+@lru_cache(maxsize=4096)
+def public_key_bytes(key, prefix=default_prefix):
+    """Returns the 33 bytes of a (base58 encoded) public key"""
+    return bytes(PublicKey(key, prefix=prefix))
+
+
+@lru_cache(maxsize=4096)
+def public_key_address(key, prefix=default_prefix):
+    """Returns the address of a public key, the order of keys in
+    authorities"""
+    return repr(PublicKey(key, prefix=prefix).address)
+
+
+@lru_cache(maxsize=4096)
+def public_key_string(raw, prefix=default_prefix):
+    """Returns the base58 encoded public key of 33 bytes"""
+    return str(PublicKey(hexlify(raw).decode("ascii"), prefix=prefix))
+
+
+class Field:
+    """A field of a serialization plan
+
+    ``encode(buf, value, prefix)`` appends the wire format of the plain
+    (json) ``value`` to the bytearray ``buf``. ``decode(data, offset,
+    prefix)`` reads a value from ``data`` (a memoryview) at ``offset`` and
+    returns it together with the offset after it.
+    """
+
+    def encode(self, buf, value, prefix=default_prefix):
+        raise NotImplementedError
+
+    def decode(self, data, offset=0, prefix=default_prefix):
+        raise NotImplementedError
+
+
+class Integer(Field):
+    def __init__(self, fmt):
+        packer = struct.Struct(fmt)
+        self.pack = packer.pack
+        self.unpack_from = packer.unpack_from
+        self.size = packer.size
+
+    def encode(self, buf, value, prefix=default_prefix):
+        buf += self.pack(int(value))
+
+    def decode(self, data, offset=0, prefix=default_prefix):
+        return self.unpack_from(data, offset)[0], offset + self.size
+
+
+class Bool(Integer):
+    def __init__(self):
+        super().__init__("<B")
+
+    def decode(self, data, offset=0, prefix=default_prefix):
+        return bool(data[offset]), offset + 1
+
+
+class Varint(Field):
+    def encode(self, buf, value, prefix=default_prefix):
+        buf += varint(int(value))
+
+    def decode(self, data, offset=0, prefix=default_prefix):
+        return read_varint(data, offset)
+
+
+class Constant(Field):
+    """Always serializes to the same bytes (e.g. an unsupported optional
+    field), decodes to ``None``"""
+
+    def __init__(self, data):
+        self.data = data
+
+    def encode(self, buf, value, prefix=default_prefix):
+        buf += self.data
+
+    def decode(self, data, offset=0, prefix=default_prefix):
+        end = offset + len(self.data)
+        if data[offset:end] != self.data:
+            raise ValueError("Unexpected data at offset {}".format(offset))
+        return None, end
+
+
+class Empty(Constant):
+    """Empty extensions"""
+
+    def __init__(self):
+        super().__init__(b"\x00")
+
+    def decode(self, data, offset=0, prefix=default_prefix):
+        if data[offset]:
+            raise ValueError("Unsupported extensions at offset {}".format(offset))
+        return [], offset + 1
+
+
+class ObjectId(Field):
+    """Object id of a given type, serializes to the instance only"""
+
+    def __init__(self, type_name):
+        self.type_name = type_name
+        self.type = object_type[type_name]
+
+    def encode(self, buf, value, prefix=default_prefix):
+        space, type, instance = value.split(".")
+        if int(type) != self.type:
+            raise ValueError(
+                "Object id {} is not of type {}".format(value, self.type_name)
+            )
+        buf += varint(int(instance))
+
+    def decode(self, data, offset=0, prefix=default_prefix):
+        instance, offset = read_varint(data, offset)
+        return "1.{}.{}".format(self.type, instance), offset
+
+
+class PointInTime(Field):
+    def encode(self, buf, value, prefix=default_prefix):
+        buf += struct.pack(
+            "<I",
+            timegm(
+                (
+                    int(value[0:4]),
+                    int(value[5:7]),
+                    int(value[8:10]),
+                    int(value[11:13]),
+                    int(value[14:16]),
+                    int(value[17:19]),
+                )
+            ),
+        )
+
+    def decode(self, data, offset=0, prefix=default_prefix):
+        (timestamp,) = struct.unpack_from("<I", data, offset)
+        return _time.strftime(timeformat, _time.gmtime(timestamp)), offset + 4
+
+
+class String(Field):
+    def encode(self, buf, value, prefix=default_prefix):
+        if not value:
+            buf.append(0)
+            return
+        # unicodify only alters control characters
+        data = value.encode("utf-8") if value.isprintable() else unicodify(value)
+        buf += varint(len(data))
+        buf += data
+
+    def decode(self, data, offset=0, prefix=default_prefix):
+        length, offset = read_varint(data, offset)
+        end = offset + length
+        return str(data[offset:end], "utf-8"), end
+
+
+class Bytes(Field):
+    """Length prefixed bytes given as hex string"""
+
+    def encode(self, buf, value, prefix=default_prefix):
+        data = unhexlify(value)
+        buf += varint(len(data))
+        buf += data
+
+    def decode(self, data, offset=0, prefix=default_prefix):
+        length, offset = read_varint(data, offset)
+        end = offset + length
+        return data[offset:end].hex(), end
+
+
+class Hash(Field):
+    """Fixed length bytes given as hex string (hashes, signatures)"""
+
+    def __init__(self, size):
+        self.size = size
+
+    def encode(self, buf, value, prefix=default_prefix):
+        buf += unhexlify(value)
+
+    def decode(self, data, offset=0, prefix=default_prefix):
+        end = offset + self.size
+        return data[offset:end].hex(), end
+
+
+class PublicKeyField(Field):
+    def encode(self, buf, value, prefix=default_prefix):
+        buf += public_key_bytes(value, prefix)
+
+    def decode(self, data, offset=0, prefix=default_prefix):
+        end = offset + 33
+        return public_key_string(bytes(data[offset:end]), prefix), end
+
+
+class VoteId(Field):
+    def encode(self, buf, value, prefix=default_prefix):
+        type, instance = value.split(":")
+        buf += struct.pack("<I", (int(type) & 0xFF) | (int(instance) << 8))
+
+    def decode(self, data, offset=0, prefix=default_prefix):
+        (vote,) = struct.unpack_from("<I", data, offset)
+        return "{}:{}".format(vote & 0xFF, vote >> 8), offset + 4
+
+
+class TicketType(Varint):
+    def encode(self, buf, value, prefix=default_prefix):
+        if not isinstance(value, int):
+            value = ticket_type_strings.index(value)
+        buf += varint(value)
+
+
+class Optional(Field):
+    """
+    Optional field, absent if the value is ``None`` (or falsy with
+    ``truthy=True``). Like :class:`graphenebase.types.Optional`, a value
+    that serializes to nothing is absent, too.
+    """
+
+    def __init__(self, field, truthy=False):
+        self.field = field
+        self.truthy = truthy
+
+    def encode(self, buf, value, prefix=default_prefix):
+        if value is None or (self.truthy and not value):
+            buf.append(0)
+            return
+        start = len(buf)
+        buf.append(1)
+        self.field.encode(buf, value, prefix)
+        if len(buf) == start + 1:
+            buf[start] = 0
+
+    def decode(self, data, offset=0, prefix=default_prefix):
+        if not data[offset]:
+            return None, offset + 1
+        return self.field.decode(data, offset + 1, prefix)
+
+
+class Array(Field):
+    """Length prefixed list, optionally sorted (and deduplicated) like the
+    corresponding object does"""
+
+    def __init__(self, field, key=None, unique=False):
+        self.field = field
+        self.key = key
+        self.unique = unique
+
+    def encode(self, buf, value, prefix=default_prefix):
+        value = value or []
+        if self.unique:
+            value = set(value)
+        if self.key:
+            value = sorted(value, key=self.key)
+        buf += varint(len(value))
+        encode = self.field.encode
+        for item in value:
+            encode(buf, item, prefix)
+
+    def decode(self, data, offset=0, prefix=default_prefix):
+        length, offset = read_varint(data, offset)
+        decode = self.field.decode
+        result = []
+        for _ in range(length):
+            item, offset = decode(data, offset, prefix)
+            result.append(item)
+        return result, offset
+
+
+class Map(Field):
+    """Length prefixed list of ``[key, value]`` pairs"""
+
+    def __init__(self, key, value):
+        self.key = key
+        self.value = value
+
+    def encode(self, buf, value, prefix=default_prefix):
+        buf += varint(len(value))
+        for k, v in value:
+            self.key.encode(buf, k, prefix)
+            self.value.encode(buf, v, prefix)
+
+    def decode(self, data, offset=0, prefix=default_prefix):
+        length, offset = read_varint(data, offset)
+        result = []
+        for _ in range(length):
+            k, offset = self.key.decode(data, offset, prefix)
+            v, offset = self.value.decode(data, offset, prefix)
+            result.append([k, v])
+        return result, offset
+
+
+class KeyAuths(Map):
+    """Key authorities of a permission, ordered by address"""
+
+    def __init__(self):
+        super().__init__(PublicKeyField(), uint16)
+
+    def encode(self, buf, value, prefix=default_prefix):
+        value = sorted(value, key=lambda x: public_key_address(x[0], prefix))
+        super().encode(buf, value, prefix)
+
+
+class StaticVariant(Field):
+    """``[type_id, data]`` with one field per type id"""
+
+    def __init__(self, *fields):
+        self.fields = fields
+
+    def encode(self, buf, value, prefix=default_prefix):
+        type_id, data = value
+        if type_id >= len(self.fields):
+            raise ValueError("Unknown type id {}".format(type_id))
+        buf += varint(type_id)
+        self.fields[type_id].encode(buf, data, prefix)
+
+    def decode(self, data, offset=0, prefix=default_prefix):
+        type_id, offset = read_varint(data, offset)
+        if type_id >= len(self.fields):
+            raise ValueError("Unknown type id {}".format(type_id))
+        value, offset = self.fields[type_id].decode(data, offset, prefix)
+        return [type_id, value], offset
+
+
+class Extension(Field):
+    """Extensions given as dictionary, serialized as static variants
+    ordered by their index"""
+
+    def __init__(self, *fields):
+        self.fields = fields
+
+    def encode(self, buf, value, prefix=default_prefix):
+        items = []
+        if isinstance(value, dict):
+            for index, (name, field) in enumerate(self.fields):
+                for key, data in value.items():
+                    if key.lower() == name.lower():
+                        items.append((index, field, data))
+        buf += varint(len(items))
+        for index, field, data in items:
+            buf += varint(index)
+            field.encode(buf, data, prefix)
+
+    def decode(self, data, offset=0, prefix=default_prefix):
+        length, offset = read_varint(data, offset)
+        result = {}
+        for _ in range(length):
+            index, offset = read_varint(data, offset)
+            if index >= len(self.fields):
+                raise ValueError("Unknown extension {}".format(index))
+            name, field = self.fields[index]
+            result[name], offset = field.decode(data, offset, prefix)
+        return result, offset
+
+
+class Struct(Field):
+    """
+    Serialization plan of an object: the fields in wire order.
+
+    The plan is a precomputed tuple of ``(name, encode)`` pairs that write
+    directly into a single bytearray. Like the objects, a struct may
+    override the prefix of its public keys with a ``prefix`` key. Decoding
+    omits absent optional fields (like the json of the objects).
+    """
+
+    def __init__(self, *fields):
+        self.fields = fields
+        self.plan = tuple((name, field.encode) for name, field in fields)
+        self.decoders = tuple((name, field.decode) for name, field in fields)
+
+    def encode(self, buf, value, prefix=default_prefix):
+        get = value.get
+        prefix = get("prefix", prefix)
+        for name, encode in self.plan:
+            encode(buf, get(name), prefix)
+
+    def decode(self, data, offset=0, prefix=default_prefix):
+        result = {}
+        for name, decode in self.decoders:
+            value, offset = decode(data, offset, prefix)
+            if value is not None:
+                result[name] = value
+        return result, offset
+
+
+class Memo(Struct):
+    """Memo, serializes to nothing without message"""
+
+    def encode(self, buf, value, prefix=default_prefix):
+        if value.get("message"):
+            super().encode(buf, value, prefix)
+
+
+class OperationField(Field):
+    """``[id or name, data]`` of an operation"""
+
+    def encode(self, buf, value, prefix=default_prefix):
+        op_id, data = value
+        if isinstance(op_id, str):
+            op_id = operations[op_id]
+        plan = operation_plans.get(op_id)
+        if plan is None:
+            # Fall back to the operation classes
+            buf += bytes(Operation([op_id, data]))
+            return
+        buf += varint(op_id)
+        plan.encode(buf, data, prefix)
+
+    def decode(self, data, offset=0, prefix=default_prefix):
+        op_id, offset = read_varint(data, offset)
+        plan = operation_plans.get(op_id)
+        if plan is None:
+            raise ValueError("Cannot decode operation {}".format(op_id))
+        value, offset = plan.decode(data, offset, prefix)
+        return [op_id, value], offset
+
+
+uint8 = Integer("<B")
+uint16 = Integer("<H")
+uint32 = Integer("<I")
+uint64 = Integer("<Q")
+int64 = Integer("<q")
+bool_ = Bool()
+empty = Empty()
+string = String()
+time = PointInTime()
+public_key = PublicKeyField()
+account_id = ObjectId("account")
+asset_id = ObjectId("asset")
+operation = OperationField()
+
+asset = Struct(("amount", int64), ("asset_id", asset_id))
+price = Struct(("base", asset), ("quote", asset))
+price_feed = Struct(
+    ("settlement_price", price),
+    ("maintenance_collateral_ratio", uint16),
+    ("maximum_short_squeeze_ratio", uint16),
+    ("core_exchange_rate", price),
+)
+memo = Memo(
+    ("from", public_key),
+    ("to", public_key),
+    ("nonce", uint64),
+    ("message", Bytes()),
+)
+permission = Struct(
+    ("weight_threshold", uint32),
+    ("account_auths", Map(account_id, uint16)),
+    ("key_auths", KeyAuths()),
+    ("extensions", empty),
+)
+account_options = Struct(
+    ("memo_key", public_key),
+    ("voting_account", account_id),
+    ("num_witness", uint16),
+    ("num_committee", uint16),
+    ("votes", Array(VoteId(), key=lambda x: float(x.split(":")[1]), unique=True)),
+    ("extensions", empty),
+)
+asset_options = Struct(
+    ("max_supply", int64),
+    ("market_fee_percent", uint16),
+    ("max_market_fee", int64),
+    ("issuer_permissions", uint16),
+    ("flags", uint16),
+    ("core_exchange_rate", price),
+    ("whitelist_authorities", Array(account_id)),
+    ("blacklist_authorities", Array(account_id)),
+    ("whitelist_markets", Array(asset_id)),
+    ("blacklist_markets", Array(asset_id)),
+    ("description", string),
+    ("extensions", empty),
+)
+bitasset_options = Struct(
+    ("feed_lifetime_sec", uint32),
+    ("minimum_feeds", uint8),
+    ("force_settlement_delay_sec", uint32),
+    ("force_settlement_offset_percent", uint16),
+    ("maximum_force_settlement_volume", uint16),
+    ("short_backing_asset", asset_id),
+    ("extensions", empty),
+)
+worker_initializer = StaticVariant(
+    Struct(), Struct(("pay_vesting_period_days", uint16)), Struct()
+)
+special_authority = StaticVariant(
+    Struct(), Struct(("asset", asset_id), ("num_top_holders", uint8))
+)
+account_create_extensions = Extension(
+    ("null_ext", Struct()),
+    ("owner_special_authority", special_authority),
+    ("active_special_authority", special_authority),
+    (
+        "buyback_options",
+        Struct(
+            ("asset_to_buy", asset_id),
+            ("asset_to_buy_issuer", account_id),
+            ("markets", Array(asset_id)),
+        ),
+    ),
+)
+call_order_extensions = Extension(("target_collateral_ratio", uint16))
+assert_predicate = StaticVariant(
+    Struct(("account_id", account_id), ("name", string)),
+    Struct(("asset_id", asset_id), ("symbol", string)),
+    Struct(("id", Hash(20))),
+)
+htlc_hash = StaticVariant(Hash(20), Hash(20), Hash(32), Hash(20))
+
+
+#: Serialization plans by operation id (for the operations of
+#: :mod:`bitsharesbase.operations`)
+operation_plans = {
+    operations[name]: plan
+    for name, plan in [
+        (
+            "transfer",
+            Struct(
+                ("fee", asset),
+                ("from", account_id),
+                ("to", account_id),
+                ("amount", asset),
+                ("memo", Optional(memo, truthy=True)),
+                ("extensions", empty),
+            ),
+        ),
+        (
+            "asset_publish_feed",
+            Struct(
+                ("fee", asset),
+                ("publisher", account_id),
+                ("asset_id", asset_id),
+                ("feed", price_feed),
+                ("extensions", empty),
+            ),
+        ),
+        (
+            "asset_create",
+            Struct(
+                ("fee", asset),
+                ("issuer", account_id),
+                ("symbol", string),
+                ("precision", uint8),
+                ("common_options", asset_options),
+                ("bitasset_opts", Optional(bitasset_options, truthy=True)),
+                ("is_prediction_market", bool_),
+                ("extensions", empty),
+            ),
+        ),
+        (
+            "asset_update",
+            Struct(
+                ("fee", asset),
+                ("issuer", account_id),
+                ("asset_to_update", asset_id),
+                ("new_issuer", Constant(b"\x00")),
+                ("new_options", asset_options),
+                ("extensions", empty),
+            ),
+        ),
+        (
+            "asset_update_bitasset",
+            Struct(
+                ("fee", asset),
+                ("issuer", account_id),
+                ("asset_to_update", asset_id),
+                ("new_options", bitasset_options),
+                ("extensions", empty),
+            ),
+        ),
+        (
+            "asset_issue",
+            Struct(
+                ("fee", asset),
+                ("issuer", account_id),
+                ("asset_to_issue", asset),
+                ("issue_to_account", account_id),
+                ("memo", Optional(memo, truthy=True)),
+                ("extensions", empty),
+            ),
+        ),
+        (
+            "proposal_create",
+            Struct(
+                ("fee", asset),
+                ("fee_paying_account", account_id),
+                ("expiration_time", time),
+                ("proposed_ops", Array(Struct(("op", operation)))),
+                ("review_period_seconds", Optional(uint32)),
+                ("extensions", empty),
+            ),
+        ),
+        (
+            "proposal_update",
+            Struct(
+                ("fee", asset),
+                ("fee_paying_account", account_id),
+                ("proposal", ObjectId("proposal")),
+                ("active_approvals_to_add", Array(account_id)),
+                ("active_approvals_to_remove", Array(account_id)),
+                ("owner_approvals_to_add", Array(account_id)),
+                ("owner_approvals_to_remove", Array(account_id)),
+                ("key_approvals_to_add", Array(public_key)),
+                ("key_approvals_to_remove", Array(public_key)),
+                ("extensions", empty),
+            ),
+        ),
+        (
+            "limit_order_create",
+            Struct(
+                ("fee", asset),
+                ("seller", account_id),
+                ("amount_to_sell", asset),
+                ("min_to_receive", asset),
+                ("expiration", time),
+                ("fill_or_kill", bool_),
+                ("extensions", empty),
+            ),
+        ),
+        (
+            "limit_order_cancel",
+            Struct(
+                ("fee", asset),
+                ("fee_paying_account", account_id),
+                ("order", ObjectId("limit_order")),
+                ("extensions", empty),
+            ),
+        ),
+        (
+            "call_order_update",
+            Struct(
+                ("fee", asset),
+                ("funding_account", account_id),
+                ("delta_collateral", asset),
+                ("delta_debt", asset),
+                ("extensions", call_order_extensions),
+            ),
+        ),
+        (
+            "asset_fund_fee_pool",
+            Struct(
+                ("fee", asset),
+                ("from_account", account_id),
+                ("asset_id", asset_id),
+                ("amount", int64),
+                ("extensions", empty),
+            ),
+        ),
+        (
+            "asset_claim_fees",
+            Struct(
+                ("fee", asset),
+                ("issuer", account_id),
+                ("amount_to_claim", asset),
+                ("extensions", empty),
+            ),
+        ),
+        (
+            "asset_claim_pool",
+            Struct(
+                ("fee", asset),
+                ("issuer", account_id),
+                ("asset_id", asset_id),
+                ("amount_to_claim", asset),
+                ("extensions", empty),
+            ),
+        ),
+        (
+            "override_transfer",
+            Struct(
+                ("fee", asset),
+                ("issuer", account_id),
+                ("from", account_id),
+                ("to", account_id),
+                ("amount", asset),
+                ("memo", Optional(memo)),
+                ("extensions", empty),
+            ),
+        ),
+        (
+            "account_create",
+            Struct(
+                ("fee", asset),
+                ("registrar", account_id),
+                ("referrer", account_id),
+                ("referrer_percent", uint16),
+                ("name", string),
+                ("owner", permission),
+                ("active", permission),
+                ("options", account_options),
+                ("extensions", account_create_extensions),
+            ),
+        ),
+        (
+            "account_update",
+            Struct(
+                ("fee", asset),
+                ("account", account_id),
+                ("owner", Optional(permission)),
+                ("active", Optional(permission)),
+                ("new_options", Optional(account_options)),
+                ("extensions", empty),
+            ),
+        ),
+        (
+            "account_whitelist",
+            Struct(
+                ("fee", asset),
+                ("authorizing_account", account_id),
+                ("account_to_list", account_id),
+                ("new_listing", uint8),
+                ("extensions", empty),
+            ),
+        ),
+        (
+            "vesting_balance_withdraw",
+            Struct(
+                ("fee", asset),
+                ("vesting_balance", ObjectId("vesting_balance")),
+                ("owner", account_id),
+                ("amount", asset),
+            ),
+        ),
+        (
+            "account_upgrade",
+            Struct(
+                ("fee", asset),
+                ("account_to_upgrade", account_id),
+                ("upgrade_to_lifetime_member", bool_),
+                ("extensions", empty),
+            ),
+        ),
+        (
+            "witness_update",
+            Struct(
+                ("fee", asset),
+                ("witness", ObjectId("witness")),
+                ("witness_account", account_id),
+                ("new_url", Optional(string, truthy=True)),
+                ("new_signing_key", Optional(public_key, truthy=True)),
+            ),
+        ),
+        (
+            "asset_update_feed_producers",
+            Struct(
+                ("fee", asset),
+                ("issuer", account_id),
+                ("asset_to_update", asset_id),
+                (
+                    "new_feed_producers",
+                    Array(account_id, key=lambda x: float(x.split(".")[2])),
+                ),
+                ("extensions", empty),
+            ),
+        ),
+        (
+            "asset_reserve",
+            Struct(
+                ("fee", asset),
+                ("payer", account_id),
+                ("amount_to_reserve", asset),
+                ("extensions", empty),
+            ),
+        ),
+        (
+            "worker_create",
+            Struct(
+                ("fee", asset),
+                ("owner", account_id),
+                ("work_begin_date", time),
+                ("work_end_date", time),
+                ("daily_pay", uint64),
+                ("name", string),
+                ("url", string),
+                ("initializer", worker_initializer),
+            ),
+        ),
+        (
+            "withdraw_permission_create",
+            Struct(
+                ("fee", asset),
+                ("withdraw_from_account", account_id),
+                ("authorized_account", account_id),
+                ("withdrawal_limit", asset),
+                ("withdrawal_period_sec", uint32),
+                ("periods_until_expiration", uint32),
+                ("period_start_time", time),
+            ),
+        ),
+        (
+            "asset_global_settle",
+            Struct(
+                ("fee", asset),
+                ("issuer", account_id),
+                ("asset_to_settle", asset_id),
+                ("settle_price", price),
+                ("extensions", empty),
+            ),
+        ),
+        (
+            "committee_member_create",
+            Struct(
+                ("fee", asset),
+                ("committee_member_account", account_id),
+                ("url", string),
+            ),
+        ),
+        (
+            "custom",
+            Struct(
+                ("fee", asset),
+                ("payer", account_id),
+                ("required_auths", Array(account_id)),
+                ("id", uint16),
+                ("data", Bytes()),
+            ),
+        ),
+        (
+            "bid_collateral",
+            Struct(
+                ("fee", asset),
+                ("bidder", account_id),
+                ("additional_collateral", asset),
+                ("debt_covered", asset),
+                ("extensions", empty),
+            ),
+        ),
+        (
+            "balance_claim",
+            Struct(
+                ("fee", asset),
+                ("deposit_to_account", account_id),
+                ("balance_to_claim", ObjectId("balance")),
+                ("balance_owner_key", public_key),
+                ("total_claimed", asset),
+            ),
+        ),
+        (
+            "asset_settle",
+            Struct(
+                ("fee", asset),
+                ("account", account_id),
+                ("amount", asset),
+                ("extensions", empty),
+            ),
+        ),
+        (
+            "htlc_create",
+            Struct(
+                ("fee", asset),
+                ("from", account_id),
+                ("to", account_id),
+                ("amount", asset),
+                ("preimage_hash", htlc_hash),
+                ("preimage_size", uint16),
+                ("claim_period_seconds", uint32),
+                ("extensions", empty),
+            ),
+        ),
+        (
+            "htlc_redeem",
+            Struct(
+                ("fee", asset),
+                ("htlc_id", ObjectId("htlc")),
+                ("redeemer", account_id),
+                ("preimage", Bytes()),
+                ("extensions", empty),
+            ),
+        ),
+        (
+            "htlc_extend",
+            Struct(
+                ("fee", asset),
+                ("htlc_id", ObjectId("htlc")),
+                ("update_issuer", account_id),
+                ("seconds_to_add", uint32),
+                ("extensions", empty),
+            ),
+        ),
+        (
+            "asset_update_issuer",
+            Struct(
+                ("fee", asset),
+                ("issuer", account_id),
+                ("asset_to_update", asset_id),
+                ("new_issuer", account_id),
+                ("extensions", empty),
+            ),
+        ),
+        (
+            "assert",
+            Struct(
+                ("fee", asset),
+                ("fee_paying_account", account_id),
+                ("predicates", Array(assert_predicate)),
+                ("required_auths", Array(account_id)),
+                ("extensions", empty),
+            ),
+        ),
+        (
+            "ticket_create_operation",
+            Struct(
+                ("fee", asset),
+                ("account", account_id),
+                ("target_type", TicketType()),
+                ("amount", asset),
+                ("extensions", empty),
+            ),
+        ),
+        (
+            "ticket_update_operation",
+            Struct(
+                ("fee", asset),
+                ("ticket", ObjectId("ticket")),
+                ("account", account_id),
+                ("target_type", TicketType()),
+                ("amount_for_new_target", Optional(asset, truthy=True)),
+                ("extensions", empty),
+            ),
+        ),
+        (
+            "liquidity_pool_create",
+            Struct(
+                ("fee", asset),
+                ("account", account_id),
+                ("asset_a", asset_id),
+                ("asset_b", asset_id),
+                ("share_asset", asset_id),
+                ("taker_fee_percent", uint16),
+                ("withdrawal_fee_percent", uint16),
+                ("extensions", empty),
+            ),
+        ),
+        (
+            "liquidity_pool_delete",
+            Struct(
+                ("fee", asset),
+                ("account", account_id),
+                ("pool", ObjectId("liquidity_pool")),
+                ("extensions", empty),
+            ),
+        ),
+        (
+            "liquidity_pool_deposit",
+            Struct(
+                ("fee", asset),
+                ("account", account_id),
+                ("pool", ObjectId("liquidity_pool")),
+                ("amount_a", asset),
+                ("amount_b", asset),
+                ("extensions", empty),
+            ),
+        ),
+        (
+            "liquidity_pool_withdraw",
+            Struct(
+                ("fee", asset),
+                ("account", account_id),
+                ("pool", ObjectId("liquidity_pool")),
+                ("share_amount", asset),
+                ("extensions", empty),
+            ),
+        ),
+        (
+            "liquidity_pool_exchange",
+            Struct(
+                ("fee", asset),
+                ("account", account_id),
+                ("pool", ObjectId("liquidity_pool")),
+                ("amount_to_sell", asset),
+                ("min_to_receive", asset),
+                ("extensions", empty),
+            ),
+        ),
+    ]
+}
+
+transaction = Struct(
+    ("ref_block_num", uint16),
+    ("ref_block_prefix", uint32),
+    ("expiration", time),
+    ("operations", Array(operation)),
+    ("extensions", empty),
+)
+signed_transaction = Struct(*transaction.fields, ("signatures", Array(Hash(65))))
+
+
+def serialize_operation(op, prefix=default_prefix):
+    """
+    Serialize an operation (identical to ``bytes(Operation(op))``).
+
+    :param list op: ``[id or name, data]`` with ``data`` a plain dict (e.g.
+        ``Operation.json()``)
+    :param str prefix: Prefix of the public keys
+    """
+    buf = bytearray()
+    operation.encode(buf, op, prefix)
+    return bytes(buf)
+
+
+def serialize_transaction(tx, signatures=True, prefix=default_prefix):
+    """
+    Serialize a transaction (identical to ``bytes(Signed_Transaction)``).
+
+    :param dict tx: Transaction as plain dict (e.g.
+        ``Signed_Transaction.json()``)
+    :param bool signatures: Include the signatures (the digest that is
+        signed excludes them)
+    :param str prefix: Prefix of the public keys
+
+    Operations without serialization plan (see :data:`operation_plans`)
+    are serialized with the operation classes.
+    """
+    buf = bytearray()
+    (signed_transaction if signatures else transaction).encode(buf, tx, prefix)
+    return bytes(buf)
+
+
+def _decode(field, data, prefix):
+    data = memoryview(data)
+    value, offset = field.decode(data, 0, prefix)
+    if offset != len(data):
+        raise ValueError("{} trailing bytes".format(len(data) - offset))
+    return value
+
+
+def deserialize_operation(data, prefix=default_prefix):
+    """
+    Parse a serialized operation.
+
+    :param data: bytes (or memoryview) of the operation
+    :param str prefix: Prefix of the public keys
+    :returns: ``[id, data]`` like ``Operation.json()``
+    """
+    return _decode(operation, data, prefix)
+
+
+def deserialize_transaction(data, signatures=True, prefix=default_prefix):
+    """
+    Parse a serialized transaction.
+
+    :param data: bytes (or memoryview) of the transaction, e.g. a
+        ``get_transaction_hex`` or ``bytes(Signed_Transaction)``
+    :param bool signatures: Whether the data contains the signatures
+    :param str prefix: Prefix of the public keys
+    :returns: the transaction like ``Signed_Transaction.json()``
+
+    The data is read in place. Object ids are assumed to be protocol ids
+    (``1.x.y``) since only their instance is serialized.
+    """
+    return _decode(signed_transaction if signatures else transaction, data, prefix)
@@ -1,10 +1,41 @@
 # -*- coding: utf-8 -*-
+import os
+
+from binascii import hexlify, unhexlify
+from concurrent.futures import ProcessPoolExecutor
+
+from graphenebase.ecdsa import sign_message
 from graphenebase.signedtransactions import (
     Signed_Transaction as GrapheneSigned_Transaction,
 )
 
 from .chains import known_chains
 from .operations import Operation
+from .serializer import deserialize_transaction, serialize_transaction
+
+
+#: Private keys of a signing worker (see :meth:`Signed_Transaction.sign_many`)
+_worker_wifs = []
+
+
+def _init_signer(wifs):
+    """Initialize a signing worker with the private keys once"""
+    global _worker_wifs
+    _worker_wifs = wifs
+
+
+def _sign_with(wifs, job):
+    """Sign a transaction (json) with the keys of the given indices,
+    returns the signatures as hex"""
+    chain_id, prefix, tx, keys = job
+    message = unhexlify(chain_id) + serialize_transaction(
+        tx, signatures=False, prefix=prefix
+    )
+    return [hexlify(sign_message(message, wifs[i])).decode("ascii") for i in keys]
+
+
+def _sign(job):
+    return _sign_with(_worker_wifs, job)
 
 
 class Signed_Transaction(GrapheneSigned_Transaction):
@@ -20,3 +51,76 @@ class Signed_Transaction(GrapheneSigned_Transaction):
     known_chains = known_chains
     default_prefix = "BTS"
     operation_klass = Operation
+
+    @classmethod
+    def from_bytes(cls, data, prefix=None):
+        """
+        Load a serialized (signed) transaction.
+
+        :param data: bytes of the transaction (see
+            :func:`bitsharesbase.serializer.deserialize_transaction`)
+        :param str prefix: Prefix of the public keys
+        """
+        return cls(**deserialize_transaction(data, prefix=prefix or cls.default_prefix))
+
+    @classmethod
+    def sign_many(cls, transactions, wifs, chain=None, max_workers=None):
+        """
+        Sign many transactions in parallel.
+
+        The digests are computed and signed by a pool of processes
+        (``concurrent.futures.ProcessPoolExecutor``). The private keys are
+        passed once to every worker, the transactions only reference them.
+
+        :param list transactions: Transactions as plain dicts (e.g.
+            :meth:`json`)
+        :param list wifs: Private keys to sign every transaction with, or
+            one list of private keys per transaction
+        :param chain: Chain identifier or parameters (see :meth:`sign`)
+        :param int max_workers: Number of processes (defaults to the number
+            of CPUs); with ``1`` the transactions are signed in this process
+        :returns: list of the transactions (in order) with their signatures
+            added
+
+        .. code-block:: python
+
+            signed = Signed_Transaction.sign_many(
+                [tx.json() for tx in txs], [wif], chain="BTS"
+            )
+        """
+        transactions = list(transactions)
+        if wifs and isinstance(wifs[0], str):
+            wifs = [wifs] * len(transactions)
+        if len(wifs) != len(transactions):
+            raise ValueError("Need one list of private keys per transaction")
+
+        # Index the unique keys, the jobs only carry the indices
+        keys = {}
+        for tx_wifs in wifs:
+            for wif in tx_wifs:
+                keys.setdefault(wif, len(keys))
+        chain_params = cls().getChainParams(chain or cls.default_prefix)
+        jobs = [
+            (
+                chain_params["chain_id"],
+                chain_params.get("prefix", cls.default_prefix),
+                tx,
+                list(dict.fromkeys(keys[wif] for wif in tx_wifs)),
+            )
+            for tx, tx_wifs in zip(transactions, wifs)
+        ]
+
+        workers = max_workers or os.cpu_count() or 1
+        if workers == 1 or len(jobs) < 2:
+            signatures = [_sign_with(list(keys), job) for job in jobs]
+        else:
+            with ProcessPoolExecutor(
+                max_workers=workers, initializer=_init_signer, initargs=(list(keys),)
+            ) as executor:
+                chunksize = max(1, len(jobs) // (4 * workers))
+                signatures = list(executor.map(_sign, jobs, chunksize=chunksize))
+
+        return [
+            dict(tx, signatures=list(tx.get("signatures") or []) + sigs)
+            for tx, sigs in zip(transactions, signatures)
+        ]
@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+import hashlib
+import os
+import threading
+
+from binascii import unhexlify
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+from graphenebase.ecdsa import verify_message
+
+from .serializer import default_prefix, public_key_string, serialize_transaction
+from .signedtransactions import Signed_Transaction
+
+
+def _recover(job):
+    """Recover the (compressed) public key of a signature, returns ``None``
+    if the signature is invalid"""
+    message, signature = job
+    try:
+        return bytes(verify_message(message, signature))
+    except Exception:
+        return None
+
+
+class SignatureVerifier:
+    """
+    Recover the public keys of many signatures in a pool of processes.
+
+    Recovered keys are cached (least recently used) by signature and
+    digest of the signed message, hence signatures that are seen again
+    (e.g. a pending transaction that is broadcast by several nodes, or
+    included in a block afterwards) are not recovered twice.
+
+    :param int max_workers: Number of processes (defaults to the number of
+        CPUs); with ``1`` the keys are recovered in this process
+    :param int cache_size: Number of recovered keys to cache
+    :param str prefix: Prefix of the public keys
+
+    .. code-block:: python
+
+        from bitsharesbase.verifier import SignatureVerifier
+
+        verifier = SignatureVerifier()
+        verifier.recover([(message, signature), ...])
+        verifier.verify_transactions([tx.json(), ...], chain="BTS")
+
+    The processes are started for every batch with signatures that are not
+    cached and shut down once the batch is recovered, only the cache is
+    kept.
+    """
+
+    def __init__(self, max_workers=None, cache_size=10000, prefix=default_prefix):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.cache_size = cache_size
+        self.prefix = prefix
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _recover_all(self, jobs):
+        if self.max_workers == 1 or len(jobs) < 2:
+            return [_recover(job) for job in jobs]
+        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+            chunksize = max(1, len(jobs) // (4 * self.max_workers))
+            return list(executor.map(_recover, jobs, chunksize=chunksize))
+
+    def _recover_cached(self, items):
+        """Returns the compressed public keys (bytes or ``None``)"""
+        keys, jobs = [], {}
+        for message, signature in items:
+            if isinstance(message, str):
+                message = message.encode("utf-8")
+            if isinstance(signature, str):
+                signature = unhexlify(signature)
+            key = (bytes(signature), hashlib.sha256(message).digest())
+            keys.append(key)
+            jobs[key] = (bytes(message), key[0])
+
+        with self._lock:
+            results = {}
+            for key in jobs:
+                if key in self._cache:
+                    self._cache.move_to_end(key)
+                    results[key] = self._cache[key]
+        missing = [key for key in jobs if key not in results]
+        recovered = self._recover_all([jobs[key] for key in missing])
+
+        with self._lock:
+            for key, pubkey in zip(missing, recovered):
+                results[key] = self._cache[key] = pubkey
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+        return [results[key] for key in keys]
+
+    def recover(self, items, prefix=None):
+        """
+        Recover the public keys of many signatures.
+
+        :param list items: ``(message, signature)`` pairs; the message as
+            bytes or str, the signature as bytes or hex
+        :param str prefix: Prefix of the public keys (defaults to the
+            prefix of the verifier)
+        :returns: list with the public key (str) of every item, or ``None``
+            if the signature is invalid
+        """
+        prefix = prefix or self.prefix
+        return [
+            public_key_string(pubkey, prefix) if pubkey else None
+            for pubkey in self._recover_cached(items)
+        ]
+
+    def verify_transactions(self, transactions, chain=None):
+        """
+        Recover the public keys that signed many transactions.
+
+        :param list transactions: Signed transactions as plain dicts (e.g.
+            ``json()`` or the transactions of ``on_tx``)
+        :param chain: Chain identifier or parameters (see
+            :meth:`bitsharesbase.signedtransactions.Signed_Transaction.sign`)
+        :returns: list with the public keys of every transaction, one per
+            signature (``None`` for an invalid signature or a transaction
+            that can not be serialized)
+        """
+        chain_params = Signed_Transaction().getChainParams(chain or self.prefix)
+        chain_id = unhexlify(chain_params["chain_id"])
+        prefix = chain_params.get("prefix", self.prefix)
+
+        messages = []
+        for tx in transactions:
+            try:
+                message = chain_id + serialize_transaction(
+                    tx, signatures=False, prefix=prefix
+                )
+            except Exception:
+                # e.g. an operation that is unknown to this library
+                message = None
+            messages.append((message, tx.get("signatures") or []))
+        keys = iter(
+            self.recover(
+                [
+                    (message, signature)
+                    for message, signatures in messages
+                    if message is not None
+                    for signature in signatures
+                ],
+                prefix,
+            )
+        )
+        return [
+            [next(keys) if message is not None else None for _ in signatures]
+            for message, signatures in messages
+        ]
@@ -34,6 +34,75 @@ set_shared_blockchain_instance(bitshares)
 assert bitshares.nobroadcast
 
 
+def limit_order(id, sell, sell_asset, buy, buy_asset, for_sale, seller="1.2.100"):
+    """Limit order object (1.7.x) as returned by the API"""
+    return {
+        "id": id,
+        "seller": seller,
+        "for_sale": for_sale,
+        "expiration": "2030-01-01T00:00:00",
+        "sell_price": {
+            "base": {"amount": sell, "asset_id": sell_asset},
+            "quote": {"amount": buy, "asset_id": buy_asset},
+        },
+    }
+
+
+# Limit orders of init0 in the USD:BTS market: two bids and an ask
+limit_orders = [
+    limit_order("1.7.1", 3000000, "1.3.0", 100, "1.3.121", 1000000),
+    limit_order("1.7.2", 2990000, "1.3.0", 100, "1.3.121", 2990000),
+    limit_order("1.7.3", 100, "1.3.121", 3100000, "1.3.0", 500),
+]
+
+
+def price_feed(eur_per_usd):
+    """Price feed of USD (1.3.121), backed by EUR (1.3.120)"""
+    return {
+        "settlement_price": {
+            "base": {"amount": 10000, "asset_id": "1.3.121"},
+            "quote": {"amount": int(eur_per_usd * 10000), "asset_id": "1.3.120"},
+        },
+        "maintenance_collateral_ratio": 1750,
+        "maximum_short_squeeze_ratio": 1100,
+    }
+
+
+def bitasset_data(eur_per_usd, **options):
+    """Bitasset data (2.4.21) of USD with a feed of ``eur_per_usd``"""
+    return {
+        "id": "2.4.21",
+        "options": dict(options, short_backing_asset="1.3.120"),
+        "force_settled_volume": 0,
+        "current_feed": price_feed(eur_per_usd),
+    }
+
+
+def call_order(id, collateral, debt, target=None):
+    """Call order (1.8.x) of init0 that borrows USD against EUR"""
+    call = {
+        "id": id,
+        "borrower": "1.2.100",
+        "collateral": collateral,
+        "debt": debt,
+        "call_price": {
+            "base": {"amount": 1, "asset_id": "1.3.120"},
+            "quote": {"amount": 1, "asset_id": "1.3.121"},
+        },
+    }
+    if target:
+        call["target_collateral_ratio"] = target
+    return call
+
+
+# Debt positions in USD at collateral ratios 1.5, 2.0 and 4.0 for a feed of 1
+call_orders = [
+    call_order("1.8.1", 15000, 10000),
+    call_order("1.8.2", 20000, 10000, target=2000),
+    call_order("1.8.3", 40000, 10000),
+]
+
+
 def fixture_data():
     # Clear tx buffer
     bitshares.clear()
@@ -125,3 +125,96 @@ class Testcases(unittest.TestCase):
         self.assertEqual(update["owner"], "1.2.0")
         self.assertIsInstance(update.account, Account)
         update.__repr__()
+
+    def test_fills(self):
+        from bitshares.account import FillHistory
+        from bitshares.market import Market
+
+        def fill(i, asset="1.3.121"):
+            return {
+                "id": "1.11.%d" % i,
+                "block_num": i,
+                "op": [
+                    4,
+                    {
+                        "order_id": "1.7.%d" % i,
+                        "account_id": "1.2.100",
+                        "pays": {"amount": 100000, "asset_id": "1.3.0"},
+                        "receives": {"amount": 1000 * i, "asset_id": asset},
+                        "fee": {"amount": 0, "asset_id": "1.3.0"},
+                    },
+                ],
+            }
+
+        history = [fill(i) if i % 2 else fill(i, "1.3.120") for i in range(1, 251)]
+
+        def get_account_history(account, stop, limit, start, api=None):
+            stop = int(stop.split(".")[2])
+            start = int(start.split(".")[2]) or len(history)
+            return [
+                h for h in reversed(history) if stop < h["block_num"] <= start
+            ][:limit]
+
+        FillHistory.clear()
+        market = Market("USD:BTS")
+        with mock.patch.object(
+            bitshares.rpc, "get_account_history", side_effect=get_account_history
+        ) as rpc:
+            fills = market.accountfills("init0", limit=3)
+            self.assertEqual([f["block_num"] for f in fills], [245, 247, 249])
+            self.assertEqual(rpc.call_count, 1)
+            self.assertEqual(float(fills[-1]["quote"]), 24.9)
+
+            # Only newer operations are fetched
+            history.append(fill(251))
+            fills = market.accountfills("init0", limit=3)
+            self.assertEqual([f["block_num"] for f in fills], [247, 249, 251])
+            self.assertEqual(rpc.call_count, 2)
+
+            self.assertEqual(len(market.accountfills("init0", limit=None)), 126)
+            self.assertEqual(len(Account("init0").fills()), 251)
+
+    def test_fills_of_new_account(self):
+        from bitshares.account import FillHistory
+
+        history = []
+
+        def get_account_history(account, stop, limit, start, api=None):
+            stop = int(stop.split(".")[2])
+            start = int(start.split(".")[2]) or len(history)
+            return [
+                h for h in reversed(history) if stop < h["block_num"] <= start
+            ][:limit]
+
+        FillHistory.clear()
+        with mock.patch.object(
+            bitshares.rpc, "get_account_history", side_effect=get_account_history
+        ):
+            self.assertEqual(Account("init0").fills(), [])
+
+            # The first fill of the account
+            history.append(
+                {
+                    "id": "1.11.1",
+                    "block_num": 1,
+                    "op": [
+                        4,
+                        {
+                            "order_id": "1.7.1",
+                            "account_id": "1.2.100",
+                            "pays": {"amount": 100000, "asset_id": "1.3.0"},
+                            "receives": {"amount": 1000, "asset_id": "1.3.121"},
+                            "fee": {"amount": 0, "asset_id": "1.3.0"},
+                        },
+                    ],
+                }
+            )
+            self.assertEqual(Account("init0").fills(), history)
+
+        # The cache is bounded and cleared with the instance's caches
+        with mock.patch.object(FillHistory, "cache_size", 1):
+            FillHistory.of(Account("init0"))
+            FillHistory.of(Account("init1"))
+            self.assertEqual(len(FillHistory.cache), 1)
+        bitshares.clear_cache()
+        self.assertEqual(len(FillHistory.cache), 0)
@@ -1,8 +1,9 @@
 # -*- coding: utf-8 -*-
 import unittest
 from bitshares import BitShares
-from bitshares.amount import Amount
-from bitshares.asset import Asset
+from bitshares.amount import Amount, IntegerAmount
+from bitshares.asset import Asset, AssetInfo
+from bitshares.price import Price
 from bitshares.instance import set_shared_bitshares_instance, SharedInstance
 from .fixtures import fixture_data, bitshares
 
@@ -211,3 +212,63 @@ class Testcases(unittest.TestCase):
         a2 = Amount(1, self.symbol)
         self.assertTrue(a1 == a2)
         self.assertTrue(a1 == 1)
+
+    def test_asset_info(self):
+        info = self.asset.info
+        self.assertIs(info, AssetInfo(self.asset["id"], self.symbol, self.precision))
+        self.assertEqual(info["symbol"], self.symbol)
+        with self.assertRaises(AttributeError):
+            info.symbol = "FOO"
+
+        amount = Amount(1.3, info)
+        self.assertIs(amount["asset"], info)
+        self.assertEqual(float(amount), 1.3)
+        self.assertEqual(amount["symbol"], self.symbol)
+        amount = Amount({"amount": 13 * 10 ** (self.precision - 1), "asset": info})
+        self.assertEqual(float(amount), 1.3)
+
+        # Arithmetic keeps the compact descriptor
+        amount2 = amount + Amount(1, info)
+        self.assertIs(amount2["asset"], info)
+        self.assertEqual(float(amount2), 2.3)
+        self.assertEqual(amount2, Amount(2.3, self.symbol))
+        self.assertEqual(amount2.json(), Amount(2.3, self.symbol).json())
+
+        # Full asset is obtained on demand
+        self.assertIsInstance(amount2.asset, Asset)
+        self.assertIs(Amount(1, self.symbol).compact()["asset"], info)
+
+    def test_integer_amount(self):
+        amount = IntegerAmount("0.3 {}".format(self.symbol))
+        self.assertEqual(int(amount), 3 * 10 ** (self.precision - 1))
+        self.assertIsInstance(amount["asset"], AssetInfo)
+        self.assertEqual(
+            amount.json(),
+            {"amount": 3 * 10 ** (self.precision - 1), "asset_id": self.asset["id"]},
+        )
+
+        # No floating point drift
+        a = IntegerAmount(0.1, self.symbol) + IntegerAmount(0.2, self.symbol)
+        self.assertEqual(a, amount)
+        self.assertEqual(int(amount * 3), 9 * 10 ** (self.precision - 1))
+        self.assertEqual(int(amount / 3), 10 ** (self.precision - 1))
+        self.assertEqual(IntegerAmount(Amount(amount)), amount)
+        self.assertEqual(
+            IntegerAmount.from_satoshis(int(amount), self.asset), amount
+        )
+        self.assertEqual(
+            str(amount), "{:.{}f} {}".format(0.3, self.precision, self.symbol)
+        )
+
+        # Conversion with prices
+        price = Price(2.5, "{}/{}".format(self.asset2["symbol"], self.symbol))
+        converted = amount * price
+        self.assertEqual(converted["symbol"], self.asset2["symbol"])
+        self.assertEqual(int(converted), int(amount.convert(2.5, self.asset2)))
+        self.assertEqual(price * amount, converted)
+        self.assertEqual(converted / price, amount)
+
+        with self.assertRaises(AssertionError):
+            amount + IntegerAmount(1, self.asset2)
+        with self.assertRaises(TypeError):
+            amount ** 2
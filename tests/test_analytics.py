@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+import unittest
+import math
+from bitshares.amount import Amount
+from bitshares.analytics import OrderBookSnapshot, spread_statistics
+from .fixtures import fixture_data, bitshares
+
+
+book = {
+    "bids": [
+        {"price": "300", "base": "3000", "quote": "10"},
+        {"price": "290", "base": "290", "quote": "1"},
+    ],
+    "asks": [
+        {"price": "310", "base": "310", "quote": "1"},
+        {"price": "320", "base": "3200", "quote": "10"},
+    ],
+}
+
+
+class Testcases(unittest.TestCase):
+    def setUp(self):
+        fixture_data()
+        self.book = OrderBookSnapshot(book, "BTS", "USD")
+
+    def test_spread(self):
+        self.assertEqual(self.book.best("bids"), 300)
+        self.assertEqual(self.book.mid(), 305)
+        self.assertEqual(self.book.spread(), 10)
+        stats = spread_statistics([self.book, self.book])
+        self.assertAlmostEqual(stats["mean"], 10 / 305)
+        self.assertEqual(stats["std"], 0)
+
+    def test_depth(self):
+        price, quote, base = self.book.depth("asks")
+        self.assertEqual(list(price), [310, 320])
+        self.assertEqual(list(quote), [1, 11])
+        self.assertEqual(list(base), [310, 3510])
+        self.assertEqual(float(self.book.depth_within(0.02)), 1)
+        self.assertEqual(float(self.book.depth_within(0.02, "bids")), 10)
+
+    def test_vwap(self):
+        self.assertEqual(self.book.vwap(1), 310)
+        self.assertEqual(self.book.vwap(2), 315)
+        self.assertEqual(self.book.vwap(Amount("630 BTS")), 315)
+        self.assertEqual(self.book.cost(2), 630)
+        self.assertAlmostEqual(self.book.vwap(10.5, side="bids"), 3145 / 10.5)
+        vwap = self.book.vwap([1, 11, 12])
+        self.assertAlmostEqual(vwap[1], 3510 / 11)
+        self.assertTrue(math.isnan(vwap[2]))
+
+    def test_slippage(self):
+        self.assertEqual(self.book.slippage(1), 0)
+        self.assertAlmostEqual(self.book.slippage(2), 5 / 310)
+        self.assertAlmostEqual(self.book.price_impact(1), 5 / 305)
+        self.assertAlmostEqual(self.book.price_impact(5, side="bids"), 5 / 305)
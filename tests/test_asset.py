@@ -33,3 +33,12 @@ class Testcases(unittest.TestCase):
         self.assertEqual(asset.permissions, asset["permissions"])
         self.assertIsInstance(asset.flags, dict)
         self.assertEqual(asset.flags, asset["flags"])
+
+    def test_negative_cache(self):
+        Asset.clear_negative_cache()
+        for _ in range(3):
+            with self.assertRaises(AssetDoesNotExistsException):
+                Asset("FOObarNonExisting", full=False)
+        stats = Asset.negative_cache_stats()
+        self.assertEqual(stats["stores"], 1)
+        self.assertEqual(stats["hits"], 2)
@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 import mock
+import multiprocessing
 import string
 import unittest
 import random
@@ -10,8 +11,9 @@ from bitsharesbase.operationids import getOperationNameForId
 from bitshares.amount import Amount
 from bitsharesbase.account import PrivateKey
 from bitsharesbase.asset_permissions import todict
+from bitsharesbase.signedtransactions import Signed_Transaction
 from bitshares.instance import set_shared_bitshares_instance
-from .fixtures import fixture_data, bitshares
+from .fixtures import fixture_data, bitshares, wifs
 
 
 class Testcases(unittest.TestCase):
@@ -61,6 +63,60 @@ class Testcases(unittest.TestCase):
         amount = Amount(op["amount"])
         self.assertEqual(float(amount), 1.33)
 
+    def batch_transactions(self):
+        """Unsigned transfers that miss a signature of the second key"""
+        keys = [PrivateKey(wif).pubkey for wif in wifs]
+        return keys, [
+            {
+                "ref_block_num": 34294,
+                "ref_block_prefix": 3707022213,
+                "expiration": "2016-04-06T08:29:27",
+                "operations": [
+                    [
+                        0,
+                        {
+                            "fee": {"amount": 0, "asset_id": "1.3.0"},
+                            "from": "1.2.100",
+                            "to": "1.2.101",
+                            "amount": {"amount": i, "asset_id": "1.3.0"},
+                            "extensions": [],
+                        },
+                    ]
+                ],
+                "extensions": [],
+                "signatures": [],
+                "missing_signatures": [str(keys[1])],
+            }
+            for i in range(1, 5)
+        ]
+
+    def test_sign_batch(self):
+        keys, txs = self.batch_transactions()
+        signed = bitshares.sign_batch(txs, wifs=[wifs[0]], max_workers=2)
+        self.assertEqual(len(signed), 4)
+        for tx, signed_tx in zip(txs, signed):
+            self.assertEqual(signed_tx["operations"], tx["operations"])
+            self.assertEqual(len(signed_tx["signatures"]), 2)
+            Signed_Transaction(**signed_tx).verify(keys, "BTS")
+
+    def test_verify_batch(self):
+        keys, txs = self.batch_transactions()
+        signed = bitshares.sign_batch(txs, wifs=[wifs[0]], max_workers=1)
+
+        # Tamper with an operation and a signature
+        signed[1]["operations"][0][1]["amount"]["amount"] = 100
+        signed[2]["signatures"][0] = "1f" + "00" * 64
+        with mock.patch.object(bitshares.verifier, "max_workers", 2):
+            verified = bitshares.verify_batch(signed)
+        # The processes do not outlive the batch
+        self.assertEqual(multiprocessing.active_children(), [])
+        expected = [str(key) for key in keys]
+        self.assertEqual(verified[0], expected)
+        self.assertNotIn(verified[1][0], expected)
+        self.assertEqual(verified[2], [None, expected[1]])
+        self.assertEqual(verified[3], expected)
+        self.assertEqual(bitshares.verify_batch(signed[3:]), [expected])
+
     def test_create_account(self):
         name = "".join(random.choice(string.ascii_lowercase) for _ in range(12))
         key1 = PrivateKey()
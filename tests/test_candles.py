@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+import unittest
+from datetime import datetime
+from bitshares.candles import CandleAggregator, bucket_open
+from bitshares.market import Market
+from bitshares.price import FilledOrder
+from .fixtures import fixture_data, bitshares
+
+
+def fill(base, quote, is_maker=True):
+    return {
+        "order_id": "1.7.1",
+        "account_id": "1.2.100",
+        "pays": {"amount": base, "asset_id": "1.3.0"},
+        "receives": {"amount": quote, "asset_id": "1.3.121"},
+        "fill_price": {
+            "base": {"amount": base, "asset_id": "1.3.0"},
+            "quote": {"amount": quote, "asset_id": "1.3.121"},
+        },
+        "is_maker": is_maker,
+        "time": "2020-01-01T00:01:30",
+    }
+
+
+class Testcases(unittest.TestCase):
+    def setUp(self):
+        fixture_data()
+        self.market = Market("USD:BTS")
+
+    def test_bucket_open(self):
+        self.assertEqual(
+            bucket_open(datetime(2020, 1, 1, 0, 7, 13), 300),
+            datetime(2020, 1, 1, 0, 5),
+        )
+
+    def test_aggregate(self):
+        candles = CandleAggregator(self.market, bucket=60)
+        candles.apply(FilledOrder(fill(300000, 10000)))
+        candles.apply(FilledOrder(fill(300000, 10000, is_maker=False)))
+        candles.apply(fill(400000, 10000))
+        candles.apply(
+            {"date": "2020-01-01T00:02:10", "amount": "1", "value": "2", "price": "2"}
+        )
+        self.assertEqual(len(candles), 2)
+        first = list(candles)[0]
+        self.assertEqual(first["time"], datetime(2020, 1, 1, 0, 1))
+        self.assertEqual(first["open"], 3)
+        self.assertEqual(first["high"], 4)
+        self.assertEqual(first["close"], 4)
+        self.assertEqual(float(first["base_volume"]), 7)
+        self.assertEqual(float(first["quote_volume"]), 2)
+        self.assertEqual(candles.current["low"], 2)
+
+        resampled = candles.resample(300)
+        self.assertEqual(len(resampled), 1)
+        self.assertEqual(resampled[0]["time"], datetime(2020, 1, 1))
+        self.assertEqual(resampled[0]["low"], 2)
+        self.assertEqual(float(resampled[0]["base_volume"]), 9)
+        with self.assertRaises(ValueError):
+            candles.resample(90)
+
+    def test_from_bucket(self):
+        candles = CandleAggregator(self.market, bucket=60)
+        bucket = {
+            "key": {
+                "base": "1.3.0",
+                "quote": "1.3.121",
+                "seconds": 60,
+                "open": "2020-01-01T00:00:00",
+            },
+            "open_base": 300000,
+            "open_quote": 10000,
+            "high_base": 400000,
+            "high_quote": 10000,
+            "low_base": 200000,
+            "low_quote": 10000,
+            "close_base": 300000,
+            "close_quote": 10000,
+            "base_volume": 900000,
+            "quote_volume": 30000,
+        }
+        candle = candles.from_bucket(bucket)
+        self.assertEqual(candle["high"], 4)
+        self.assertEqual(float(candle["base_volume"]), 9)
+
+        inverted = CandleAggregator(Market("BTS:USD"), bucket=60)
+        candle = inverted.from_bucket(bucket)
+        self.assertEqual(candle["high"], 0.5)
+        self.assertEqual(candle["low"], 0.25)
+        self.assertEqual(float(candle["quote_volume"]), 9)
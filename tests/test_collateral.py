@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+import unittest
+import mock
+from bitshares.collateral import CollateralMonitor
+from .fixtures import (
+    fixture_data,
+    bitshares,
+    bitasset_data,
+    call_order,
+    call_orders,
+    price_feed,
+)
+
+
+class Testcases(unittest.TestCase):
+    def setUp(self):
+        fixture_data()
+
+    def monitor(self, **kwargs):
+        with mock.patch.multiple(
+            bitshares.rpc,
+            get_object=mock.Mock(return_value=bitasset_data(1.0)),
+            get_call_orders=mock.Mock(return_value=call_orders),
+        ):
+            return CollateralMonitor("USD", **kwargs)
+
+    def test_ratios(self):
+        monitor = self.monitor()
+        self.assertEqual(len(monitor), 3)
+        self.assertTrue(monitor.complete)
+        self.assertEqual(list(monitor.ratio), [1.5, 2.0, 4.0])
+        self.assertAlmostEqual(monitor.call_price[1], 2.0 / 1.75)
+        self.assertEqual([p["id"] for p in monitor.margin_called()], ["1.8.1"])
+        self.assertEqual(monitor.undercollateralized(), [])
+        position = monitor.at_risk(2.5)[1]
+        self.assertEqual(position["target_collateral_ratio"], 2.0)
+        self.assertEqual(float(position["debt"]), 1.0)
+        self.assertEqual(position["collateral"]["symbol"], "EUR")
+
+    def test_feed_change(self):
+        events = {"called": [], "under": [], "recovered": []}
+        monitor = self.monitor(
+            on_margin_call=events["called"].extend,
+            on_undercollateralized=events["under"].extend,
+            on_recovered=events["recovered"].extend,
+        )
+        # Unrelated objects and unchanged feeds are ignored
+        monitor.apply({"id": "2.4.20", "current_feed": price_feed(2.0)})
+        monitor.apply(bitasset_data(1.0))
+        self.assertEqual(events, {"called": [], "under": [], "recovered": []})
+
+        monitor.apply(bitasset_data(1.5))
+        self.assertEqual([p["id"] for p in events["called"]], ["1.8.2"])
+        self.assertEqual([p["id"] for p in events["under"]], ["1.8.1"])
+        self.assertEqual(list(monitor.ratio), [1.0, 2.0 / 1.5, 4.0 / 1.5])
+
+        monitor.apply(bitasset_data(0.5))
+        self.assertEqual(
+            sorted(p["id"] for p in events["recovered"]), ["1.8.1", "1.8.2"]
+        )
+
+    def test_call_updates(self):
+        monitor = self.monitor()
+        monitor.apply(call_order("1.8.4", 10000, 10000))
+        monitor.apply(call_order("1.8.1", 30000, 10000))
+        monitor.apply(call_order("1.8.3", 0, 0))
+        self.assertEqual(monitor.ids, ["1.8.1", "1.8.2", "1.8.4"])
+        self.assertEqual(list(monitor.ratio), [3.0, 2.0, 1.0])
+        self.assertEqual(list(monitor.status), [0, 0, 2])
+
+    def test_closed_call(self):
+        events = []
+        monitor = self.monitor(on_margin_call=events.extend)
+        monitor.apply(bitasset_data(1.5))
+        self.assertEqual(len(monitor.margin_called()), 2)
+        del events[:]
+
+        # Closed call orders are notified by their id only
+        monitor.apply("1.8.1")
+        monitor.apply("1.8.99")
+        self.assertEqual(monitor.ids, ["1.8.2", "1.8.3"])
+        self.assertEqual(list(monitor.ratio), [2.0 / 1.5, 4.0 / 1.5])
+        self.assertEqual([p["id"] for p in monitor.margin_called()], ["1.8.2"])
+
+        monitor.apply(bitasset_data(2.5))
+        self.assertEqual([p["id"] for p in events], ["1.8.3"])
@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+import unittest
+import mock
+from bitshares.account import Account
+from bitshares.asset import Asset
+from bitshares.dex import Dex
+from .fixtures import fixture_data, bitshares, bitasset_data, call_order
+
+
+class Testcases(unittest.TestCase):
+    def setUp(self):
+        fixture_data()
+
+    def test_list_debt_positions(self):
+        objects = {i: dict(Asset(i)) for i in ("1.3.120", "1.3.121")}
+        objects["2.4.21"] = bitasset_data(3)
+        # 1 BTS (1.3.120) = 0.25 USD (1.3.121)
+        tickers = {
+            ("1.3.121", "1.3.120"): {"latest": "0.25"},
+            ("1.3.120", "1.3.121"): {"latest": "4.0"},
+        }
+        account = dict(
+            Account("init0"), call_orders=[call_order("1.8.1", 50000, 10000)]
+        )
+        with mock.patch.multiple(
+            bitshares.rpc,
+            get_objects=mock.Mock(side_effect=lambda ids: [objects[i] for i in ids]),
+            get_ticker=mock.Mock(side_effect=lambda *pair: tickers[pair]),
+        ):
+            debts = Dex().list_debt_positions(account)
+            self.assertEqual(bitshares.rpc.get_objects.call_count, 2)
+            bitshares.rpc.get_ticker.assert_called_once_with("1.3.121", "1.3.120")
+
+        self.assertEqual(list(debts), ["USD"])
+        self.assertEqual(float(debts["USD"]["collateral"]), 5.0)
+        self.assertEqual(float(debts["USD"]["debt"]), 1.0)
+        self.assertAlmostEqual(float(debts["USD"]["call_price"]), 1.75 / 5.0)
+        # collateral / debt * USD per BTS
+        self.assertEqual(debts["USD"]["ratio"], 1.25)
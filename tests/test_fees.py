@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+import unittest
+import mock
+from datetime import datetime, timedelta
+from bitsharesbase import operations
+from bitshares.dex import Dex
+from bitshares.fees import FeeSchedule, is_cheap_name
+from bitshares.utils import formatTime
+from .fixtures import fixture_data, bitshares
+
+
+def objects(scale=10000, maintenance=None):
+    maintenance = maintenance or datetime.utcnow() + timedelta(hours=1)
+    return [
+        {
+            "id": "2.0.0",
+            "parameters": {
+                "current_fees": {
+                    "parameters": [
+                        [0, {"fee": 20000, "price_per_kbyte": 10240}],
+                        [1, {"fee": 500}],
+                        [
+                            5,
+                            {
+                                "basic_fee": 50000,
+                                "premium_fee": 2000000,
+                                "price_per_kbyte": 1024,
+                            },
+                        ],
+                    ],
+                    "scale": scale,
+                }
+            },
+        },
+        {"id": "2.1.0", "next_maintenance_time": formatTime(maintenance)},
+        {"id": "1.3.0", "symbol": "BTS", "precision": 5},
+    ]
+
+
+def transfer(memo=None):
+    return operations.Transfer(
+        **{
+            "fee": {"amount": 0, "asset_id": "1.3.0"},
+            "from": "1.2.100",
+            "to": "1.2.101",
+            "amount": {"amount": 1, "asset_id": "1.3.0"},
+            "memo": memo,
+        }
+    )
+
+
+class Testcases(unittest.TestCase):
+    def setUp(self):
+        fixture_data()
+        FeeSchedule.schedules.clear()
+
+    def test_cached(self):
+        with mock.patch.object(
+            bitshares.rpc, "get_objects", return_value=objects()
+        ) as rpc:
+            FeeSchedule()
+            fees = Dex().returnFees()
+            rpc.assert_called_once_with(["2.0.0", "2.1.0", "1.3.0"])
+        self.assertEqual(fees["transfer"], {"fee": 0.2, "price_per_kbyte": 0.1024})
+        self.assertEqual(fees["limit_order_create"], {"fee": 0.005})
+
+        # Reloaded after maintenance
+        passed = objects(maintenance=datetime.utcnow() - timedelta(seconds=1))
+        with mock.patch.object(
+            bitshares.rpc, "get_objects", return_value=passed
+        ) as rpc:
+            FeeSchedule().refresh()
+            FeeSchedule()
+            FeeSchedule()
+            self.assertEqual(rpc.call_count, 3)
+
+    def test_estimate(self):
+        with mock.patch.object(
+            bitshares.rpc, "get_objects", return_value=objects(scale=20000)
+        ):
+            schedule = FeeSchedule()
+        self.assertEqual(schedule.parameters("limit_order_create"), {"fee": 500})
+        self.assertEqual(schedule.core_fee(transfer()), 40000)
+        memo = {
+            "from": "BTS6MRyAjQq8ud7hVNYcfnVPJqcVpscN5So8BhtHuGYqET5GDW5CV",
+            "to": "BTS6MRyAjQq8ud7hVNYcfnVPJqcVpscN5So8BhtHuGYqET5GDW5CV",
+            "nonce": 1,
+            "message": "ff" * 100,
+        }
+        # 33 + 33 + 8 + 1 + 100 bytes of memo
+        self.assertEqual(schedule.core_fee(transfer(memo)), 40000 + 2 * 1750)
+        self.assertEqual(
+            schedule.estimate([0, transfer().json()]),
+            {"amount": 40000, "asset_id": "1.3.0"},
+        )
+        self.assertEqual(
+            FeeSchedule._convert(
+                40000,
+                "1.3.121",
+                {
+                    "base": {"amount": 3, "asset_id": "1.3.121"},
+                    "quote": {"amount": 100000, "asset_id": "1.3.0"},
+                },
+            ),
+            2,
+        )
+
+    def test_cheap_name(self):
+        self.assertTrue(is_cheap_name("init0"))
+        self.assertTrue(is_cheap_name("foo-bar"))
+        self.assertTrue(is_cheap_name("bcdfg"))
+        self.assertFalse(is_cheap_name("alice"))
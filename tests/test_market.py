@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+import unittest
+import mock
+from bitshares.asset import Asset
+from bitshares.market import Market, Markets
+from bitsharesbase.operationids import getOperationNameForId
+from .fixtures import fixture_data, bitshares, limit_order
+
+
+ticker = {
+    "base_volume": "10",
+    "quote_volume": "2",
+    "lowest_ask": "5.1",
+    "highest_bid": "4.9",
+    "latest": "5",
+    "percent_change": "1.5",
+}
+
+
+def bitasset(id, backing):
+    return {
+        "id": id,
+        "options": {"short_backing_asset": backing},
+        "current_feed": {
+            "settlement_price": {
+                "base": {"amount": 1, "asset_id": "1.3.121"},
+                "quote": {"amount": 300, "asset_id": "1.3.0"},
+            }
+        },
+    }
+
+
+class Testcases(unittest.TestCase):
+    def setUp(self):
+        fixture_data()
+
+    def test_tickers(self):
+        assets = {s: dict(Asset(s)) for s in ("EUR", "USD")}
+        bitassets = {
+            "2.4.20": bitasset("2.4.20", "1.3.0"),
+            "2.4.21": bitasset("2.4.21", "1.3.0"),
+        }
+        with mock.patch.multiple(
+            bitshares.rpc,
+            lookup_asset_symbols=mock.Mock(
+                side_effect=lambda symbols: [assets[s] for s in symbols]
+            ),
+            get_objects=mock.Mock(side_effect=lambda ids: [bitassets[i] for i in ids]),
+            get_object=mock.Mock(side_effect=lambda i: bitassets[i]),
+            get_ticker=mock.Mock(return_value=ticker),
+        ):
+            markets = Markets(["USD:EUR", "EUR:USD", "USD:EUR"])
+            bitshares.rpc.lookup_asset_symbols.assert_called_once_with(["EUR", "USD"])
+            self.assertIs(markets[0]["quote"], markets[1]["base"])
+
+            tickers = markets.tickers()
+            bitshares.rpc.get_objects.assert_called_once_with(["2.4.20", "2.4.21"])
+            self.assertEqual(bitshares.rpc.get_ticker.call_count, 2)
+            self.assertEqual(list(tickers), ["USD:EUR", "EUR:USD"])
+
+            single = Market("EUR:USD").ticker()
+            self.assertEqual(
+                {k: repr(v) for k, v in tickers["EUR:USD"].items()},
+                {k: repr(v) for k, v in single.items()},
+            )
+
+    def test_place_orders(self):
+        market = Market("USD:BTS")
+        orders = [("buy", 30 - i * 0.1, 10) for i in range(10)] + [
+            ("sell", 31 + i * 0.1, 5) for i in range(10)
+        ]
+        txs = market.place_orders(orders, account="init0")
+        self.assertEqual(len(txs), 1)
+        ops = txs[0]["operations"]
+        self.assertEqual(len(ops), 20)
+        self.assertEqual(getOperationNameForId(ops[0][0]), "limit_order_create")
+        self.assertEqual(
+            ops[0][1]["amount_to_sell"], {"amount": 30000000, "asset_id": "1.3.0"}
+        )
+        self.assertEqual(
+            ops[-1][1]["amount_to_sell"], {"amount": 50000, "asset_id": "1.3.121"}
+        )
+
+        # Split by the maximum transaction size
+        with mock.patch.object(
+            bitshares.rpc,
+            "get_global_properties",
+            return_value={"parameters": {"maximum_transaction_size": 1536}},
+        ):
+            txs = market.place_orders(orders, account="init0")
+        self.assertGreater(len(txs), 1)
+        self.assertEqual(sum(len(tx["operations"]) for tx in txs), 20)
+
+    def test_replace(self):
+        market = Market("USD:BTS")
+        tx = market.replace(["1.7.1", "1.7.2"], [("buy", 29, 10)], account="init0")
+        self.assertEqual(
+            [getOperationNameForId(op[0]) for op in tx["operations"]],
+            ["limit_order_cancel", "limit_order_cancel", "limit_order_create"],
+        )
+        self.assertEqual(tx["operations"][1][1]["order"], "1.7.2")
+
+        account = {"id": "1.2.100"}
+        ops = [
+            market._order_op("buy", 30, 10, account, 3600),
+            market._order_op("sell", 31, 5, account, 3600),
+            market._order_op("sell", 32, 5, account, 3600),
+        ]
+        cancel, ops = market._unchanged(
+            [
+                limit_order("1.7.1", 30000000, "1.3.0", 100000, "1.3.121", 30000000),
+                limit_order("1.7.2", 50000, "1.3.121", 15500000, "1.3.0", 50000),
+                # Partially filled
+                limit_order("1.7.3", 50000, "1.3.121", 16000000, "1.3.0", 20000),
+            ],
+            ops,
+        )
+        self.assertEqual(cancel, ["1.7.3"])
+        self.assertEqual(len(ops), 1)
+        self.assertEqual(ops[0].json()["min_to_receive"]["amount"], 16000000)
+
+    def test_trader(self):
+        market = Market("USD:BTS")
+        trader = market.trader("init0", expiration=3600)
+        for side, price, amount in [
+            ("buy", 29.95, 10.5),
+            ("sell", 0.1, 0.3),
+            ("buy", 31, 7),
+            ("sell", 1234.56789, 0.00005),
+        ]:
+            self.assertEqual(
+                trader.order_op(side, price, amount).json(),
+                market._order_op(side, price, amount, trader.account, 3600).json(),
+            )
+        # Rounded half to even
+        self.assertEqual(trader.amounts(0.5, 0.00005), (0, 0))
+        self.assertEqual(trader.amounts(0.5, 0.00015), (2, 10))
+
+        tx = trader.buy(30, 10)
+        self.assertEqual(
+            tx["operations"][0][1]["amount_to_sell"],
+            {"amount": 30000000, "asset_id": "1.3.0"},
+        )
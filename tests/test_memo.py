@@ -4,7 +4,17 @@ import os
 from pprint import pprint
 from itertools import cycle
 from bitsharesbase.account import BrainKey, Address, PublicKey, PrivateKey
-from bitsharesbase.memo import get_shared_secret, _pad, _unpad, encode_memo, decode_memo
+from bitsharesbase.memo import (
+    get_shared_secret,
+    get_shared_secrets,
+    clear_shared_secrets,
+    _pad,
+    _unpad,
+    encode_memo,
+    decode_memo,
+)
+from bitshares.memo import Memo
+from .fixtures import bitshares, wifs
 
 test_cases = [
     {
@@ -192,3 +202,31 @@ class Testcases(unittest.TestCase):
                 memo["message"],
             )
             self.assertEqual(memo["plain"], dec)
+
+    def test_shared_secrets_cached(self):
+        pairs = [
+            (PrivateKey(s[0]), PublicKey(s[1], prefix="GPH"))
+            for s in test_shared_secrets
+        ]
+        expected = [s[2] for s in test_shared_secrets]
+        self.assertEqual(get_shared_secrets(pairs + pairs), expected + expected)
+        clear_shared_secrets()
+        self.assertEqual(get_shared_secrets(pairs, max_workers=2), expected)
+
+    def test_decrypt_many(self):
+        sender, receiver = [PrivateKey(wif) for wif in wifs]
+        memos = [
+            {
+                "from": format(sender.pubkey, "BTS"),
+                "to": format(receiver.pubkey, "BTS"),
+                "nonce": str(nonce),
+                "message": encode_memo(sender, receiver.pubkey, nonce, text),
+            }
+            for nonce, text in enumerate(["foo", "bar", "foobar"])
+        ]
+        memo = Memo(blockchain_instance=bitshares)
+        self.assertEqual(
+            memo.decrypt_many(memos[:2] + [None] + memos[2:]),
+            ["foo", "bar", None, "foobar"],
+        )
+        self.assertEqual(memo.decrypt(memos[1]), "bar")
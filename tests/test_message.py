@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 import unittest
 import mock
-from bitshares.message import Message
+from bitshares.message import Message, InvalidMessageSignature
 from .fixtures import fixture_data, bitshares
 
 
@@ -43,3 +43,15 @@ class Testcases(unittest.TestCase):
             "-----END BITSHARES SIGNED MESSAGE-----",
             blockchain_instance=bitshares,
         ).verify()
+
+    def test_verify_many(self):
+        p = Message("message foobar", blockchain_instance=bitshares).sign(
+            account="init0"
+        )
+        results = Message.verify_many(
+            [p, p.replace("message foobar", "message barfoo"), "foobar"],
+            blockchain_instance=bitshares,
+        )
+        self.assertIs(results[0], True)
+        self.assertIsInstance(results[1], InvalidMessageSignature)
+        self.assertIsInstance(results[2], ValueError)
@@ -2,6 +2,8 @@
 import time
 import unittest
 from bitshares import BitShares, exceptions
+from bitshares.account import Account
+from bitshares.asset import Asset
 from bitshares.instance import set_shared_bitshares_instance
 from bitshares.blockchainobject import ObjectCache
 
@@ -31,3 +33,34 @@ class Testcases(unittest.TestCase):
 
         # Get
         self.assertEqual(cache.get("foo", "New"), "New")
+
+    def test_chain_scoped_cache(self):
+        Account.clear_cache()
+        Account.cache_object({"id": "1.2.999", "name": "cached"}, "1.2.999")
+        chain_id = Account.chain_id_of(self.bts)
+        self.assertIn("1.2.999", Account.chain_cache(chain_id))
+        # Offline instances do not see objects cached for other chains
+        self.assertNotIn("1.2.999", Account.chain_cache(None))
+
+        # Clearing one chain leaves the other chains untouched
+        Account.cache_object({"id": "1.2.998", "name": "offline"}, "1.2.998")
+        Account.chain_cache(None)["1.2.998"] = {"id": "1.2.998"}
+        self.bts.clear_cache()
+        self.assertNotIn("1.2.998", Account.chain_cache(chain_id))
+        self.assertIn("1.2.998", Account.chain_cache(None))
+
+    def test_clear_class_cache(self):
+        chain_id = Asset.chain_id_of(self.bts)
+        Asset.chain_cache(chain_id)["1.3.999"] = {"id": "1.3.999"}
+        Account.cache_object({"id": "1.2.999", "name": "cached"}, "1.2.999")
+
+        # Only the cache of the class is reset
+        Account.clear_cache()
+        self.assertNotIn("1.2.999", Account.chain_cache(chain_id))
+        self.assertIn("1.3.999", Asset.chain_cache(chain_id))
+
+        # The instance clears the caches of all classes
+        Account.cache_object({"id": "1.2.999", "name": "cached"}, "1.2.999")
+        self.bts.clear_cache()
+        self.assertNotIn("1.2.999", Account.chain_cache(chain_id))
+        self.assertNotIn("1.3.999", Asset.chain_cache(chain_id))
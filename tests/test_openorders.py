@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+import unittest
+import mock
+from bitshares.openorders import OpenOrders
+from bitshares.price import Order
+from .fixtures import fixture_data, bitshares, limit_order, limit_orders
+
+
+orders = limit_orders + [limit_order("1.7.4", 5, "1.3.120", 5, "1.3.0", 5)]
+
+
+def get_account_limit_orders(account, sell, buy, limit, *start):
+    return [
+        o
+        for o in orders
+        if o["sell_price"]["base"]["asset_id"] == sell
+        and o["sell_price"]["quote"]["asset_id"] == buy
+    ]
+
+
+class Testcases(unittest.TestCase):
+    def setUp(self):
+        fixture_data()
+
+    def test_seed_markets(self):
+        with mock.patch.object(
+            bitshares.rpc,
+            "get_account_limit_orders",
+            side_effect=get_account_limit_orders,
+        ) as rpc:
+            tracker = OpenOrders("init0", markets=["USD:BTS"])
+        self.assertEqual(rpc.call_count, 2)
+        self.assertEqual(len(tracker), 3)
+        self.assertNotIn("1.7.4", tracker)
+        self.assertEqual(tracker.ids("BTS:USD"), ["1.7.1", "1.7.2", "1.7.3"])
+
+    def test_seed_full_account(self):
+        with mock.patch.object(
+            bitshares.rpc,
+            "get_full_accounts",
+            return_value=[["init0", {"limit_orders": orders}]],
+        ):
+            tracker = OpenOrders("init0")
+        self.assertEqual(len(tracker), 4)
+        self.assertEqual(tracker.ids("EUR:BTS"), ["1.7.4"])
+
+    def test_apply(self):
+        with mock.patch.object(
+            bitshares.rpc,
+            "get_account_limit_orders",
+            side_effect=get_account_limit_orders,
+        ):
+            tracker = OpenOrders("init0", markets=["USD:BTS"])
+
+        tracker.apply("1.7.1")
+        self.assertNotIn("1.7.1", tracker)
+
+        tracker.apply(Order(limit_order("1.7.5", 100, "1.3.121", 3200000, "1.3.0", 7)))
+        self.assertIn("1.7.5", tracker)
+        self.assertEqual(tracker.raw("USD:BTS")[-1]["for_sale"], 7)
+
+        # Orders of other accounts and markets are ignored
+        tracker.apply(
+            limit_order("1.7.6", 100, "1.3.121", 3200000, "1.3.0", 7, seller="1.2.101")
+        )
+        tracker.apply(limit_order("1.7.7", 5, "1.3.120", 5, "1.3.0", 5))
+        self.assertEqual(len(tracker), 3)
+
+        # Partially filled and deleted
+        tracker.apply(limit_order("1.7.2", 2990000, "1.3.0", 100, "1.3.121", 1000))
+        self.assertEqual(int(tracker.orders("USD:BTS")[0]["for_sale"]), 1000)
+        tracker.apply({"id": "1.7.2", "deleted": True})
+        self.assertEqual(tracker.ids(), ["1.7.3", "1.7.5"])
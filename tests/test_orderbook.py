@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+import unittest
+import mock
+from bitshares.orderbook import LocalOrderBook
+from bitshares.price import Order
+from .fixtures import fixture_data, bitshares, limit_order, limit_orders
+
+
+orders = limit_orders + [
+    limit_order("1.7.4", 3000000, "1.3.0", 100, "1.3.121", 500000),
+]
+
+
+class Testcases(unittest.TestCase):
+    def setUp(self):
+        fixture_data()
+        with mock.patch.object(
+            bitshares.rpc, "get_limit_orders", return_value=orders
+        ) as seed:
+            self.book = LocalOrderBook("USD:BTS")
+        seed.assert_called_once_with("1.3.0", "1.3.121", 300)
+
+    def test_seed(self):
+        self.assertEqual(len(self.book), 4)
+        self.assertEqual(self.book.best_bid(), 3000)
+        self.assertEqual(self.book.best_ask(), 3100)
+        self.assertEqual(self.book.spread(), 100)
+        bids = self.book.levels("bids")
+        self.assertEqual(len(bids), 2)
+        self.assertIsInstance(bids[0], Order)
+        self.assertEqual(float(bids[0]["base"]), 15)
+        self.assertEqual(float(self.book.depth("bids")["base"]), 44.9)
+        self.assertEqual(float(self.book.depth("bids", 2995)["base"]), 15)
+
+    def test_apply(self):
+        self.book.apply("1.7.1")
+        self.book.apply("1.7.4")
+        self.assertEqual(self.book.best_bid(), 2990)
+        self.book.apply(limit_order("1.7.5", 100, "1.3.121", 3050000, "1.3.0", 10))
+        self.assertEqual(self.book.best_ask(), 3050)
+        self.assertEqual(self.book.sequence, 3)
+        self.assertEqual(self.book.resyncs, 1)
+
+    def test_depth(self):
+        def walked(side, price=None):
+            levels = list(side.walk(price))
+            return sum(lvl[1] for lvl in levels), sum(lvl[2] for lvl in levels)
+
+        bids = self.book.bids
+        # Orders at existing levels, then a new level and a removed one
+        self.book.apply(limit_order("1.7.2", 2990000, "1.3.0", 100, "1.3.121", 1000))
+        self.book.apply(limit_order("1.7.5", 3000000, "1.3.0", 100, "1.3.121", 9000))
+        self.assertEqual(bids.total(), walked(bids))
+        self.book.apply(limit_order("1.7.6", 2995000, "1.3.0", 100, "1.3.121", 700))
+        self.book.apply("1.7.2")
+        for price in [None, 2994, 2995, 2996, 3000]:
+            satoshis = self.book._satoshi_price(price) if price else None
+            self.assertEqual(bids.total(satoshis), walked(bids, satoshis))
+        self.assertEqual(float(self.book.depth("bids", 2995)["base"]), 15.097)
+
+    def test_resync_crossed(self):
+        with mock.patch.object(
+            bitshares.rpc, "get_limit_orders", return_value=orders
+        ) as seed:
+            self.book.apply(
+                limit_order("1.7.6", 3200000, "1.3.0", 100, "1.3.121", 1000)
+            )
+            seed.assert_called_once()
+        self.assertEqual(self.book.resyncs, 2)
+        self.assertEqual(self.book.best_bid(), 3000)
+
+    def test_fill_gap(self):
+        def fill(order_id, is_maker):
+            return {
+                "order_id": order_id,
+                "account_id": "1.2.100",
+                "pays": {"amount": 100, "asset_id": "1.3.121"},
+                "receives": {"amount": 3000000, "asset_id": "1.3.0"},
+                "is_maker": is_maker,
+            }
+
+        with mock.patch.object(
+            bitshares.rpc, "get_limit_orders", return_value=orders
+        ) as seed:
+            # The taker of a trade is not on the book
+            self.book.apply(fill("1.7.7", False))
+            self.book.apply(fill("1.7.1", True))
+            seed.assert_not_called()
+            # An unknown maker means we missed an update
+            self.book.apply(fill("1.7.8", True))
+            seed.assert_called_once()
+        self.assertEqual(self.book.resyncs, 2)
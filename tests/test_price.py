@@ -16,6 +16,7 @@ class Testcases(unittest.TestCase):
         Price(1.0, "USD/GOLD")
         Price(0.315, base="USD", quote="BTS")
         Price(0.315, base=Asset("USD"), quote=Asset("BTS"))
+        Price(0.315, base=Asset("USD").info, quote=Asset("BTS").info)
         Price(
             {
                 "base": {"amount": 1, "asset_id": "1.3.0"},
@@ -73,3 +74,12 @@ class Testcases(unittest.TestCase):
         p3 = p1 / p2
         self.assertTrue(isinstance(p3, (float, int)))
         self.assertEqual(float(p3), 2.0)
+
+    def test_compact(self):
+        p1 = Price(10.0, "USD/GOLD").compact()
+        self.assertIs(p1["base"]["asset"], Asset("USD").info)
+        self.assertIs(p1["quote"]["asset"], Asset("GOLD").info)
+        self.assertEqual(float(p1), 10.0)
+        p2 = p1.as_base("GOLD")
+        self.assertEqual(float(p2), 0.1)
+        self.assertEqual(p2["base"]["symbol"], "GOLD")
@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+import unittest
+
+from bitsharesbase import serializer
+from bitsharesbase.objects import Operation
+from bitsharesbase.signedtransactions import Signed_Transaction
+
+
+fee = {"amount": 0, "asset_id": "1.3.0"}
+amount = {"amount": 1000, "asset_id": "1.3.121"}
+
+
+class Testcases(unittest.TestCase):
+    def compare(self, op):
+        data = serializer.serialize_operation(op)
+        self.assertEqual(data, bytes(Operation(op)))
+        self.assertEqual(serializer.deserialize_operation(data), Operation(op).json())
+
+    def test_worker_create(self):
+        for initializer in [[0, {}], [1, {"pay_vesting_period_days": 7}]]:
+            self.compare(
+                [
+                    "worker_create",
+                    {
+                        "fee": fee,
+                        "owner": "1.2.100",
+                        "work_begin_date": "2021-01-01T00:00:00",
+                        "work_end_date": "2022-01-01T00:00:00",
+                        "daily_pay": 1000000,
+                        "name": "Worker\ttab",
+                        "url": "https://bitshares.org",
+                        "initializer": initializer,
+                    },
+                ]
+            )
+
+    def test_tickets(self):
+        self.compare(
+            [
+                57,
+                {
+                    "fee": fee,
+                    "account": "1.2.100",
+                    "target_type": "lock_180_days",
+                    "amount": amount,
+                    "extensions": [],
+                },
+            ]
+        )
+        for amount_for_new_target in [None, amount]:
+            self.compare(
+                [
+                    "ticket_update_operation",
+                    {
+                        "fee": fee,
+                        "ticket": "1.18.5",
+                        "account": "1.2.100",
+                        "target_type": 2,
+                        "amount_for_new_target": amount_for_new_target,
+                        "extensions": [],
+                    },
+                ]
+            )
+
+    def test_liquidity_pool(self):
+        self.compare(
+            [
+                "liquidity_pool_create",
+                {
+                    "fee": fee,
+                    "account": "1.2.100",
+                    "asset_a": "1.3.0",
+                    "asset_b": "1.3.121",
+                    "share_asset": "1.3.5000",
+                    "taker_fee_percent": 30,
+                    "withdrawal_fee_percent": 0,
+                    "extensions": [],
+                },
+            ]
+        )
+        self.compare(
+            [
+                "liquidity_pool_exchange",
+                {
+                    "fee": fee,
+                    "account": "1.2.100",
+                    "pool": "1.19.1",
+                    "amount_to_sell": amount,
+                    "min_to_receive": {"amount": 10 ** 12, "asset_id": "1.3.0"},
+                    "extensions": [],
+                },
+            ]
+        )
+
+    def test_object_type(self):
+        with self.assertRaises(ValueError):
+            serializer.serialize_operation(
+                [
+                    "limit_order_cancel",
+                    {"fee": fee, "fee_paying_account": "1.3.0", "order": "1.7.1"},
+                ]
+            )
+
+    def test_transaction_from_bytes(self):
+        tx = Signed_Transaction(
+            ref_block_num=34294,
+            ref_block_prefix=3707022213,
+            expiration="2016-04-06T08:29:27",
+            operations=[
+                Operation(
+                    [
+                        "asset_reserve",
+                        {
+                            "fee": fee,
+                            "payer": "1.2.100",
+                            "amount_to_reserve": amount,
+                            "extensions": [],
+                        },
+                    ]
+                )
+            ],
+            signatures=["1f" + "00" * 64],
+        )
+        data = bytes(tx)
+        self.assertEqual(bytes(Signed_Transaction.from_bytes(data)), data)
+        unsigned = tx.json()
+        unsigned.pop("signatures")
+        self.assertEqual(
+            serializer.deserialize_transaction(memoryview(data)[:-66], False),
+            unsigned,
+        )
+        with self.assertRaises(ValueError):
+            serializer.deserialize_transaction(data + b"\x00")
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+import unittest
+import mock
+from bitshares.asset import Asset
+from .fixtures import fixture_data, bitshares, bitasset_data, call_orders
+
+
+bitasset = bitasset_data(
+    1.0, maximum_force_settlement_volume=20, force_settlement_offset_percent=100
+)
+dynamic = {"id": "2.3.121", "current_supply": 1000000}
+
+
+def ask(id, usd, eur):
+    return {
+        "id": id,
+        "seller": "1.2.101",
+        "for_sale": usd,
+        "sell_price": {
+            "base": {"amount": usd, "asset_id": "1.3.121"},
+            "quote": {"amount": eur, "asset_id": "1.3.120"},
+        },
+    }
+
+
+class Testcases(unittest.TestCase):
+    def setUp(self):
+        fixture_data()
+
+    def test_simulate_settlement(self):
+        with mock.patch.multiple(
+            bitshares.rpc,
+            get_objects=mock.Mock(return_value=[bitasset, dynamic]),
+            get_call_orders=mock.Mock(return_value=call_orders),
+            get_settle_orders=mock.Mock(
+                return_value=[{"id": "1.4.1", "balance": {"amount": 5000}}]
+            ),
+            get_limit_orders=mock.Mock(
+                return_value=[ask("1.7.1", 10000, 10500), ask("1.7.2", 20000, 24000)]
+            ),
+        ):
+            result = Asset("USD").simulate_settlement([1.0, 1.2, 1.4])
+
+        self.assertEqual(list(result["margin_called"]), [1, 2, 2])
+        self.assertAlmostEqual(result["debt_to_cover"][0], 1.0)
+        self.assertAlmostEqual(result["collateral_sold"][0], 1.05)
+        # Second position only covers enough debt to reach its target ratio
+        partial = 0.4 / 1.08
+        self.assertAlmostEqual(result["debt_to_cover"][1], 1 + partial)
+        self.assertAlmostEqual(result["debt_filled"][1], 1 + partial)
+        self.assertAlmostEqual(result["collateral_sold"][1], 1.05 + partial * 1.2)
+        self.assertEqual(list(result["global_settlement"]), [False, False, True])
+        self.assertEqual(list(result["unfilled_debt"][:2]), [0, 0])
+        self.assertAlmostEqual(result["settled_debt"][0], 0.2)
+        self.assertAlmostEqual(result["settled_collateral"][1], 0.2 * 1.2 * 0.99)
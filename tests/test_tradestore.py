@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+import shutil
+import tempfile
+import unittest
+import mock
+from datetime import datetime, timedelta
+from bitshares.market import Market
+from bitshares.tradestore import SqliteTradeStore
+from bitshares.utils import formatTime
+from .fixtures import fixture_data, bitshares
+
+
+def trade(sequence, date):
+    return {
+        "sequence": sequence,
+        "date": formatTime(date),
+        "price": "0.5",
+        "amount": "2.0",
+        "value": "1.0",
+        "type": "buy",
+        "side1_account_id": "1.2.100",
+        "side2_account_id": "1.2.101",
+    }
+
+
+class Testcases(unittest.TestCase):
+    def setUp(self):
+        fixture_data()
+        self.market = Market("USD:BTS")
+        self.data_dir = tempfile.mkdtemp()
+        self.store = SqliteTradeStore(data_dir=self.data_dir)
+        self.now = datetime.utcnow().replace(microsecond=0)
+        self.trades = [
+            trade(i, self.now - timedelta(minutes=60 - 10 * i))
+            for i in range(5, 0, -1)
+        ]
+
+    def history(self, trades):
+        return mock.patch.multiple(
+            bitshares.rpc,
+            get_trade_history=mock.Mock(return_value=trades),
+            get_trade_history_by_sequence=mock.Mock(return_value=trades[-1:]),
+        )
+
+    def tearDown(self):
+        self.store.close()
+        shutil.rmtree(self.data_dir)
+
+    def test_sync(self):
+        with self.history(self.trades):
+            self.assertEqual(self.store.sync(self.market), 5)
+            self.assertEqual(len(self.store), 5)
+            # Nothing new
+            self.assertEqual(self.store.sync(self.market), 0)
+
+        new = [trade(6, self.now)] + self.trades
+        with self.history(new):
+            self.assertEqual(self.store.sync(self.market), 1)
+        self.assertEqual(len(self.store), 6)
+
+    def test_trades_from_store(self):
+        with self.history(self.trades):
+            self.store.sync(self.market)
+        start = self.now - timedelta(minutes=25)
+        self.assertTrue(self.store.covers(self.market, start, self.now))
+        self.assertFalse(
+            self.store.covers(self.market, self.now - timedelta(days=2), self.now)
+        )
+
+        rows = self.store.trades(self.market, start, self.now)
+        self.assertEqual([r["sequence"] for r in rows], [5, 4])
+        self.assertEqual(rows[0], self.trades[0])
+
+        with mock.patch.object(bitshares.rpc, "get_trade_history") as rpc:
+            trades = list(
+                self.market.trades(
+                    limit=2, start=start, stop=self.now, store=self.store
+                )
+            )
+        rpc.assert_not_called()
+        self.assertEqual(len(trades), 2)
+        self.assertEqual(float(trades[0]["quote"]), 2.0)
+
+    def test_trade_pages(self):
+        trades = [trade(i, self.now) for i in range(300, 0, -1)]
+
+        def by_sequence(base, quote, sequence, start, limit):
+            self.assertLessEqual(limit, 100)
+            return [t for t in trades if t["sequence"] <= sequence][:limit]
+
+        with mock.patch.multiple(
+            bitshares.rpc,
+            get_trade_history=mock.Mock(
+                side_effect=lambda base, quote, stop, start, limit: trades[:limit]
+            ),
+            get_trade_history_by_sequence=mock.Mock(side_effect=by_sequence),
+        ):
+            for limit in [1, 100, 101, 200, 250]:
+                rows = list(self.market.trades(limit=limit, raw=True))
+                self.assertEqual(
+                    [r["sequence"] for r in rows], list(range(300, 300 - limit, -1))
+                )
+
+    def test_persistence(self):
+        with self.history(self.trades):
+            self.store.sync(self.market)
+        store = SqliteTradeStore(data_dir=self.data_dir)
+        self.assertEqual(len(store), 5)
+        self.assertEqual(store.coverage(self.market), self.store.coverage(self.market))
+        store.close()
@@ -7,6 +7,7 @@ from binascii import hexlify
 
 from bitshares import BitShares
 from bitsharesbase import transactions, memo, account, operations, objects
+from bitsharesbase import serializer
 from bitsharesbase.objects import Operation
 from bitsharesbase.signedtransactions import Signed_Transaction
 from bitsharesbase.account import PrivateKey
@@ -38,6 +39,10 @@ class Testcases(unittest.TestCase):
         tx.verify([PrivateKey(wif).pubkey], prefix)
         txWire = hexlify(bytes(tx)).decode("ascii")
 
+        # Compare the compiled serializer with the objects
+        self.assertEqual(serializer.serialize_transaction(tx.json()), bytes(tx))
+        self.assertEqual(serializer.deserialize_transaction(bytes(tx)), tx.json())
+
         if printWire:
             print()
             print(txWire)
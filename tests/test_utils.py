@@ -1,7 +1,22 @@
 # -*- coding: utf-8 -*-
-from bitshares.utils import assets_from_string
+import pytest
+
+from bitshares.utils import assets_from_string, read_ahead
 
 
 def test_assets_from_string():
     assert assets_from_string("USD:BTS") == ["USD", "BTS"]
     assert assets_from_string("BTSBOTS.S1:BTS") == ["BTSBOTS.S1", "BTS"]
+
+
+def test_read_ahead():
+    assert list(read_ahead(iter(range(10)), 3)) == list(range(10))
+
+    def failing():
+        yield 1
+        raise ValueError("page")
+
+    pages = read_ahead(failing())
+    assert next(pages) == 1
+    with pytest.raises(ValueError):
+        next(pages)
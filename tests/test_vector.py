@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+import unittest
+from bitshares.amount import Amount
+from bitshares.asset import Asset
+from bitshares.exceptions import InvalidAssetException
+from bitshares.price import Price
+from bitshares.vector import AmountArray, PriceArray
+from .fixtures import fixture_data, bitshares, limit_order
+
+
+class Testcases(unittest.TestCase):
+    def setUp(self):
+        fixture_data()
+        self.base = Asset("BTS")
+        self.quote = Asset("USD")
+
+    def test_amount_array(self):
+        a = AmountArray(self.quote, [10000, 25000])
+        b = AmountArray.from_decimals(self.quote, ["1.5", "0.25"])
+        self.assertEqual(list((a + b).decimals), [2.5, 2.75])
+        self.assertEqual(list((a * 1.5).values), [15000, 37500])
+        self.assertEqual(list((a - Amount("0.5 USD")).values), [5000, 20000])
+        self.assertEqual(float(a.sum()), 3.5)
+        self.assertEqual(a[1], Amount("2.5 USD"))
+        self.assertEqual(len(a[a > Amount("1.5 USD")]), 1)
+        self.assertEqual(
+            list(AmountArray.from_amounts([Amount("1 USD"), Amount("2 USD")]).values),
+            [10000, 20000],
+        )
+        with self.assertRaises(InvalidAssetException):
+            a + AmountArray(self.base, [1, 2])
+
+    def test_order_book(self):
+        book = PriceArray.from_order_book(
+            {
+                "bids": [
+                    {"price": "300", "base": "3000", "quote": "10"},
+                    {"price": "299", "base": "299", "quote": "1"},
+                ],
+                "asks": [{"price": "301", "base": "301", "quote": "1"}],
+            },
+            self.base,
+            self.quote,
+        )
+        self.assertEqual(list(book["bids"].price), [300, 299])
+        self.assertEqual(list(book["bids"].quote.cumsum().decimals), [10, 11])
+        asks = book["asks"].as_base("USD")
+        self.assertEqual(asks.symbols(), ("USD", "BTS"))
+        self.assertAlmostEqual(asks.price[0], 1 / 301)
+        self.assertIsInstance(book["bids"][0], Price)
+        self.assertEqual(list((book["bids"] * 1.1).price), [330, 328.9])
+
+    def test_limit_orders(self):
+        orders = PriceArray.from_limit_orders(
+            [
+                limit_order("1.7.1", 3000000, "1.3.0", 100, "1.3.121", 1000000),
+                limit_order("1.7.3", 100, "1.3.121", 3100000, "1.3.0", 500),
+            ],
+            self.base,
+            self.quote,
+        )
+        self.assertEqual(list(orders["bids"].base.values), [1000000])
+        self.assertEqual(list(orders["bids"].quote.values), [33])
+        self.assertEqual(list(orders["asks"].quote.values), [500])
+        self.assertEqual(list(orders["asks"].base.values), [15500000])
+
+    def test_trade_history(self):
+        trades = PriceArray.from_trade_history(
+            [
+                {"amount": "2", "value": "600", "price": "300"},
+                {"amount": "1", "value": "310", "price": "310"},
+            ],
+            self.base,
+            self.quote,
+        )
+        self.assertEqual(list(trades.price), [300, 310])
+        bought = AmountArray(self.quote, [10000, 20000]) * trades
+        self.assertEqual(bought.symbol, "BTS")
+        self.assertEqual(list(bought.decimals), [300, 620])
+        self.assertEqual(list((bought / trades).values), [10000, 20000])
+        self.assertEqual(list(trades.copy().invert().invert().price), [300, 310])